@@ -0,0 +1,66 @@
+"""
+KariyerAI - Profil Analizi Belleği
+Profil analizlerini, analizi etkileyen alanların içerik özetine göre saklar;
+bu alanlar değişmedikçe analiz yeniden hesaplanmaz.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable
+
+# Analiz sonucunu etkileyen profil alanları
+ANALYSIS_FIELDS = (
+    "current_title",
+    "skills",
+    "experiences",
+    "degree",
+    "experience_level",
+    "personality_assessment",
+)
+
+
+def profile_fingerprint(profile: Dict[str, Any], fields: Iterable[str], version: str) -> str:
+    """Analizle ilgili alanlar ve analiz sürümünden içerik özeti üret"""
+    material = json.dumps(
+        {"version": version, "fields": {field: profile.get(field) for field in fields}},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AnalysisMemo:
+    """Analiz fonksiyonunu profil içerik özetiyle önbelleğe alan LRU sarmalayıcı
+
+    version, analiz mantığı değiştiğinde eski sonuçların kullanılmaması
+    için artırılır. Aynı analiz nesnesi çağıranlar arasında paylaşılır;
+    sonuç salt okunur kullanılmalıdır.
+    """
+
+    def __init__(self, analyze_fn: Callable[[Dict[str, Any]], Any], version: str,
+                 fields: Iterable[str] = ANALYSIS_FIELDS, max_entries: int = 1024):
+        self.analyze_fn = analyze_fn
+        self.version = version
+        self.fields = tuple(fields)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # fingerprint -> analysis
+        self._lock = threading.Lock()
+
+    def get(self, profile: Dict[str, Any]) -> Any:
+        """Profilin analizini döndür; ilgili alanlar değişmediyse önbellekten"""
+        key = profile_fingerprint(profile, self.fields, self.version)
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is not None:
+                self._entries.move_to_end(key)
+                return analysis
+
+        analysis = self.analyze_fn(profile)
+        with self._lock:
+            self._entries[key] = analysis
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return analysis
@@ -0,0 +1,108 @@
+"""
+KariyerAI - Toplu Profil Analizi
+Supabase profiles JSONL dışa aktarımını okuyup her profilin analizini
+JSONL olarak yazar; istenirse analizleri Supabase tablosuna toplu upsert
+ile geri yazar.
+
+Kullanım:
+    python analyze_profiles.py profiles.jsonl -o analyses.jsonl [--workers 8]
+    python analyze_profiles.py profiles.jsonl -o - --supabase-table profile_analyses
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List
+
+from personalization_engine import PersonalizationEngine
+from supabase_client import SupabaseClient, SupabaseError
+
+# Supabase'e tek upsert isteğinde gönderilecek analiz sayısı
+UPSERT_BATCH_SIZE = 500
+
+
+def read_profiles(stream):
+    """JSONL akışındaki boş olmayan her satırı profil olarak döndür"""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def batched(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def upsert_analyses(supabase: SupabaseClient, table: str, rows: List[Dict[str, Any]]) -> None:
+    """Analiz satırlarını (profile_id, analysis) tek istekte upsert et"""
+    response = supabase.table(table).upsert(
+        [{"profile_id": row["id"], "analysis": row["analysis"]} for row in rows],
+        on_conflict="profile_id",
+        returning=False,
+    )
+    if response.status_code not in (200, 201, 204):
+        raise SupabaseError(f"Analizler yazılamadı: {response.status_code}", response.status_code, response.text)
+
+
+def main(argv=None, supabase: SupabaseClient = None):
+    parser = argparse.ArgumentParser(description="Profilleri toplu analiz et")
+    parser.add_argument("input", help="Profil JSONL dosyası ('-' ise stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Analiz JSONL dosyası ('-' ise stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--supabase-table", default=None,
+                        help="Analizlerin upsert edileceği tablo (profile_id benzersiz, analysis jsonb)")
+    parser.add_argument("--batch-size", type=int, default=UPSERT_BATCH_SIZE, help="Upsert isteği başına satır")
+    args = parser.parse_args(argv)
+
+    if args.supabase_table and supabase is None:
+        from dotenv import load_dotenv
+        load_dotenv()
+        supabase = SupabaseClient(os.getenv("SUPABASE_API_URL"), os.getenv("SUPABASE_API_KEY"))
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    engine = PersonalizationEngine()
+    profile_ids = deque()
+
+    def track(stream):
+        # Sonuçlar giriş sırasında geldiği için yalnızca bekleyen id'ler tutulur
+        for profile in stream:
+            profile_ids.append(profile.get("id"))
+            yield profile
+
+    def results():
+        for analysis in engine.analyze_profiles_batch(track(read_profiles(source)), workers=args.workers):
+            row = {"id": profile_ids.popleft(), "analysis": analysis}
+            target.write(json.dumps(row, ensure_ascii=False) + "\n")
+            yield row
+
+    count = 0
+    try:
+        if args.supabase_table:
+            for batch in batched(results(), args.batch_size):
+                upsert_analyses(supabase, args.supabase_table, [row for row in batch if row["id"] is not None])
+                count += len(batch)
+        else:
+            for _ in results():
+                count += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    destination = f" ve {args.supabase_table} tablosuna yazıldı" if args.supabase_table else ""
+    print(f"✅ {count} profil analiz edildi{destination}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
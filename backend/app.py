@@ -1,12 +1,25 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import os
-import requests
 import json
-from dotenv import load_dotenv
-from bs4 import BeautifulSoup
 import time
+from dotenv import load_dotenv
 import traceback
+from llm_client import GeminiClient, GeminiError
+from llm_cache import LLMResponseCache
+from llm_json import IncrementalJSONParser
+from llm_schemas import RESPONSE_SCHEMAS, SchemaValidationError, parse_response, structured_config, validate
+from job_scraper import JobPageScraper, PageCache
+from job_store import JobStore, JobRefresher
+from job_search import SerpJobSearch
+from skill_matcher import build_skill_weights, score_jobs
+from supabase_client import SupabaseClient, SupabaseError
+from profile_cache import ProfileCache
+from analysis_memo import AnalysisMemo, ANALYSIS_FIELDS
+from personalization_engine import PersonalizationEngine
+from personalization_api import add_personalization_routes
+from scenario_pool import ScenarioPool, scenario_bucket, personalize_scenario
+from task_prefetch import TaskPrefetcher
 
 
 load_dotenv()
@@ -37,6 +50,45 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_API_URL = os.getenv("GEMINI_API_URL", 'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent')
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "512"))
+LLM_CACHE_DB = os.getenv("LLM_CACHE_DB")  # örn. "llm_cache.sqlite3"; boşsa sadece bellek
+
+# Önbelleğe alınabilen çağrıların saklanma süreleri (saniye)
+CV_ANALYSIS_CACHE_TTL = 24 * 3600
+INDUSTRY_INSIGHTS_CACHE_TTL = 12 * 3600
+LEARNING_MODULE_CACHE_TTL = 7 * 24 * 3600
+
+supabase = SupabaseClient(SUPABASE_API_URL, SUPABASE_API_KEY)
+
+PROFILE_CACHE_TTL = int(os.getenv("PROFILE_CACHE_TTL", "60"))
+# Bölüm/seviye/sektör grubu başına hazır tutulan kariyer simülasyonu senaryosu
+SCENARIO_POOL_SIZE = int(os.getenv("SCENARIO_POOL_SIZE", "3"))
+# Boş grupta şablona düşmeden önce havuzun ilk senaryosunu bekleme süresi (saniye)
+COLD_SCENARIO_WAIT = float(os.getenv("COLD_SCENARIO_WAIT", "20"))
+# Bölüme uyan senaryo için üretim + düzeltici yeniden üretimin toplam süresi (saniye)
+CAREER_SIMULATION_BUDGET = float(os.getenv("CAREER_SIMULATION_BUDGET", "40"))
+# Akışta reddedilen senaryonun tek düzeltici yeniden üretimine ayrılan süre (saniye)
+CORRECTIVE_SCENARIO_BUDGET = float(os.getenv("CORRECTIVE_SCENARIO_BUDGET", "20"))
+# İlk üretim + bir düzeltici yeniden üretim
+MAX_SCENARIO_ATTEMPTS = 2
+# Senaryo üretilince arka planda hazırlanacak görev simülasyonları
+TASK_PREFETCH_WORKERS = int(os.getenv("TASK_PREFETCH_WORKERS", "4"))
+TASK_PREFETCH_LIMIT = 8
+profile_cache = ProfileCache(supabase, ttl=PROFILE_CACHE_TTL)
+
+llm_cache = LLMResponseCache(max_entries=LLM_CACHE_SIZE, db_path=LLM_CACHE_DB)
+gemini_client = GeminiClient(GEMINI_API_URL, GEMINI_API_KEY, cache=llm_cache)
+
+PAGE_CACHE_TTL = int(os.getenv("PAGE_CACHE_TTL", str(6 * 3600)))
+job_page_scraper = JobPageScraper(cache=PageCache(ttl=PAGE_CACHE_TTL))
+
+JOB_STORE_DB = os.getenv("JOB_STORE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_store.sqlite3"))
+job_store = JobStore(JOB_STORE_DB)
+
+SERP_CACHE_TTL = int(os.getenv("SERP_CACHE_TTL", str(3 * 3600)))
+SERP_CACHE_DB = os.getenv("SERP_CACHE_DB")  # örn. "serp_cache.sqlite3"; boşsa sadece bellek
+serp_job_search = SerpJobSearch(SERPAPI_KEY, cache_ttl=SERP_CACHE_TTL, db_path=SERP_CACHE_DB)
+
 
 @app.route('/')
 def home():
@@ -62,19 +114,9 @@ def save_profile():
             print("❌ [save-profile] Missing required fields")
             return jsonify({"success": False, "message": "Required fields missing: firstName, lastName, email"}), 400
 
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json",
-            "Prefer": "return=representation"
-        }
-
         # Check if user already exists by email
         print(f"📌 [save-profile] Checking if user exists with email: {email}")
-        check_response = requests.get(
-            f"{SUPABASE_API_URL}/rest/v1/profiles?email=eq.{email}",
-            headers=headers
-        )
+        check_response = supabase.table("profiles").eq("email", email).get()
         
         print(f"📌 [save-profile] Existing user check status: {check_response.status_code}")
         print(f"📌 [save-profile] Existing user response: {check_response.text}")
@@ -99,14 +141,6 @@ def save_profile():
             "gpa": profile_data_raw.get("gpa"),
         }
 
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json",
-            "Prefer": "return=representation"
-
-        }
-        
         print(f"📌 [save-profile] Raw skills from frontend: {profile_data_raw.get('skills')}")
         print(f"📌 [save-profile] Raw experiences from frontend: {profile_data_raw.get('experiences')}")
         print(f"📌 [save-profile] Processed skills: {profile_data['skills']}")
@@ -119,11 +153,7 @@ def save_profile():
             user_id = existing_users[0]["id"]
             print(f"📌 [save-profile] Updating existing user: {user_id}")
             
-            response = requests.patch(
-                f"{SUPABASE_API_URL}/rest/v1/profiles?id=eq.{user_id}",
-                headers=headers,
-                json=profile_data
-            )
+            response = supabase.table("profiles").eq("id", user_id).update(profile_data)
             print(f"📌 [save-profile] Update response status: {response.status_code}")
             print(f"📌 [save-profile] Update response: {response.text}")
             
@@ -134,14 +164,11 @@ def save_profile():
             # Get updated data
             user_data = existing_users[0]
             user_data.update(profile_data)
+            profile_cache.invalidate(user_id=user_id, email=email)
         else:
             # Create new user
             print("📌 [save-profile] Creating new user")
-            response = requests.post(
-                f"{SUPABASE_API_URL}/rest/v1/profiles",
-                headers=headers,
-                json=profile_data
-            )
+            response = supabase.table("profiles").insert(profile_data)
             print(f"📌 [save-profile] Create response status: {response.status_code}")
             print(f"📌 [save-profile] Create response: {response.text}")
             
@@ -151,32 +178,28 @@ def save_profile():
                 
             user_data = response.json()[0] if isinstance(response.json(), list) else response.json()
             user_id = user_data["id"]
+            profile_cache.invalidate(user_id=user_id, email=email)
 
         # Process skills and experiences
-        skills = profile_data_raw.get("skills", [])
-        skills_processed = 0
+        skills = list(dict.fromkeys(skill for skill in profile_data_raw.get("skills", []) if skill))
         experiences_processed = len(profile_data_raw.get("experiences", []))
-        
-        for skill in skills:
-            skill_payload = {
-                "user_id": user_id,
-                "skill": skill,
-                "level": 50
-            }
-            skill_response = requests.post(
-                f"{SUPABASE_API_URL}/rest/v1/skill_levels",
-                headers=headers,
-                json=skill_payload
-            )
-            if skill_response.status_code in [200, 201]:
-                skills_processed += 1
+        skills_status = save_initial_skill_levels(user_id, skills)
+        skills_processed = sum(1 for row in skills_status if row["status"] != "failed")
         print("📌 Yeni kullanıcı JSON:", user_data)
 
+        # Okuma yollarında hazır olması için analizi (tüm alanlarıyla) kayıt anında hesapla;
+        # profil zaten kaydedildiği için analiz hatası yanıtı etkilemez
+        try:
+            user_analysis_memo.get(user_data).to_dict()
+        except Exception as e:
+            print("⚠️ Profil analizi önceden hesaplanamadı:", e)
+
         return jsonify({
             "success": True,
             "message": "Profil başarıyla güncellendi",
             "user_id": user_id,
             "skills_processed": skills_processed,
+            "skills_status": skills_status,
             "experiences_processed": experiences_processed,
             "data": [user_data]
         
@@ -191,52 +214,54 @@ def save_profile():
             "message": f"Server hatası: {str(e)}"
         }), 500
 
+def save_initial_skill_levels(user_id, skills):
+    """Profil becerilerini tek toplu istekle skill_levels'a yaz, beceri bazında durum döndür
+
+    Zaten seviyesi olan beceriler korunur (ignore-duplicates); durum
+    "created", "existing" ya da "failed" olur.
+    """
+    if not skills:
+        return []
+    rows = [{"user_id": user_id, "skill": skill, "level": 50} for skill in skills]
+    response = supabase.table("skill_levels").upsert(rows, on_conflict="user_id,skill", ignore_duplicates=True)
+    if response.status_code not in [200, 201]:
+        print(f"❌ [save-profile] Skill levels bulk insert failed: {response.text}")
+        return [{"skill": skill, "status": "failed"} for skill in skills]
+
+    created = {row.get("skill") for row in response.json()}
+    return [{"skill": skill, "status": "created" if skill in created else "existing"} for skill in skills]
+
 # Take user identifier (ID or email) and fetch profile from Supabase
 @app.route("/get-profile/<identifier>", methods=["GET"]) 
 def get_profile(identifier):
     """Kullanıcı profilini Supabase'den çek (ID veya email ile)"""
     try:
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-        
         # Check if it's an email or ID
         by_param = request.args.get('by', 'id')  
+            
+        print(f"📌 [get-profile] Fetching profile with {by_param}={identifier}")
         
         if by_param == 'email':
-            query_param = f"email=eq.{identifier}"
+            profile = profile_cache.by_email(identifier)
         else:
-            query_param = f"id=eq.{identifier}"
-            
-        print(f"📌 [get-profile] Fetching profile with {query_param}")
+            profile = profile_cache.by_id(identifier)
         
-        response = requests.get(
-            f"{SUPABASE_API_URL}/rest/v1/profiles?{query_param}",
-            headers=headers
-        )
-        
-        print(f"📌 [get-profile] Response status: {response.status_code}")
-        print(f"📌 [get-profile] Response: {response.text}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data:
-                return jsonify({
-                    "success": True,
-                    "data": data[0]
-                })
-            else:
-                return jsonify({
-                    "success": False,
-                    "message": "Profile not found"
-                }), 404
-        else:
+        if profile:
             return jsonify({
-                "success": False,
-                "message": f"Profil bulunamadı: {response.text}"
-            }), 404
+                "success": True,
+                "data": profile
+            })
+        return jsonify({
+            "success": False,
+            "message": "Profile not found"
+        }), 404
             
+    except SupabaseError as e:
+        print(f"❌ [get-profile] Supabase error: {e.body}")
+        return jsonify({
+            "success": False,
+            "message": f"Profil bulunamadı: {e.body}"
+        }), 404
     except Exception as e:
         return jsonify({
             "success": False,
@@ -254,25 +279,15 @@ def login():
         if not email:
             return jsonify({"success": False, "message": "E-posta gerekli"}), 400
 
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-
-        from urllib.parse import quote
-        encoded_email = quote(email)
-        url = f"{SUPABASE_API_URL}/rest/v1/profiles?email=ilike.{encoded_email}"
-
-        resp = requests.get(url, headers=headers)
-        print("📌 Supabase URL:", url)
-        print("📌 Supabase response:", resp.status_code, resp.text)
+        try:
+            profile = profile_cache.by_email_insensitive(email)
+        except SupabaseError as e:
+            print("❌ Supabase response:", e.status_code, e.body)
+            return jsonify({"success": False, "message": "Supabase hatası"}), 400
 
-        if resp.status_code == 200:
-            profiles = resp.json()
-            if profiles:
-                return jsonify({"success": True, "data": profiles[0]})
-            return jsonify({"success": False, "message": "Bu email ile kayıt bulunamadı"}), 404
-        return jsonify({"success": False, "message": "Supabase hatası"}), 400
+        if profile:
+            return jsonify({"success": True, "data": profile})
+        return jsonify({"success": False, "message": "Bu email ile kayıt bulunamadı"}), 404
 
     except Exception as e:
         print("❌ Login hata:", e)
@@ -293,83 +308,38 @@ def analyze_cv():
             }), 400
         
         prompt = f"""
-        Lütfen aşağıdaki CV metnini dikkatlice analiz et ve aşağıdaki JSON yapısına uygun şekilde, **sadece** JSON olarak yanıt ver ve lütfen her şeyi doldur ekiklik olmasın:
+        Lütfen aşağıdaki CV metnini dikkatlice analiz et ve tüm alanları eksiksiz doldur:
         "experienceLevel" için kullanıcının staj ve iş deneyimlerine dikkat et, sadece iş deneyimini baz alarak doldur staj deneyimini baz alma. Bütün hepsi staj ise junior olur. Ayrıca, süre hesaplmasını doğru yap.
         Tüm iş ilanlarını kaydettiğinden emin ol.
-        {{
-          "firstName": "ad",
-          "lastName": "soyad",
-          "email": "email@domain.com",
-          "phone": "telefon",
-          "location": "şehir, ülke",
-          "currentTitle": "mevcut pozisyon",
-          "summary": "kısa özet",
-          "experienceLevel": "junior | mid | senior | lead", 
-          "skills": ["beceri1", "beceri2"],
-          "experiences": [{{"company": "şirket", "position": "pozisyon", "duration": "2022-2024", "description": "açıklama"}}],
-          "education": {{
-            "university": "üniversite",
-            "degree": "bölüm",
-            "graduationYear": "2022",
-            "gpa": "3.5/4.0"
-          }}
-        }}
-
         CV Metni:
         {cv_text}
         """
         
         # Gemini API request
-        gemini_payload = {
-            "contents": [{
-                "parts": [{
-                    "text": prompt
-                }]
-            }],
-            "generationConfig": {
-                "temperature": 0.1,
-                "maxOutputTokens": 1000
-            }
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            
-            if 'candidates' in result and result['candidates']:
-                ai_response = result['candidates'][0]['content']['parts'][0]['text']
-                
-                # JSON temizle ve parse et
-                cleaned_response = ai_response.replace('```json\n', '').replace('\n```', '').strip()
-                
-                try:
-                    parsed_data = json.loads(cleaned_response)
-                    return jsonify({
-                        "success": True,
-                        "data": parsed_data
-                    })
-                except json.JSONDecodeError as e:
-                    return jsonify({
-                        "success": False,
-                        "message": f"AI yanıtı parse edilemedi: {str(e)}"
-                    }), 400
-            else:
-                return jsonify({
-                    "success": False,
-                    "message": "AI'dan geçerli yanıt alınamadı"
-                }), 400
-        else:
+        try:
+            parsed_data = gemini_client.generate(
+                prompt,
+                structured_config("analyze_cv", {"temperature": 0.1, "maxOutputTokens": 1000}),
+                call_site="analyze_cv",
+                cache_ttl=CV_ANALYSIS_CACHE_TTL,
+                parse=lambda text: parse_response("analyze_cv", text)
+            )
+        except GeminiError as e:
             return jsonify({
                 "success": False,
-                "message": f"Gemini API hatası: {response.text}"
+                "message": f"{e}: {e.body}" if e.body else str(e)
             }), 400
-            
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "message": f"AI yanıtı parse edilemedi: {str(e)}"
+            }), 400
+
+        return jsonify({
+            "success": True,
+            "data": parsed_data
+        })
+
     except Exception as e:
         return jsonify({
             "success": False,
@@ -388,194 +358,36 @@ def health_check():
         "version": "1.0.0"
     })
 
-import re
+personalization_engine = PersonalizationEngine()
 
-personalization_engine = None
-
-# Analyze user profile to generate personalized parameters
-def analyze_user_profile(profile):
-    """Kullanıcı profilini analiz edip kişiselleştirme parametreleri üret"""
-    try:
+CAREER_SIMULATION_CONFIG = structured_config("career_simulation", {"temperature": 0.4, "maxOutputTokens": 3000})
 
-        current_title = profile.get("current_title", "").lower()
-        skills = profile.get("skills", [])
-        experience_level = profile.get("experience_level", "").lower()
-        degree = profile.get("degree", "").lower()
-        university = profile.get("university", "")
-        
-        personality_data = profile.get("personality_assessment", {})
-        
-        industry_focus = "technology"  
-        if any(keyword in current_title for keyword in ["developer", "engineer", "programmer", "software"]):
-            industry_focus = "technology"
-        elif any(keyword in current_title for keyword in ["designer", "ux", "ui"]):
-            industry_focus = "design"
-        elif any(keyword in degree for keyword in ["endüstri mühendisliği", "industrial engineering"]):
-            industry_focus = "industrial_engineering"
-        elif any(keyword in degree for keyword in ["bilgisayar", "computer", "yazılım", "software"]):
-            industry_focus = "technology"
-        elif any(keyword in degree for keyword in ["makine", "mechanical"]):
-            industry_focus = "mechanical_engineering"
-        elif any(keyword in degree for keyword in ["elektrik", "electrical", "elektronik"]):
-            industry_focus = "electrical_engineering"
-        elif any(keyword in current_title for keyword in ["manager", "lead", "director"]):
-            industry_focus = "management"
-        elif any(keyword in current_title for keyword in ["analyst", "data", "research"]):
-            industry_focus = "analytics"
-        
-        role_type = "individual_contributor"
-        if any(keyword in current_title for keyword in ["senior", "lead", "principal"]):
-            role_type = "senior_individual_contributor"
-        elif any(keyword in current_title for keyword in ["manager", "director", "head"]):
-            role_type = "management"
-        elif any(keyword in current_title for keyword in ["junior", "intern", "entry"]) or experience_level in ["junior", "entry"]:
-            role_type = "junior"
-        elif "endüstri mühendisliği" in degree and experience_level in ["junior", "entry"]:
-            role_type = "junior_engineer"
-        
-        technical_skills = {}
-        programming_langs = []
-        frameworks = []
-        tools = []
-        
-        for skill in skills:
-            skill_lower = skill.lower()
-            if skill_lower in ["python", "javascript", "java", "c++", "c#", "go", "rust"]:
-                programming_langs.append(skill)
-            elif skill_lower in ["react", "vue", "angular", "django", "flask", "spring"]:
-                frameworks.append(skill)
-            elif skill_lower in ["git", "docker", "kubernetes", "aws", "azure"]:
-                tools.append(skill)
-        
-        if "endüstri mühendisliği" in degree:
-            tools.extend(["Excel", "SAP", "AutoCAD", "MATLAB", "Minitab", "Process Analysis"])
-            if not programming_langs:
-                programming_langs.extend(["Python", "SQL"])  
-        
-        technical_skills = {
-            "programming_languages": programming_langs,
-            "frameworks": frameworks,
-            "tools": tools
-        }
-        
-        soft_skills = []
-        if personality_data.get("personality_type"):
-            personality_type = personality_data.get("personality_type", "")
-            if "E" in personality_type:
-                soft_skills.extend(["iletişim", "takım çalışması", "liderlik"])
-            if "I" in personality_type:
-                soft_skills.extend(["analitik düşünce", "detay odaklılık", "bağımsız çalışma"])
-            if "T" in personality_type:
-                soft_skills.extend(["problem çözme", "mantıklı karar verme"])
-            if "F" in personality_type:
-                soft_skills.extend(["empati", "müşteri odaklılık"])
-        
-        skill_gaps = []
-        if role_type in ["senior_individual_contributor", "management"] and not programming_langs:
-            skill_gaps.append("teknik_liderlik")
-        if industry_focus == "technology" and not frameworks:
-            skill_gaps.append("modern_frameworks")
-        if role_type == "management" and "liderlik" not in soft_skills:
-            skill_gaps.append("liderlik_becerileri")
-        
-        career_trajectory = "stable"
-        if experience_level in ["junior", "entry"]:
-            career_trajectory = "growing"
-        elif experience_level in ["senior", "lead"]:
-            career_trajectory = "expert"
-        elif "manager" in current_title:
-            career_trajectory = "management_track"
-        
-        personalization_params = {
-            "difficulty_preference": "medium",
-            "learning_style": personality_data.get("learning_style", "mixed"),
-            "simulation_types": ["problem_solving", "communication", "process_optimization"],
-            "feedback_style": "detailed",
-            "collaboration_preference": "team" if "E" in personality_data.get("personality_type", "") else "individual"
-        }
-        
-        if "endüstri mühendisliği" in degree:
-            personalization_params["simulation_types"] = ["process_optimization", "project_management", "data_analysis", "quality_control"]
-        elif any(keyword in degree for keyword in ["bilgisayar", "yazılım"]):
-            personalization_params["simulation_types"] = ["coding", "system_design", "debugging"]
-        elif any(keyword in degree for keyword in ["makine", "elektrik"]):
-            personalization_params["simulation_types"] = ["technical_problem_solving", "design_review", "testing"]
-        
-        if experience_level in ["junior", "entry"]:
-            personalization_params["difficulty_preference"] = "easy"
-            if "endüstri mühendisliği" in degree:
-                personalization_params["simulation_types"] = ["basic_process_analysis", "entry_level_projects", "learning_orientation"]
-        elif experience_level in ["senior", "lead"]:
-            personalization_params["difficulty_preference"] = "hard"
-            personalization_params["simulation_types"].extend(["leadership", "strategic_thinking"])
-        
-        return {
-            'industry_focus': industry_focus,
-            'role_type': role_type,
-            'technical_skills': technical_skills,
-            'soft_skills': soft_skills,
-            'skill_gaps': skill_gaps,
-            'career_trajectory': career_trajectory,
-            'personalization_params': personalization_params,
-            'degree': degree,
-            'university': university
-        }
-        
-    except Exception as e:
-        print(f"Kullanıcı analizi hatası: {str(e)}")
-        return {
-            'industry_focus': 'technology',
-            'role_type': 'general',
-            'technical_skills': {},
-            'soft_skills': [],
-            'skill_gaps': [],
-            'career_trajectory': 'stable',
-            'personalization_params': {
-                "difficulty_preference": "medium",
-                "learning_style": "mixed",
-                "simulation_types": ["coding", "communication"],
-                "feedback_style": "detailed"
-            }
-        }
+# Akış modunda senaryo dizisi alanı -> SSE olay adı
+SCENARIO_STREAM_EVENTS = {
+    "daily_schedule": "task",
+    "emails": "email",
+    "meetings": "meeting",
+}
 
-# Create a career simulation for users
-@app.route("/career-simulation/<user_id>", methods=["GET", "OPTIONS"])
-def career_simulation(user_id):
-    if request.method == "OPTIONS":
-        return jsonify({"message": "CORS preflight OK"}), 200
+# Tek kanonik analiz motoru; mantık değişince memo sürümünü artır
+user_analysis_memo = AnalysisMemo(personalization_engine.analyze_user_profile, version="4",
+                                  fields=ANALYSIS_FIELDS + ("university",))
 
-    print("📌 [career_simulation] İstek alındı | user_id:", user_id)
+add_personalization_routes(app, personalization_engine, profile_cache, user_analysis_memo)
 
+def fetch_simulation_profile(user_id):
+    """Simülasyon için kullanıcı profilini Supabase'den çek, yoksa None"""
     try:
-        if str(user_id).startswith('temp_'):
-            print(f"📌 Geçici kullanıcı {user_id} için varsayılan simülasyon oluşturuluyor")
-            return generate_default_simulation()
-        
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-        profile_url = f"{SUPABASE_API_URL}/rest/v1/profiles?id=eq.{user_id}"
-        print("📌 Supabase GET:", profile_url)
-
-        profile_resp = requests.get(profile_url, headers=headers)
-        print("📌 Supabase status:", profile_resp.status_code)
-        print("📌 Supabase response:", profile_resp.text[:300], "...")
-
-        if profile_resp.status_code != 200 or not profile_resp.json():
-            print("❌ Profil bulunamadı, varsayılan simülasyon döndürülüyor")
-            return generate_default_simulation()
-
-        profile = profile_resp.json()[0]
-        current_title = profile.get("current_title", "Bilinmeyen Pozisyon")
-        skills = ", ".join(profile.get("skills", [])) or "Belirtilmemiş"
-        print(f"📌 Profil verisi: title={current_title}, skills={skills}")
-
-
-        user_analysis = analyze_user_profile(profile)
-        print(f"📌 Kullanıcı analizi: {user_analysis.get('personalization_params', {})}")
-
-        base_prompt = f"""
+        return profile_cache.by_id(user_id)
+    except SupabaseError as e:
+        print("❌ Supabase status:", e.status_code, e.body[:300])
+        return None
+
+def build_career_simulation_prompt(profile, user_analysis):
+    """Profil ve analiz sonucundan kariyer simülasyonu prompt'u oluştur"""
+    current_title = profile.get("current_title", "Bilinmeyen Pozisyon")
+    skills = ", ".join(profile.get("skills", [])) or "Belirtilmemiş"
+    return f"""
         Sen bir kariyer simülasyonu üreticisisin. MUTLAKA kullanıcının gerçek profiline uygun simülasyon üret.
         
         KULLANICI PROFİLİ (DİKKATLE OKU):
@@ -621,120 +433,294 @@ def career_simulation(user_id):
         
         → Eğer diğer bölümler varsa ona göre uyarla!
         
-        YANIT FORMATI (SADECE JSON):
-        {{
-          "title": "Kullanıcının bölümüne uygun başlık",
-          "category": "Bölümün ana kategorisi", 
-          "difficulty": "Deneyim seviyesine göre",
-          "context": "Bölüme uygun şirket ve ortam tanımı",
-          "daily_schedule": [
-            {{
-              "time": "09:00",
-              "task": "Bölüme özel görev",
-              "description": "Detaylı açıklama",
-              "priority": "Yüksek",
-              "department": "İlgili departman",
-              "team_size": 3,
-              "tools": ["Bölüme uygun araçlar"],
-              "duration_min": 60
-            }}
-          ],
-          "emails": [
-            {{"from": "email@company.com", "subject": "Bölüme uygun konu", "summary": "Özet"}}
-          ],
-          "meetings": [
-            {{"time": "11:00", "participants": ["İlgili roller"], "topic": "Bölüme uygun konu", "summary": "Özet"}}
-          ],
-          "situation": "Bölüme özel gerçekçi problem",
-          "question": "Bu durumda ne yaparsınız?",
-          "options": [
-            {{"id":"a","text":"Seçenek1","feedback":"Analiz"}},
-            {{"id":"b","text":"Seçenek2","feedback":"Analiz"}}
-          ]
-        }}
-        
-        ❗ UYARI: Yalnızca geçerli JSON döndür, başka hiçbir metin ekleme!
         ❗ KONTROL: Simülasyon kullanıcının bölümüne uygun mu? Eğer değilse baştan yaz!
-        """
+    """
 
-        prompt = base_prompt
+def find_degree_mismatch(profile, scenario):
+    """Senaryo kullanıcının bölümüne uymuyorsa nedenini döndür, uyuyorsa boş metin"""
+    user_degree = (profile.get("degree") or "").replace("İ", "i").lower()
+    scenario_title = scenario.get("title", "").lower()
+    scenario_category = scenario.get("category", "").lower()
+    scenario_context = scenario.get("context", "").lower()
 
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.4, "maxOutputTokens": 3000}
-        }
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload
+    print(f"🔍 Uygunluk kontrolü: Bölüm='{user_degree}' | Senaryo='{scenario_title}'")
+
+    scenario_text = scenario_title + scenario_category + scenario_context
+
+    if "endüstri mühendisliği" in user_degree:
+        if any(keyword in scenario_text for keyword in
+               ["backend", "frontend", "developer", "yazılım", "kod", "programming", "react", "javascript", "python", "api"]):
+            return "Endüstri Mühendisi için yazılım geliştirme simülasyonu üretildi"
+
+    elif any(keyword in user_degree for keyword in ["bilgisayar", "yazılım", "computer", "software"]):
+        if any(keyword in scenario_text for keyword in
+               ["üretim", "fabrika", "kalite kontrol", "süreç", "manufacturing", "sap", "lean"]):
+            return "Yazılım Mühendisi için üretim simülasyonu üretildi"
+
+    elif any(keyword in user_degree for keyword in ["makine", "mechanical"]):
+        if any(keyword in scenario_text for keyword in
+               ["yazılım", "kod", "programming", "web", "frontend", "backend"]):
+            return "Makine Mühendisi için yazılım simülasyonu üretildi"
+
+    return ""
+
+def build_corrective_prompt(prompt, profile, reason):
+    """Reddedilen senaryonun nedenini prompt'a ekleyerek düzeltici istek oluştur"""
+    return prompt + f"""
+        ❗ ÖNCEKİ DENEME REDDEDİLDİ: {reason}.
+        Senaryoyu baştan, yalnızca "{profile.get("degree", "")}" bölümünün çalışma alanında yaz!
+    """
+
+def request_career_scenario(prompt, profile, timeout=None):
+    """Tek Gemini üretimi: (senaryo, None) ya da (None, ret nedeni)
+
+    Gemini hatasında (zaman aşımı dahil) ret nedeni de None döner; bu durumda
+    yeniden denenmez.
+    """
+    try:
+        ai_response = gemini_client.generate(
+            prompt,
+            CAREER_SIMULATION_CONFIG,
+            call_site="career_simulation",
+            timeout=timeout
         )
+    except GeminiError as e:
+        print("❌ Gemini API hatası:", e.body or e)
+        return None, None
 
-        print("📌 Gemini status:", response.status_code)
-        if response.status_code != 200:
-            print("❌ Gemini API hatası:", response.text)
-            return jsonify({"success": False, "message": "Gemini API hatası"}), 400
+    try:
+        scenario = parse_response("career_simulation", ai_response)
+    except ValueError as e:
+        print("❌ JSON parse hatası:", str(e))
+        return None, "Yanıt geçerli JSON içermiyordu"
 
-        result = response.json()
-        ai_response = result['candidates'][0]['content']['parts'][0]['text']
-        print("📌 Ham Gemini yanıt (ilk 500 karakter):", ai_response[:500])
+    mismatch_reason = find_degree_mismatch(profile, scenario)
+    if mismatch_reason:
+        print(f"❌ UYUMSUZLUK: {mismatch_reason}")
+        return None, mismatch_reason
 
-        json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-        if not json_match:
-            print("❌ Gemini yanıtında JSON bulunamadı")
-            print("📌 Tam yanıt:", ai_response)
-            return jsonify({"success": False, "message": "Gemini yanıtında JSON bulunamadı"}), 500
+    return scenario, None
 
-        cleaned = json_match.group(0)
-        print("📌 Temizlenen JSON (ilk 300 karakter):", cleaned[:300])
+def generate_career_scenario(profile, budget=CAREER_SIMULATION_BUDGET, rejected=None,
+                             attempts=MAX_SCENARIO_ATTEMPTS):
+    """Bölüme uyan kariyer senaryosu üret; deneme ya da süre bütçesi dolarsa None
 
-        try:
-            scenario = json.loads(cleaned)
-            
-            user_degree = profile.get("degree", "").lower()
-            scenario_title = scenario.get("title", "").lower()
-            scenario_category = scenario.get("category", "").lower()
-            scenario_context = scenario.get("context", "").lower()
-            
-            print(f"🔍 Uygunluk kontrolü: Bölüm='{user_degree}' | Senaryo='{scenario_title}'")
-            
-            degree_mismatch = False
-            mismatch_reason = ""
-            
-            if "endüstri mühendisliği" in user_degree:
-                if any(keyword in scenario_title + scenario_category + scenario_context for keyword in 
-                       ["backend", "frontend", "developer", "yazılım", "kod", "programming", "react", "javascript", "python", "api"]):
-                    degree_mismatch = True
-                    mismatch_reason = "Endüstri Mühendisi için yazılım geliştirme simülasyonu üretildi"
-                    
-            elif any(keyword in user_degree for keyword in ["bilgisayar", "yazılım", "computer", "software"]):
-                if any(keyword in scenario_title + scenario_category + scenario_context for keyword in 
-                       ["üretim", "fabrika", "kalite kontrol", "süreç", "manufacturing", "sap", "lean"]):
-                    degree_mismatch = True
-                    mismatch_reason = "Yazılım Mühendisi için üretim simülasyonu üretildi"
-                    
-            elif any(keyword in user_degree for keyword in ["makine", "mechanical"]):
-                if any(keyword in scenario_title + scenario_category + scenario_context for keyword in 
-                       ["yazılım", "kod", "programming", "web", "frontend", "backend"]):
-                    degree_mismatch = True
-                    mismatch_reason = "Makine Mühendisi için yazılım simülasyonu üretildi"
-            
-            if degree_mismatch:
-                print(f"❌ UYUMSUZLUK: {mismatch_reason}")
-                print("🔄 Bölüme özel simülasyon oluşturuluyor...")
-                return generate_degree_specific_simulation(profile)
-            
-            print("✅ Senaryo bölüme uygun - kabul ediliyor")
-            return jsonify({"success": True, "data": scenario})
-            
-        except Exception as e:
-            print("❌ JSON parse hatası:", str(e))
-            print("📌 Ham yanıt:", ai_response)
-            return generate_degree_specific_simulation(profile)
+    Uyumsuz ya da ayrıştırılamayan yanıtta ret nedeni prompt'a eklenerek
+    yeniden üretilir. rejected, akışta reddedilmiş önceki denemenin nedenidir;
+    verilirse ilk deneme de düzeltici prompt'la yapılır.
+    """
+    deadline = time.monotonic() + budget
+    user_analysis = user_analysis_memo.get(profile)
+    prompt = build_career_simulation_prompt(profile, user_analysis)
+    reason = rejected
+
+    for attempt in range(attempts):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if reason:
+            print(f"🔄 Düzeltici yeniden üretim ({attempt + 1}/{attempts}): {reason}")
+        attempt_prompt = build_corrective_prompt(prompt, profile, reason) if reason else prompt
+        # Kalan bütçe isteğin read zaman aşımı olur; süre dolan istek bekletilmeden kesilir
+        scenario, reason = request_career_scenario(attempt_prompt, profile, timeout=remaining)
+        if scenario is not None:
+            return scenario
+        if reason is None:
+            return None
+    print("⏱️ Deneme sayısı ya da süre bütçesi doldu, bölüme uygun senaryo üretilemedi")
+    return None
+
+scenario_pool = ScenarioPool(generate_career_scenario, size=SCENARIO_POOL_SIZE)
+
+# Create a career simulation for users
+@app.route("/career-simulation/<user_id>", methods=["GET", "OPTIONS"])
+def career_simulation(user_id):
+    if request.method == "OPTIONS":
+        return jsonify({"message": "CORS preflight OK"}), 200
+
+    print("📌 [career_simulation] İstek alındı | user_id:", user_id)
+
+    try:
+        if str(user_id).startswith('temp_'):
+            print(f"📌 Geçici kullanıcı {user_id} için varsayılan simülasyon oluşturuluyor")
+            return generate_default_simulation()
+
+        profile = fetch_simulation_profile(user_id)
+        if not profile:
+            print("❌ Profil bulunamadı, varsayılan simülasyon döndürülüyor")
+            return generate_default_simulation()
+
+        user_analysis = user_analysis_memo.get(profile)
+        bucket = scenario_bucket(profile, user_analysis)
+        print(f"📌 Senaryo grubu: {bucket}")
+
+        # Grup boşsa doldurmanın ilk (bölüme uygunluğu kontrol edilmiş) senaryosu
+        # COLD_SCENARIO_WAIT kadar beklenir; gelmezse bölüme özel şablon döner.
+        scenario = scenario_pool.take(bucket, wait=COLD_SCENARIO_WAIT)
+        if scenario is None:
+            print("🔄 Havuz boş - bölüme özel simülasyon oluşturuluyor...")
+            response = generate_degree_specific_simulation(profile)
+            prefetch_task_simulations(response.get_json()["data"], profile)
+            return response
+
+        print("✅ Havuzdan senaryo kullanıldı")
+        scenario = personalize_scenario(scenario, profile)
+        prefetch_task_simulations(scenario, profile)
+        return jsonify({"success": True, "data": scenario})
 
     except Exception as e:
         print("❌ career_simulation genel hata:", traceback.format_exc())
         return jsonify({"success": False, "message": f"Hata: {str(e)}"}), 500
 
+def sse_event(event, data):
+    """Server-Sent Events formatında tek bir olay üret"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def sse_response(generator):
+    """Üreteci text/event-stream yanıtı olarak döndür"""
+    return Response(
+        stream_with_context(generator),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Career simulation streaming (SSE)
+@app.route("/career-simulation/<user_id>/stream", methods=["GET"])
+def career_simulation_stream(user_id):
+    """Simülasyonu üretilirken görev, email ve toplantı bazında akıt"""
+    print("📌 [career_simulation_stream] İstek alındı | user_id:", user_id)
+
+    if str(user_id).startswith('temp_'):
+        scenario = generate_default_simulation().get_json()["data"]
+        return sse_response(iter([sse_event("scenario", scenario)]))
+
+    profile = fetch_simulation_profile(user_id)
+    if not profile:
+        print("❌ Profil bulunamadı, varsayılan simülasyon döndürülüyor")
+        scenario = generate_default_simulation().get_json()["data"]
+        return sse_response(iter([sse_event("scenario", scenario)]))
+
+    user_analysis = user_analysis_memo.get(profile)
+    bucket = scenario_bucket(profile, user_analysis)
+    print(f"📌 Senaryo grubu: {bucket}")
+
+    # Havuzda hazır senaryo varsa akış beklenmeden tek olayda döner
+    scenario = scenario_pool.take(bucket)
+    if scenario is not None:
+        print("✅ Havuzdan senaryo kullanıldı")
+        scenario = personalize_scenario(scenario, profile)
+        prefetch_task_simulations(scenario, profile)
+        return sse_response(iter([sse_event("scenario", scenario)]))
+
+    prompt = build_career_simulation_prompt(profile, user_analysis)
+
+    def generate():
+        parser = IncrementalJSONParser(SCENARIO_STREAM_EVENTS.keys())
+        try:
+            for chunk in gemini_client.stream_generate(prompt, CAREER_SIMULATION_CONFIG,
+                                                       call_site="career_simulation"):
+                for key, item in parser.feed(chunk):
+                    yield sse_event(SCENARIO_STREAM_EVENTS[key], item)
+            scenario = parser.result()
+            validate(scenario, RESPONSE_SCHEMAS["career_simulation"])
+        except GeminiError as e:
+            print("❌ Gemini API hatası:", e.body or e)
+            yield sse_event("error", {"message": "Gemini API hatası"})
+            return
+        except ValueError as e:
+            print("❌ JSON parse hatası:", str(e))
+            scenario = None
+
+        mismatch_reason = find_degree_mismatch(profile, scenario) if scenario else "JSON ayrıştırılamadı"
+        if mismatch_reason:
+            print(f"❌ UYUMSUZLUK: {mismatch_reason}")
+            # Akıştaki üretim ilk deneme sayılır; kalan tek düzeltici deneme kendi bütçesiyle yapılır
+            scenario = generate_career_scenario(profile, budget=CORRECTIVE_SCENARIO_BUDGET,
+                                                rejected=mismatch_reason, attempts=MAX_SCENARIO_ATTEMPTS - 1)
+            if scenario is None:
+                scenario = generate_degree_specific_simulation(profile).get_json()["data"]
+            prefetch_task_simulations(scenario, profile)
+            yield sse_event("scenario", scenario)
+            return
+
+        print("✅ Senaryo bölüme uygun - kabul ediliyor")
+        prefetch_task_simulations(scenario, profile)
+        yield sse_event("scenario", scenario)
+
+    return sse_response(generate())
+
+class TaskSimulationError(Exception):
+    """Görev simülasyonu üretilemediğinde fırlatılır"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+# Görev tipi -> prompt'taki simülasyon tanımı (yanıt yapısı llm_schemas'ta)
+TASK_SIMULATION_KINDS = {
+    "email": "gerçekçi bir email simülasyonu",
+    "coding": "gerçekçi bir kod yazma simülasyonu",
+    "meeting": "gerçekçi bir toplantı simülasyonu",
+    "general": "genel bir simülasyon",
+}
+
+def task_simulation_kind(task):
+    """Görev metninden simülasyon tipini belirle (email, coding, meeting, general)"""
+    task_type = (task.get('task') or '').lower()
+    if 'email' in task_type or 'mail' in task_type:
+        return "email"
+    if 'kod' in task_type or 'code' in task_type or 'geliştir' in task_type:
+        return "coding"
+    if 'toplantı' in task_type or 'meeting' in task_type:
+        return "meeting"
+    return "general"
+
+def build_task_simulation_prompt(task, current_title):
+    """Görev tipine (email, kod, toplantı, genel) göre simülasyon prompt'u oluştur"""
+    return f"""
+        Kullanıcı {current_title} pozisyonunda ve "{task.get('task')}" görevini yapıyor.
+        Bu görev için {TASK_SIMULATION_KINDS[task_simulation_kind(task)]} oluştur.
+        """
+
+def generate_task_simulation(task, current_title):
+    """Görev simülasyonunu Gemini ile üret; başarısızlıkta TaskSimulationError"""
+    prompt = build_task_simulation_prompt(task, current_title)
+
+    try:
+        ai_response = gemini_client.generate(
+            prompt,
+            structured_config(f"task_simulation_{task_simulation_kind(task)}",
+                              {"temperature": 0.3, "maxOutputTokens": 2000, "topP": 0.8, "topK": 10}),
+            call_site="task_simulation"
+        )
+    except GeminiError as e:
+        print(f"📌 Gemini API hatası: {e.status_code} - {e.body or e}")
+        raise TaskSimulationError("Görev simülasyonu oluşturulamadı") from e
+
+    print(f"📌 Ham Gemini yanıt (task-simulation): {ai_response[:500]}...")
+
+    try:
+        return parse_response(f"task_simulation_{task_simulation_kind(task)}", ai_response)
+    except json.JSONDecodeError as je:
+        print(f"📌 JSON parse hatası: {str(je)}")
+        raise TaskSimulationError(f"JSON parse hatası: {str(je)}") from je
+    except SchemaValidationError as e:
+        print(f"📌 Yanıt şemaya uymuyor: {e}")
+        raise TaskSimulationError(f"Yanıt şemaya uymuyor: {e}") from e
+    except ValueError as e:
+        print(f"📌 JSON formatı bulunamadı. Ham yanıt: {ai_response}")
+        raise TaskSimulationError("JSON formatı bulunamadı") from e
+
+task_prefetcher = TaskPrefetcher(generate_task_simulation, workers=TASK_PREFETCH_WORKERS)
+
+def prefetch_task_simulations(scenario, profile):
+    """Senaryonun günlük programındaki görevlerin simülasyonlarını arka planda hazırla"""
+    current_title = profile.get('current_title') or 'Developer'
+    tasks = [task for task in (scenario.get('daily_schedule') or []) if isinstance(task, dict)]
+    queued = sum(task_prefetcher.prefetch(task, current_title) for task in tasks[:TASK_PREFETCH_LIMIT])
+    if queued:
+        print(f"📌 {queued} görev simülasyonu arka planda hazırlanıyor")
+
 # Interface for task simulation
 @app.route("/task-simulation", methods=["POST"])
 def task_simulation():
@@ -743,140 +729,18 @@ def task_simulation():
         data = request.json
         task = data.get('task', {})
         user = data.get('user', {})
-        
-        task_type = task.get('task', '').lower()
-        current_title = user.get('current_title', 'Developer')
-        
-        if 'email' in task_type or 'mail' in task_type:
-            prompt = f"""
-            Kullanıcı {current_title} pozisyonunda ve "{task.get('task')}" görevini yapıyor.
-            Bu görev için gerçekçi bir email simülasyonu oluştur.
-            
-            SADECE JSON formatında yanıt ver, başka hiçbir açıklama veya metin ekleme:
-            {{
-                "type": "email",
-                "scenario": "Email senaryosu açıklaması",
-                "incoming_email": {{
-                    "from": "gönderen@company.com",
-                    "subject": "Konu başlığı",
-                    "body": "Email içeriği",
-                    "priority": "Yüksek|Orta|Düşük",
-                    "requires_response": true
-                }},
-                "context": "Bu emaile nasıl yanıt vermeli açıklama",
-                "success_criteria": ["Başarı kriterleri listesi"]
-            }}
-            """
-        elif 'kod' in task_type or 'code' in task_type or 'geliştir' in task_type:
-            prompt = f"""
-            Kullanıcı {current_title} pozisyonunda ve "{task.get('task')}" görevini yapıyor.
-            Bu görev için gerçekçi bir kod yazma simülasyonu oluştur.
-            
-            SADECE JSON formatında yanıt ver, başka hiçbir açıklama veya metin ekleme:
-            {{
-                "type": "coding",
-                "scenario": "Kod yazma senaryosu",
-                "problem": "Çözülmesi gereken problem açıklaması",
-                "requirements": ["Gereksinimler listesi"],
-                "example_input": "Örnek girdi",
-                "expected_output": "Beklenen çıktı",
-                "constraints": ["Kısıtlamalar"],
-                "hints": ["İpuçları"],
-                "difficulty": "Kolay|Orta|Zor"
-            }}
-            """
-        elif 'toplantı' in task_type or 'meeting' in task_type:
-            prompt = f"""
-            Kullanıcı {current_title} pozisyonunda ve "{task.get('task')}" görevini yapıyor.
-            Bu görev için gerçekçi bir toplantı simülasyonu oluştur.
-            
-            SADECE JSON formatında yanıt ver, başka hiçbir açıklama veya metin ekleme:
-            {{
-                "type": "meeting",
-                "scenario": "Toplantı senaryosu",
-                "agenda": ["Gündem maddeleri"],
-                "participants": [
-                    {{"name": "İsim", "role": "Rol", "personality": "Kişilik"}},
-                    {{"name": "İsim", "role": "Rol", "personality": "Kişilik"}}
-                ],
-                "key_decisions": ["Alınması gereken kararlar"],
-                "challenges": ["Karşılaşabilecek zorluklar"],
-                "success_metrics": ["Başarı metrikleri"]
-            }}
-            """
-        else:
-            prompt = f"""
-            Kullanıcı {current_title} pozisyonunda ve "{task.get('task')}" görevini yapıyor.
-            Bu görev için genel bir simülasyon oluştur.
-            
-            SADECE JSON formatında yanıt ver, başka hiçbir açıklama veya metin ekleme:
-            {{
-                "type": "general",
-                "scenario": "Görev senaryosu",
-                "mini_event": "Bu görev sırasında yaşanabilecek bir olay",
-                "challenge": "Karşılaşabilecek zorluk",
-                "decision": {{
-                    "question": "Karar sorusu",
-                    "options": [
-                        {{"id": "a", "text": "Seçenek 1"}},
-                        {{"id": "b", "text": "Seçenek 2"}}
-                    ]
-                }},
-                "resources": ["Kullanabileceği kaynaklar"],
-                "tips": ["İpuçları"]
-            }}
-            """
-        
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.3,
-                "maxOutputTokens": 2000,
-                "topP": 0.8,
-                "topK": 10
-            }
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            ai_response = result['candidates'][0]['content']['parts'][0]['text']
-            
-            print(f"📌 Ham Gemini yanıt (task-simulation): {ai_response[:500]}...")
-            
-            json_content = None
-            
-            markdown_match = re.search(r'```json\s*(\{.*?\})\s*```', ai_response, re.DOTALL)
-            if markdown_match:
-                json_content = markdown_match.group(1)
-                print("📌 Markdown kod bloğundan JSON çıkarıldı")
-            else:
-                json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-                if json_match:
-                    json_content = json_match.group(0)
-                    print("📌 Regex ile JSON çıkarıldı")
-            
-            if json_content:
-                print(f"📌 Çıkarılan JSON içeriği: {json_content[:300]}...")
-                
-                try:
-                    simulation_data = json.loads(json_content)
-                    return jsonify({"success": True, "data": simulation_data})
-                except json.JSONDecodeError as je:
-                    print(f"📌 JSON parse hatası: {str(je)}")
-                    print(f"📌 Hatalı JSON: {json_content}")
-                    return jsonify({"success": False, "message": f"JSON parse hatası: {str(je)}"}), 400
-            else:
-                print(f"📌 JSON formatı bulunamadı. Ham yanıt: {ai_response}")
-                return jsonify({"success": False, "message": "JSON formatı bulunamadı"}), 400
-        
-        print(f"📌 Gemini API hatası: {response.status_code} - {response.text}")
-        return jsonify({"success": False, "message": "Görev simülasyonu oluşturulamadı"}), 400
+        current_title = user.get('current_title') or 'Developer'
+
+        simulation_data = task_prefetcher.get(task, current_title)
+        if simulation_data is not None:
+            print("📌 Görev simülasyonu ön yüklemeden döndü")
+            return jsonify({"success": True, "data": simulation_data})
+
+        try:
+            simulation_data = generate_task_simulation(task, current_title)
+        except TaskSimulationError as e:
+            return jsonify({"success": False, "message": str(e)}), e.status_code
+        return jsonify({"success": True, "data": simulation_data})
         
     except Exception as e:
         print(f"Task simulation error: {str(e)}")
@@ -900,37 +764,24 @@ def email_chat():
         Kullanıcının mesajı: "{user_message}"
         
         Bu mesaja gerçekçi, profesyonel bir müşteri/iş ortağı gibi yanıt ver.
-        Yanıtın JSON formatında olsun:
-        {{
-            "reply": "Email yanıtı",
-            "tone": "Profesyonel|Samimi|Resmi|Acil",
-            "satisfaction": "Memnun|Nötr|Memnun değil",
-            "next_action": "Bir sonraki beklenen aksiyon",
-            "feedback": "Kullanıcının mesajı hakkında geri bildirim"
-        }}
         """
         
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.7, "maxOutputTokens": 1000}
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            ai_response = result['candidates'][0]['content']['parts'][0]['text']
-            
-            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-            if json_match:
-                reply_data = json.loads(json_match.group(0))
-                return jsonify({"success": True, "data": reply_data})
-        
-        return jsonify({"success": False, "message": "Email yanıtı oluşturulamadı"}), 400
+        try:
+            ai_response = gemini_client.generate(
+                prompt,
+                structured_config("email_chat", {"temperature": 0.7, "maxOutputTokens": 1000}),
+                call_site="email_chat"
+            )
+        except GeminiError as e:
+            print(f"Email chat Gemini error: {e}")
+            return jsonify({"success": False, "message": "Email yanıtı oluşturulamadı"}), 400
+
+        try:
+            reply_data = parse_response("email_chat", ai_response)
+        except ValueError:
+            return jsonify({"success": False, "message": "Email yanıtı oluşturulamadı"}), 400
+
+        return jsonify({"success": True, "data": reply_data})
         
     except Exception as e:
         print(f"Email chat error: {str(e)}")
@@ -957,40 +808,24 @@ def evaluate_code():
         {user_code}
         ```
         
-        Değerlendirmeyi JSON formatında döndür:
-        {{
-            "correctness": "Doğru|Kısmen doğru|Yanlış",
-            "efficiency": "Verimli|Orta|Verimsiz",
-            "readability": "Okunabilir|Orta|Karmaşık",
-            "best_practices": "İyi|Orta|Kötü",
-            "feedback": "Detaylı geri bildirim",
-            "suggestions": ["İyileştirme önerileri"],
-            "corrected_code": "Düzeltilmiş kod (eğer gerekirse)",
-            "explanation": "Çözümün açıklaması"
-        }}
         """
         
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.3, "maxOutputTokens": 2000}
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            ai_response = result['candidates'][0]['content']['parts'][0]['text']
-            
-            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-            if json_match:
-                evaluation = json.loads(json_match.group(0))
-                return jsonify({"success": True, "data": evaluation})
-        
-        return jsonify({"success": False, "message": "Kod değerlendirilemedi"}), 400
+        try:
+            ai_response = gemini_client.generate(
+                prompt,
+                structured_config("evaluate_code", {"temperature": 0.3, "maxOutputTokens": 2000}),
+                call_site="evaluate_code"
+            )
+        except GeminiError as e:
+            print(f"Code evaluation Gemini error: {e}")
+            return jsonify({"success": False, "message": "Kod değerlendirilemedi"}), 400
+
+        try:
+            evaluation = parse_response("evaluate_code", ai_response)
+        except ValueError:
+            return jsonify({"success": False, "message": "Kod değerlendirilemedi"}), 400
+
+        return jsonify({"success": True, "data": evaluation})
         
     except Exception as e:
         print(f"Code evaluation error: {str(e)}")
@@ -1014,17 +849,7 @@ def complete_task():
             "completed_at": "now()"
         }
         
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(
-            f"{SUPABASE_API_URL}/rest/v1/task_completions",
-            headers=headers,
-            json=task_completion
-        )
+        response = supabase.table("task_completions").insert(task_completion, returning=False)
         
         if response.status_code in [200, 201]:
             return jsonify({"success": True, "message": "Görev tamamlandı"})
@@ -1049,36 +874,25 @@ def get_hint():
         Kullanıcı {user_role} pozisyonunda "{current_task.get('task', '')}" görevini yapıyor.
         Şu anki ilerleme: {user_progress}
         
-        Kullanıcıya yardımcı olacak bir ipucu ver. JSON formatında:
-        {{
-            "hint": "İpucu metni",
-            "type": "Teknik|Süreç|İletişim|Strateji",
-            "urgency": "Düşük|Orta|Yüksek",
-            "action": "Önerilen aksiyon"
-        }}
+        Kullanıcıya yardımcı olacak bir ipucu ver.
         """
         
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.6, "maxOutputTokens": 500}
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            ai_response = result['candidates'][0]['content']['parts'][0]['text']
-            
-            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-            if json_match:
-                hint_data = json.loads(json_match.group(0))
-                return jsonify({"success": True, "data": hint_data})
-        
-        return jsonify({"success": False, "message": "İpucu oluşturulamadı"}), 400
+        try:
+            ai_response = gemini_client.generate(
+                prompt,
+                structured_config("get_hint", {"temperature": 0.6, "maxOutputTokens": 500}),
+                call_site="get_hint"
+            )
+        except GeminiError as e:
+            print(f"Hint generation Gemini error: {e}")
+            return jsonify({"success": False, "message": "İpucu oluşturulamadı"}), 400
+
+        try:
+            hint_data = parse_response("get_hint", ai_response)
+        except ValueError:
+            return jsonify({"success": False, "message": "İpucu oluşturulamadı"}), 400
+
+        return jsonify({"success": True, "data": hint_data})
         
     except Exception as e:
         print(f"Hint generation error: {str(e)}")
@@ -1119,58 +933,44 @@ def meeting_chat():
         - Bazen karşı görüş bildirebilir
         - Somut örnekler verebilir
         - Takip soruları sorabilir
-        
-        Yanıtını SADECE JSON formatında ver, başka hiçbir şey ekleme:
         """
 
-        gemini_payload = {
-            "contents": [{"parts": [{"text": enhanced_prompt}]}],
-            "generationConfig": {
-                "temperature": 0.8,  
-                "maxOutputTokens": 500,
-                "topP": 0.9
+        try:
+            ai_response = gemini_client.generate(
+                enhanced_prompt,
+                structured_config("meeting_chat", {"temperature": 0.8, "maxOutputTokens": 500, "topP": 0.9}),
+                call_site="meeting_chat"
+            )
+        except GeminiError as e:
+            print(f"Meeting chat Gemini error: {e}")
+            return jsonify({"success": False, "message": "AI yanıtı oluşturulamadı"}), 400
+
+        try:
+            response_data = parse_response("meeting_chat", ai_response)
+            
+            if not response_data.get('response'):
+                response_data['response'] = "İlginç bir bakış açısı. Bu konuyu daha detaylı konuşabilir miyiz?"
+            
+            return jsonify({"success": True, "data": response_data})
+        except (json.JSONDecodeError, SchemaValidationError):
+            fallback_responses = {
+                'Proje Yöneticisi': "Bu konuda deadline'ımızı nasıl etkiler? Kaynak planlaması yapmamız gerekiyor.",
+                'Senior Developer': "Teknik implementasyon açısından hangi approach'u öneriyorsun?",
+                'UX Designer': "Kullanıcı deneyimi açısından bu değişiklik nasıl bir etki yaratır?",
+                'QA Engineer': "Bu feature için test senaryolarımızı nasıl genişletmeliyiz?"
             }
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            ai_response = result['candidates'][0]['content']['parts'][0]['text']
             
-            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-            if json_match:
-                try:
-                    response_data = json.loads(json_match.group(0))
-                    
-                    if not response_data.get('response'):
-                        response_data['response'] = "İlginç bir bakış açısı. Bu konuyu daha detaylı konuşabilir miyiz?"
-                    
-                    return jsonify({"success": True, "data": response_data})
-                except json.JSONDecodeError:
-                    fallback_responses = {
-                        'Proje Yöneticisi': "Bu konuda deadline'ımızı nasıl etkiler? Kaynak planlaması yapmamız gerekiyor.",
-                        'Senior Developer': "Teknik implementasyon açısından hangi approach'u öneriyorsun?",
-                        'UX Designer': "Kullanıcı deneyimi açısından bu değişiklik nasıl bir etki yaratır?",
-                        'QA Engineer': "Bu feature için test senaryolarımızı nasıl genişletmeliyiz?"
-                    }
-                    
-                    return jsonify({
-                        "success": True, 
-                        "data": {
-                            "response": fallback_responses.get(participant, "İyi bir öneri, detaylarını konuşalım."),
-                            "emotion": "neutral",
-                            "follow_up_question": None,
-                            "action_item": None
-                        }
-                    })
-        
-        return jsonify({"success": False, "message": "AI yanıtı oluşturulamadı"}), 400
+            return jsonify({
+                "success": True, 
+                "data": {
+                    "response": fallback_responses.get(participant, "İyi bir öneri, detaylarını konuşalım."),
+                    "emotion": "neutral",
+                    "follow_up_question": None,
+                    "action_item": None
+                }
+            })
+        except ValueError:
+            return jsonify({"success": False, "message": "AI yanıtı oluşturulamadı"}), 400
         
     except Exception as e:
         print(f"Meeting chat error: {str(e)}")
@@ -1252,31 +1052,22 @@ def save_personality_assessment():
 def get_user_analysis(user_id):
     """Kullanıcının analiz edilmiş profilini getir"""
     try:
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-        
-        response = requests.get(
-            f"{SUPABASE_API_URL}/rest/v1/profiles?id=eq.{user_id}",
-            headers=headers
-        )
+        try:
+            profile = profile_cache.by_id(user_id)
+        except SupabaseError:
+            return jsonify({"success": False, "message": "Veri alınamadı"}), 400
         
-        if response.status_code == 200:
-            profiles = response.json()
-            if profiles:
-                profile = profiles[0]
-                user_analysis = analyze_user_profile(profile)
-                
-                return jsonify({
-                    "success": True,
-                    "data": {
-                        "profile": profile,
-                        "analysis": user_analysis
-                    }
-                })
-            return jsonify({"success": False, "message": "Profil bulunamadı"}), 404
-        return jsonify({"success": False, "message": "Veri alınamadı"}), 400
+        if profile:
+            user_analysis = user_analysis_memo.get(profile)
+            
+            return jsonify({
+                "success": True,
+                "data": {
+                    "profile": profile,
+                    "analysis": user_analysis.to_dict()
+                }
+            })
+        return jsonify({"success": False, "message": "Profil bulunamadı"}), 404
         
     except Exception as e:
         print(f"User analysis error: {str(e)}")
@@ -1285,7 +1076,7 @@ def get_user_analysis(user_id):
 def generate_degree_specific_simulation(profile):
     """Kullanıcının bölümüne özel garantili simülasyon oluştur"""
     
-    degree = profile.get("degree", "").lower()
+    degree = (profile.get("degree") or "").replace("İ", "i").lower()
     experience_level = profile.get("experience_level", "junior")
     university = profile.get("university", "")
     first_name = profile.get("first_name", "Kullanıcı")
@@ -1759,110 +1550,30 @@ def generate_default_simulation():
         "message": f"Dinamik simülasyon: {selected_scenario['category']}"
     })
 
-#   Get real jobs with AI
-@app.route("/api/jobs", methods=["GET"])
-def get_real_jobs_with_ai():
-    try:
-        print("DEBUG API params →", request.args)
-        print("DEBUG RAW URL →", request.url)
+class JobSearchError(Exception):
+    """Canlı iş ilanı araması sonuç üretemediğinde fırlatılır"""
 
-        title = request.args.get("title")
-        location = request.args.get("location")
+    def __init__(self, message, status_code=500):
+        super().__init__(message)
+        self.status_code = status_code
 
-        print(f"📌 İş arama: {title} - {location}")
+def search_live_jobs(title, location):
+    """SerpAPI + scraping + Gemini ile canlı arama yap, sonucu yerel depoya yaz"""
+    # 1️⃣ SerpAPI ile iş ilanlarını ara (normalize sorgu önbellekli)
+    job_links = serp_job_search.find_job_links(title, location)
 
-        # 1️⃣ SerpAPI ile iş ilanlarını ara
-        serp_url = "https://serpapi.com/search"
-        params = {
-            "engine": "google",
-            "q": f'"{title}" job opening {location} site:kariyer.net OR site:secretcv.com OR site:yenibiris.com OR site:indeed.com OR site:glassdoor.com OR site:linkedin.com/jobs',
-            "num": 25,
-            "api_key": SERPAPI_KEY
-        }
+    if not job_links:
+        raise JobSearchError("İş ilanı linki bulunamadı", 200)
 
-        resp = requests.get(serp_url, params=params, timeout=10)
-        data = resp.json()
-        job_links = []
-
-        if "organic_results" in data:
-            for result in data.get("organic_results", [])[:8]:
-                link = result.get("link", "")
-                title_text = result.get("title", "").lower()
-                bad_keywords = ["search", "jobs", "listing", "browse", "filter"]
-                if link and not any(bad in link.lower() for bad in bad_keywords):
-                    if any(site in link for site in [
-                        "kariyer.net", 
-                        "secretcv.com", 
-                        "yenibiris.com", 
-                        "indeed.com", 
-                        "glassdoor.com", 
-                        "linkedin.com/jobs"
-                    ]):
-                        job_links.append({
-                            "url": link,
-                            "title": result.get("title", ""),
-                            "snippet": result.get("snippet", "")
-                        })
-
-        if not job_links:
-            print("❌ Tek iş ilanı linki bulunamadı, geniş arama yapılıyor...")
-            params["q"] = f'"{title}" {location} site:kariyer.net OR site:secretcv.com'
-            resp = requests.get(serp_url, params=params, timeout=10)
-            data = resp.json()
-            for result in data.get("organic_results", [])[:6]:
-                link = result.get("link", "")
-                if link:
-                    job_links.append({
-                        "url": link,
-                        "title": result.get("title", ""),
-                        "snippet": result.get("snippet", "")
-                    })
-
-        if not job_links:
-            return jsonify({"success": False, "message": "İş ilanı linki bulunamadı", "jobs": []}), 200
-
-        print(f"📌 Bulunan linkler:")
-        for i, link in enumerate(job_links):
-            print(f"  {i+1}. {link['url']}")
-
-        # Scraping 
-        job_data_for_ai = []
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-
-        for job_link in job_links:
-            try:
-                print(f"📌 Hızlı scraping: {job_link['url']}")
-                response = requests.get(job_link['url'], headers=headers, timeout=8)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, "html.parser")
-                    title_tag = soup.find('title')
-                    headings = soup.find_all(['h1', 'h2', 'h3'])
-                    body = soup.find('body')
-                    job_data_for_ai.append({
-                        "url": job_link['url'],
-                        "title_tag": title_tag.get_text() if title_tag else "",
-                        "headings": " ".join([h.get_text() for h in headings]),
-                        "body_snippet": body.get_text()[:1000] if body else "",
-                        "search_title": job_link['title'],
-                        "search_snippet": job_link['snippet']
-                    })
-                    print("   ✅ Sayfa bilgileri alındı")
-                else:
-                    raise Exception("HTTP başarısız")
-            except Exception:
-                job_data_for_ai.append({
-                    "url": job_link['url'],
-                    "title_tag": "",
-                    "headings": "",
-                    "body_snippet": "",
-                    "search_title": job_link['title'],
-                    "search_snippet": job_link['snippet']
-                })
-                print("   ⚠️ Scraping başarısız, snippet kullanılacak")
-            time.sleep(1)
-
-       
-        prompt = f"""
+    print(f"📌 Bulunan linkler:")
+    for i, link in enumerate(job_links):
+        print(f"  {i+1}. {link['url']}")
+
+    # Scraping (eşzamanlı, alan adı bazında sınırlı, toplam süre sınırlı)
+    print(f"📌 {len(job_links)} sayfa paralel scraping ediliyor")
+    job_data_for_ai = job_page_scraper.scrape(job_links)
+
+    prompt = f"""
 Aşağıdaki verilerden "{title}" pozisyonu için iş ilanı detaylarını çıkar.
 Kurallar:
 - **"not specified", "belirtilmemiş", "unknown", "n/a" gibi ifadeleri ASLA kullanma.** Bunları yazarsan cevap geçersiz sayılır.
@@ -1870,77 +1581,100 @@ Kurallar:
 - Şirket adını, konumu ve pozisyon adını mutlaka belirt. Bu bilgiler eksikse ilgili alanı tahmine dayalı olarak doldur ama "not specified" yazma.
 - Requirements kısmında ilanın açıklamasını inceleyerek **anahtar becerileri ve teknolojileri** listele. En az 6 tane özgün ve alakalı tek kelimelik beceri yaz. Genel terimler ya da "not specified" yazma.
 - Eğer ilanda açıkça "başvuru kapandı", "ilan süresi doldu", "yayından kaldırıldı" gibi ifadeler varsa bu ilanı tamamen atla.
+- location_city alanına "{location}" yaz.
 
 Veri:
 {json.dumps(job_data_for_ai, ensure_ascii=False, indent=2)}
-
-JSON yanıt formatı (dikkatlice doldur):
-
-{{
-  "jobs": [
-    {{
-      "title": "Pozisyon adı – kesinlikle doldur, tahmin etmen gerekiyorsa et",
-      "company": {{
-        "name": "Şirket adı – mutlaka yaz, 'not specified' yazma"
-      }},
-      "description": "İş açıklaması (en az 50 karakter)",
-      "url": "İlan linki",
-      "requirements": [
-        "Python", "Django", "AWS", "CI/CD", "SQL", "Linux"
-      ],  # En az 6–8 beceri, açıklamadan çıkar
-      "location_city": "{location}",
-      "salary_range": "Bilgi yoksa boş bırak",
-      "experience_level": "Bilgi yoksa boş bırak"
-    }}
-  ]
-}}
 """
 
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.3, "maxOutputTokens": 2048}
-        }
-        ai_response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload,
-            timeout=20
+    try:
+        ai_text = gemini_client.generate(
+            prompt,
+            structured_config("job_extraction", {"temperature": 0.3, "maxOutputTokens": 2048}),
+            call_site="job_extraction",
+            coalesce=True
         )
+    except GeminiError:
+        raise JobSearchError("AI analizi başarısız")
+
+    print(f"📌 AI yanıtı (ilk 300): {ai_text[:300]}...")
+
+    try:
+        ai_data = parse_response("job_extraction", ai_text)
+        jobs = ai_data.get("jobs", [])
+
+        final_jobs = []
+        for job in jobs:
+            if job.get("title") and job.get("url"):
+                if not job.get("company", {}).get("name"):
+                    job["company"] = {"name": "Unknown Company"}
+                if not job.get("requirements"):
+                    job["requirements"] = ["Not specified"]
+                final_jobs.append(job)
+
+        print(f"✅ İş ilanları oluşturuldu: {len(final_jobs)} ilan")
+    except ValueError as e:
+        print(f"❌ JSON parse hatası: {e}")
+        raise JobSearchError("AI yanıtı geçersiz")
+
+    job_store.save_jobs(title, location, final_jobs)
+    return final_jobs
+
+job_refresher = JobRefresher(search_live_jobs)
+
+def fetch_user_skill_weights(user_id):
+    """Kullanıcının profil becerileri ve seviyelerinden eşleştirme ağırlıklarını getir"""
+    try:
+        profile = profile_cache.by_id(user_id)
+    except SupabaseError:
+        profile = None
+    levels_resp = supabase.table("skill_levels").select("skill,level").eq("user_id", user_id).get()
+    skills = (profile.get("skills") or []) if profile else []
+    levels = levels_resp.json() if levels_resp.status_code == 200 else []
+    return build_skill_weights(skills, levels)
 
-        if ai_response.status_code != 200:
-            return jsonify({"success": False, "message": "AI analizi başarısız", "jobs": []}), 500
+#   Get real jobs with AI
+@app.route("/api/jobs", methods=["GET"])
+def get_real_jobs_with_ai():
+    try:
+        print("DEBUG API params →", request.args)
+        print("DEBUG RAW URL →", request.url)
 
-        result = ai_response.json()
-        ai_text = result['candidates'][0]['content']['parts'][0]['text']
-        print(f"📌 AI yanıtı (ilk 300): {ai_text[:300]}...")
+        title = request.args.get("title")
+        location = request.args.get("location")
+        user_id = request.args.get("user_id")
 
-        import re
-        json_match = re.search(r'(\{(?:.|\n)*\})', ai_text)
-        if not json_match:
-            return jsonify({"success": False, "message": "AI yanıtı parse edilemedi", "jobs": []}), 500
+        print(f"📌 İş arama: {title} - {location}")
 
-        try:
-            ai_data = json.loads(json_match.group(1))
-            jobs = ai_data.get("jobs", [])
-
-            final_jobs = []
-            for job in jobs:
-                if job.get("title") and job.get("url"):
-                    if not job.get("company", {}).get("name"):
-                        job["company"] = {"name": "Unknown Company"}
-                    if not job.get("requirements"):
-                        job["requirements"] = ["Not specified"]
-                    final_jobs.append(job)
-
-            print(f"✅ İş ilanları oluşturuldu: {len(final_jobs)} ilan")
+        # Girişsiz kullanıcılar becerilerini istekte gönderir (?skills=python&skills=sql)
+        if user_id:
+            skill_weights = fetch_user_skill_weights(user_id)
+        else:
+            skill_weights = build_skill_weights(request.args.getlist("skills"))
+
+        # Yerel depo: daha önce çıkarılmış ilanlardan anında yanıt ver
+        stored_jobs = job_store.find(title or "", location or "", skill_weights=skill_weights)
+        if stored_jobs:
+            if job_store.is_stale(title or "", location or ""):
+                print("🔄 Kayıtlı sonuçlar eski, arka planda yenileniyor")
+                job_refresher.schedule(title or "", location or "")
+            print(f"✅ Yerel depodan {len(stored_jobs)} ilan döndürülüyor")
             return jsonify({
                 "success": True,
-                "jobs": final_jobs,
-                "message": f"{len(final_jobs)} iş ilanı bulundu"
+                "jobs": score_jobs(stored_jobs, skill_weights),
+                "message": f"{len(stored_jobs)} iş ilanı bulundu"
             })
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON parse hatası: {e}")
-            return jsonify({"success": False, "message": "AI yanıtı geçersiz", "jobs": []}), 500
+
+        try:
+            final_jobs = search_live_jobs(title, location)
+        except JobSearchError as e:
+            return jsonify({"success": False, "message": str(e), "jobs": []}), e.status_code
+
+        return jsonify({
+            "success": True,
+            "jobs": score_jobs(final_jobs, skill_weights),
+            "message": f"{len(final_jobs)} iş ilanı bulundu"
+        })
 
     except Exception as e:
         import traceback
@@ -1957,22 +1691,12 @@ def save_missing_skills():
         if not user_id or not skill:
             return jsonify({"success": False, "message": "Eksik parametre"}), 400
 
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "user_id": user_id,
             "skill": skill
         }
 
-        response = requests.post(
-            f"{SUPABASE_API_URL}/rest/v1/missing_skills",
-            headers=headers,
-            json=payload
-        )
+        response = supabase.table("missing_skills").insert(payload, returning=False)
 
         if response.status_code in [200, 201]:
             return jsonify({"success": True, "message": "Eksik bilgi kaydedildi"}), 200
@@ -1986,13 +1710,7 @@ def save_missing_skills():
 @app.route("/api/missing_skills/<user_id>", methods=["GET"])
 def get_missing_skills(user_id):
     try:
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-        url = f"{SUPABASE_API_URL}/rest/v1/missing_skills?user_id=eq.{user_id}"
-
-        response = requests.get(url, headers=headers)
+        response = supabase.table("missing_skills").eq("user_id", user_id).get()
 
         if response.status_code == 200:
             skills = response.json()
@@ -2012,19 +1730,10 @@ def update_skills(user_id):
         if not isinstance(new_skills, list):
             return jsonify({"success": False, "message": "Skills bir liste olmalı"}), 400
 
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json"
-        }
-
-        response = requests.patch(
-            f"{SUPABASE_API_URL}/rest/v1/profiles?id=eq.{user_id}",
-            headers=headers,
-            json={"skills": new_skills}
-        )
+        response = supabase.table("profiles").eq("id", user_id).update({"skills": new_skills}, returning=False)
 
         if response.status_code in [200, 204]:
+            profile_cache.invalidate(user_id=user_id)
             return jsonify({"success": True, "message": "Beceriler güncellendi"}), 200
         else:
             return jsonify({"success": False, "message": response.text}), 400
@@ -2045,16 +1754,6 @@ def save_skill_level():
         if not user_id or not skill or level is None:
             return jsonify({"success": False, "message": "Eksik parametre"}), 400
 
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json",
-            "Prefer": "return=minimal"
-        }
-
-        delete_url = f"{SUPABASE_API_URL}/rest/v1/skill_levels?user_id=eq.{user_id}&skill=eq.{skill}"
-        requests.delete(delete_url, headers=headers)
-
         payload = {
             "user_id": user_id,
             "skill": skill,
@@ -2062,11 +1761,8 @@ def save_skill_level():
             "updated_at": "now()"
         }
 
-        response = requests.post(
-            f"{SUPABASE_API_URL}/rest/v1/skill_levels",
-            headers=headers,
-            json=payload
-        )
+        # Tek istekte ekle ya da güncelle; satırın geçici olarak silindiği an olmaz
+        response = supabase.table("skill_levels").upsert(payload, on_conflict="user_id,skill", returning=False)
 
         if response.status_code in [200, 201]:
             return jsonify({"success": True, "message": "Beceri seviyesi kaydedildi"}), 200
@@ -2081,13 +1777,7 @@ def save_skill_level():
 @app.route("/api/get-skill-levels/<user_id>", methods=["GET"])
 def get_skill_levels(user_id):
     try:
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-
-        url = f"{SUPABASE_API_URL}/rest/v1/skill_levels?user_id=eq.{user_id}"
-        response = requests.get(url, headers=headers)
+        response = supabase.table("skill_levels").eq("user_id", user_id).get()
 
         if response.status_code == 200:
             levels = response.json()
@@ -2102,54 +1792,37 @@ def get_skill_levels(user_id):
 @app.route("/generate-industry-insights/<user_id>", methods=["GET"])
 def generate_industry_insights(user_id):
     try:
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}"
-        }
-
-        profile_resp = requests.get(
-            f"{SUPABASE_API_URL}/rest/v1/profiles?id=eq.{user_id}",
-            headers=headers
-        )
-        profile_data = profile_resp.json()
+        try:
+            user_data = profile_cache.by_id(user_id)
+        except SupabaseError as e:
+            print(f"⚠️ Profil id ile alınamadı ({e.status_code}), user_id ile deneniyor")
+            user_data = None
 
-        if not profile_data:
-            profile_resp = requests.get(
-                f"{SUPABASE_API_URL}/rest/v1/profiles?user_id=eq.{user_id}",
-                headers=headers
-            )
-            profile_data = profile_resp.json()
+        if not user_data:
+            profile_resp = supabase.table("profiles").eq("user_id", user_id).get()
+            profile_data = profile_resp.json() if profile_resp.status_code == 200 else []
+            user_data = profile_data[0] if profile_data else None
 
-        if not profile_data:
+        if not user_data:
             return jsonify({"success": False, "message": "Profil bulunamadı"}), 404
 
-        user_data = profile_data[0]
         job_title = user_data.get("current_title", "bilinmeyen meslek")
 
-        payload = {
-            "contents": [{
-                "parts": [{
-                    "text": f"Kariyer analizi yap. Meslek: {job_title}. "
-                            f"2025 sektörel trendleri, popüler beceriler, "
-                            f"gelecek 3 yıl öngörüleri ve önerilen gelişim alanlarını "
-                            f"3 maddelik kısa bir liste halinde yaz."
-                }]
-            }]
-        }
-
-        gemini_resp = requests.post(
-            GEMINI_API_URL,
-            headers={"Content-Type": "application/json"},
-            params={"key": GEMINI_API_KEY},
-            json=payload
-        )
+        prompt = (f"Kariyer analizi yap. Meslek: {job_title}. "
+                  f"2025 sektörel trendleri, popüler beceriler, "
+                  f"gelecek 3 yıl öngörüleri ve önerilen gelişim alanlarını "
+                  f"3 maddelik kısa bir liste halinde yaz.")
 
-        if gemini_resp.status_code != 200:
+        try:
+            insights = gemini_client.generate(
+                prompt,
+                call_site="industry_insights",
+                cache_ttl=INDUSTRY_INSIGHTS_CACHE_TTL,
+                coalesce=True
+            )
+        except GeminiError:
             return jsonify({"success": False, "message": "Gemini API hatası"}), 500
 
-        llm_output = gemini_resp.json()
-        insights = llm_output.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-
         return jsonify({"success": True, "insights": insights})
 
     except Exception as e:
@@ -2157,16 +1830,17 @@ def generate_industry_insights(user_id):
         return jsonify({"success": False, "message": str(e)}), 500
 
 
-# Enhanced learning module generator
-@app.route("/generate-learning-module", methods=["POST"])
-def generate_learning_module():
-    try:
-        data = request.json
-        topic = data.get("topic", "")
-        if not topic:
-            return jsonify({"success": False, "message": "Eksik konu"}), 400
+LEARNING_MODULE_CONFIG = structured_config("learning_module", {"temperature": 0.3, "maxOutputTokens": 4000})
 
-        prompt = f"""
+# Akış modunda eğitim modülü dizi alanı -> SSE olay adı
+LEARNING_MODULE_STREAM_EVENTS = {
+    "steps": "step",
+    "final_quiz": "quiz",
+}
+
+def build_learning_module_prompt(topic):
+    """Konu için eğitim modülü prompt'u oluştur"""
+    return f"""
         Sen bir uzman eğitmensin. Konu: {topic}
         
         Kullanıcı için detaylı, interaktif ve profesyonel bir eğitim modülü oluştur.
@@ -2178,70 +1852,33 @@ def generate_learning_module():
         - İnteraktif sorular sorun
         - Final testi ekle (3-5 soru)
         
-        JSON formatında döndür:
-        {{
-          "title": "{topic} Uzmanlığı Eğitimi",
-          "description": "Bu modülde {topic} konusunda uzmanlaşacaksınız",
-          "steps": [
-            {{
-              "step": 1,
-              "title": "Temel Kavramlar ve Giriş",
-              "content": "Detaylı anlatım... (HTML formatında, <h4>, <p>, <strong> etiketleri kullanılabilir)",
-              "examples": ["Gerçek dünyadan örnek 1", "Pratik örnek 2"],
-              "interactive_question": "Kullanıcıya sorulacak düşünmeye sevk eden soru",
-              "code_example": "// Kod örneği varsa\\nconsole.log('Merhaba Dünya');"
-            }},
-            {{
-              "step": 2,
-              "title": "Uygulamalı Örnekler",
-              "content": "İleri seviye konular ve pratik uygulamalar",
-              "challenge": "Kullanıcıdan yapılması istenen kodlama görevi veya pratik",
-              "code_example": "Daha karmaşık kod örnekleri"
-            }},
-            {{
-              "step": 3,
-              "title": "İleri Teknikler ve Best Practices",
-              "content": "Profesyonel seviye bilgiler",
-              "examples": ["Industry standard örnekleri"],
-              "interactive_question": "Derinlemesine düşünme sorusu"
-            }}
-          ],
-          "final_quiz": [
-            {{"q": "Bu konuda önemli olan nedir?", "a": ["Seçenek A", "Seçenek B", "Seçenek C"], "correct": "Seçenek B"}},
-            {{"q": "Hangi yaklaşım daha iyidir?", "a": ["Yaklaşım 1", "Yaklaşım 2"], "correct": "Yaklaşım 1"}},
-            {{"q": "Best practice nedir?", "a": ["A yöntemi", "B yöntemi", "C yöntemi"], "correct": "A yöntemi"}}
-          ]
-        }}
-        
         KURAL: Cevapları MUTLAKA gerçekçi ve doğru yap, rastgele seçme!
-        """
+    """
 
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.3,
-                "maxOutputTokens": 4000
-            }
-        }
+# Enhanced learning module generator
+@app.route("/generate-learning-module", methods=["POST"])
+def generate_learning_module():
+    try:
+        data = request.json
+        topic = data.get("topic", "")
+        if not topic:
+            return jsonify({"success": False, "message": "Eksik konu"}), 400
 
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload,
-            timeout=30
-        )
+        prompt = build_learning_module_prompt(topic)
 
-        if response.status_code != 200:
+        try:
+            module_data = gemini_client.generate(
+                prompt,
+                LEARNING_MODULE_CONFIG,
+                call_site="learning_module",
+                cache_ttl=LEARNING_MODULE_CACHE_TTL,
+                coalesce=True,
+                parse=lambda text: parse_response("learning_module", text)
+            )
+        except GeminiError:
             return jsonify({"success": False, "message": "AI yanıt hatası"}), 500
-
-        ai_text = response.json()['candidates'][0]['content']['parts'][0]['text']
-        
-        import re
-        json_match = re.search(r'\{.*\}', ai_text, re.DOTALL)
-        if not json_match:
+        except ValueError:
             return jsonify({"success": False, "message": "JSON formatı bulunamadı"}), 500
-
-        module_data = json.loads(json_match.group(0))
         return jsonify({"success": True, "data": module_data})
 
     except Exception as e:
@@ -2251,8 +1888,39 @@ def generate_learning_module():
             "message": f"Server hatası: {str(e)}"
         }), 500
 
+# Learning module streaming (SSE)
+@app.route("/generate-learning-module/stream", methods=["POST"])
+def generate_learning_module_stream():
+    """Eğitim modülünü adım adım akıt"""
+    data = request.json or {}
+    topic = data.get("topic", "")
+    if not topic:
+        return jsonify({"success": False, "message": "Eksik konu"}), 400
 
-import re, json, traceback
+    prompt = build_learning_module_prompt(topic)
+
+    def generate():
+        parser = IncrementalJSONParser(LEARNING_MODULE_STREAM_EVENTS.keys())
+        try:
+            for chunk in gemini_client.stream_generate(prompt, LEARNING_MODULE_CONFIG,
+                                                       call_site="learning_module",
+                                                       cache_ttl=LEARNING_MODULE_CACHE_TTL,
+                                                       validate=lambda text: parse_response("learning_module", text)):
+                for key, item in parser.feed(chunk):
+                    yield sse_event(LEARNING_MODULE_STREAM_EVENTS[key], item)
+            module_data = parser.result()
+            validate(module_data, RESPONSE_SCHEMAS["learning_module"])
+            yield sse_event("module", module_data)
+        except GeminiError as e:
+            print("generate_learning_module_stream hatası:", e.body or e)
+            yield sse_event("error", {"message": "AI yanıt hatası"})
+        except ValueError:
+            yield sse_event("error", {"message": "JSON formatı bulunamadı"})
+
+    return sse_response(generate())
+
+
+import json, traceback
 
 @app.route("/evaluate-answer", methods=["POST"])
 def evaluate_answer():
@@ -2270,44 +1938,24 @@ def evaluate_answer():
         Soru: {question}
         Öğrenci Cevabı: {answer}
 
-        Bu cevabı değerlendir. 
-        Sadece aşağıdaki formatta geçerli bir JSON döndür, başka hiçbir şey yazma:
-        {{
-          "correct": true/false,
-          "feedback": "Detaylı ve yapıcı geri bildirim",
-          "score": 0-10
-        }}
+        Bu cevabı değerlendir; 0-10 arası puan ve detaylı, yapıcı geri bildirim ver.
         """
 
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.3,
-                "maxOutputTokens": 500
-            }
-        }
-
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload,
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            return jsonify({"success": False, "message": "AI değerlendirme hatası"}), response.status_code
-
-        ai_text = response.json()['candidates'][0]['content']['parts'][0]['text']
-        clean_text = re.sub(r'```(json)?', '', ai_text).strip()
-        json_match = re.search(r'\{.*\}', clean_text, re.DOTALL)
-
-        if not json_match:
-            return jsonify({"success": False, "message": "Değerlendirme formatı bulunamadı"}), 500
-
         try:
-            evaluation_data = json.loads(json_match.group(0))
+            ai_text = gemini_client.generate(
+                prompt,
+                structured_config("evaluate_answer", {"temperature": 0.3, "maxOutputTokens": 500}),
+                call_site="evaluate_answer"
+            )
+        except GeminiError as e:
+            status_code = e.status_code if e.status_code and e.status_code >= 400 else 500
+            return jsonify({"success": False, "message": "AI değerlendirme hatası"}), status_code
+        try:
+            evaluation_data = parse_response("evaluate_answer", ai_text)
         except json.JSONDecodeError as e:
             return jsonify({"success": False, "message": f"JSON parse hatası: {str(e)}"}), 500
+        except ValueError:
+            return jsonify({"success": False, "message": "Değerlendirme formatı bulunamadı"}), 500
 
         return jsonify({"success": True, "data": evaluation_data})
 
@@ -2335,42 +1983,22 @@ def evaluate_challenge():
         Görev: {challenge}
         Öğrenci Çözümü: {solution}
         
-        Bu çözümü incele ve detaylı geri bildirim ver.
-        
-        JSON formatında döndür:
-        {{
-          "score": 1-10 arası puan,
-          "review": "Detaylı inceleme ve değerlendirme",
-          "suggestions": "İyileştirme önerileri"
-        }}
+        Bu çözümü incele, 1-10 arası puanla ve detaylı geri bildirim ver.
         """
 
-        gemini_payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.3,
-                "maxOutputTokens": 1500
-            }
-        }
-
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload,
-            timeout=30
-        )
-
-        if response.status_code != 200:
+        try:
+            ai_text = gemini_client.generate(
+                prompt,
+                structured_config("evaluate_challenge", {"temperature": 0.3, "maxOutputTokens": 1500}),
+                call_site="evaluate_challenge"
+            )
+        except GeminiError:
             return jsonify({"success": False, "message": "AI inceleme hatası"}), 500
-
-        ai_text = response.json()['candidates'][0]['content']['parts'][0]['text']
         
-        import re
-        json_match = re.search(r'\{.*\}', ai_text, re.DOTALL)
-        if not json_match:
+        try:
+            review_data = parse_response("evaluate_challenge", ai_text)
+        except ValueError:
             return jsonify({"success": False, "message": "İnceleme formatı bulunamadı"}), 500
-
-        review_data = json.loads(json_match.group(0))
         return jsonify({"success": True, "data": review_data})
         
     except Exception as e:
@@ -2392,24 +2020,6 @@ def complete_skill():
         
         if not all([user_id, skill]):
             return jsonify({"success": False, "message": "User ID ve skill gerekli"}), 400
-        
-        headers = {
-            "apikey": SUPABASE_API_KEY,
-            "Authorization": f"Bearer {SUPABASE_API_KEY}",
-            "Content-Type": "application/json",
-            "Prefer": "return=representation"
-        }
-        
-        
-        delete_response = requests.delete(
-            f"{SUPABASE_API_URL}/rest/v1/missing_skills?user_id=eq.{user_id}&skill=eq.{skill}",
-            headers=headers
-        )
-        
-        if delete_response.status_code not in [200, 204]:
-            print("Missing skill silme hatası:", delete_response.text)
-        
-        
         from datetime import datetime
         completed_skill_data = {
             "user_id": user_id,
@@ -2418,11 +2028,9 @@ def complete_skill():
             "completed_at": datetime.now().isoformat()
         }
         
-        insert_response = requests.post(
-            f"{SUPABASE_API_URL}/rest/v1/completed_skills",
-            headers=headers,
-            json=completed_skill_data
-        )
+        # Önce tamamlanan beceri yazılır, eksik beceri ancak sonra silinir; böylece
+        # beceri hiçbir an iki tabloda da yok olmaz ve istek güvenle tekrarlanabilir
+        insert_response = supabase.table("completed_skills").upsert(completed_skill_data, on_conflict="user_id,skill")
         
         if insert_response.status_code not in [200, 201]:
             return jsonify({
@@ -2430,6 +2038,11 @@ def complete_skill():
                 "message": f"Tamamlanan skill ekleme hatası: {insert_response.text}"
             }), 500
         
+        delete_response = supabase.table("missing_skills").eq("user_id", user_id).eq("skill", skill).delete()
+        
+        if delete_response.status_code not in [200, 204]:
+            print("Missing skill silme hatası:", delete_response.text)
+        
         return jsonify({
             "success": True,
             "message": "Skill başarıyla tamamlandı",
@@ -2476,120 +2089,57 @@ KULLANICI BİLGİLERİ:
 KIŞILIK TESTİ YANITLARI:
 {json.dumps(responses, ensure_ascii=False, indent=2)}
 
-Lütfen aşağıdaki formatta JSON yanıtı ver:
-
-{{
-    "personality_overview": "Kişilik tipinin genel açıklaması ve bu kullanıcıya özgü yorumlar",
-    "personality_traits": [
-        {{
-            "name": "Özellik Adı",
-            "score": 85,
-            "description": "Bu özelliğin kullanıcıdaki yansıması"
-        }}
-    ],
-    "career_fit": {{
-        "suitable_careers": ["Kariyer 1", "Kariyer 2", "Kariyer 3"],
-        "explanation": "Neden bu kariyerler uygun olduğunun açıklaması"
-    }},
-    "strengths": [
-        {{
-            "title": "Güçlü Yön Başlığı",
-            "description": "Detaylı açıklama"
-        }}
-    ],
-    "development_areas": [
-        {{
-            "title": "Gelişim Alanı Başlığı", 
-            "description": "Nasıl geliştirilebileceği"
-        }}
-    ],
-    "recommendations": [
-        {{
-            "category": "Kariyer Gelişimi",
-            "suggestion": "Önerinin açıklaması",
-            "action_items": ["Yapılacak 1", "Yapılacak 2"]
-        }}
-    ]
-}}
-
 Analizi Türkçe yap ve kullanıcının mevcut durumunu dikkate alarak kişiselleştirilmiş öneriler sun.
 """
 
         print(f"🧠 {first_name} için kişilik analizi yapılıyor...")
         
         # Gemini API ile analiz yap
-        gemini_payload = {
-            "contents": [{
-                "parts": [{
-                    "text": analysis_prompt
-                }]
-            }],
-            "generationConfig": {
-                "temperature": 0.7,
-                "topK": 40,
-                "topP": 0.95,
-                "maxOutputTokens": 2048,
-            }
-        }
-        
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers={"Content-Type": "application/json"},
-            json=gemini_payload
-        )
-        
-        if response.status_code != 200:
-            print("Gemini API hatası:", response.text)
+        try:
+            content = gemini_client.generate(
+                analysis_prompt,
+                structured_config("personality_analysis",
+                                  {"temperature": 0.7, "topK": 40, "topP": 0.95, "maxOutputTokens": 2048}),
+                call_site="personality_analysis"
+            )
+        except GeminiError as e:
+            print("Gemini API hatası:", e.body or e)
+            if e.status_code == 200:
+                message = "LLM'den geçerli yanıt alınamadı"
+            else:
+                message = f"LLM analizi başarısız: {e.body or e}"
             return jsonify({
                 "success": False,
-                "message": f"LLM analizi başarısız: {response.text}"
+                "message": message
             }), 500
-            
-        result = response.json()
+
         print("✅ Gemini yanıtı alındı")
-        
-        # Gemini yanıtından metni çıkar
-        if 'candidates' in result and len(result['candidates']) > 0:
-            content = result['candidates'][0]['content']['parts'][0]['text']
-            
-            # JSON formatındaki yanıtı parse et
-            try:
-                # JSON kısmını bul ve parse et
-                json_start = content.find('{')
-                json_end = content.rfind('}') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_content = content[json_start:json_end]
-                    analysis_result = json.loads(json_content)
-                    
-                    print(f"📊 {first_name} için analiz tamamlandı")
-                    return jsonify({
-                        "success": True,
-                        **analysis_result
-                    })
-                else:
-                    raise ValueError("JSON formatı bulunamadı")
-                    
-            except (json.JSONDecodeError, ValueError) as e:
-                print("JSON parse hatası:", e)
-                print("Ham içerik:", content)
-                
-                # Fallback: Ham metni döndür
-                return jsonify({
-                    "success": True,
-                    "personality_overview": content,
-                    "personality_traits": [],
-                    "career_fit": {"suitable_careers": [], "explanation": ""},
-                    "strengths": [],
-                    "development_areas": [],
-                    "recommendations": []
-                })
-        else:
+
+        # JSON formatındaki yanıtı parse et
+        try:
+            analysis_result = parse_response("personality_analysis", content)
+
+            print(f"📊 {first_name} için analiz tamamlandı")
             return jsonify({
-                "success": False,
-                "message": "LLM'den geçerli yanıt alınamadı"
-            }), 500
-            
+                "success": True,
+                **analysis_result
+            })
+
+        except (json.JSONDecodeError, ValueError) as e:
+            print("JSON parse hatası:", e)
+            print("Ham içerik:", content)
+
+            # Fallback: Ham metni döndür
+            return jsonify({
+                "success": True,
+                "personality_overview": content,
+                "personality_traits": [],
+                "career_fit": {"suitable_careers": [], "explanation": ""},
+                "strengths": [],
+                "development_areas": [],
+                "recommendations": []
+            })
+
     except Exception as e:
         print("personality_analysis hatası:", traceback.format_exc())
         return jsonify({
@@ -0,0 +1,375 @@
+"""
+KariyerAI - İş İlanı Sayfa Toplayıcı
+/api/jobs için iş ilanı sayfalarını eşzamanlı, alan adı bazında nazik ve
+toplam süre sınırlı şekilde indirir. Çıkarılan alanlar URL bazında önbelleğe
+alınır ve süresi dolunca ETag/Last-Modified ile yeniden doğrulanır.
+Sayfalar akış halinde, bayt sınırıyla okunur; gerekli alanlar toplanınca
+okuma durdurulur.
+"""
+import codecs
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml yoksa standart kütüphanedeki html.parser kullanılır
+    lxml_etree = None
+
+# Aynı anda indirilebilecek toplam sayfa sayısı
+GLOBAL_CONCURRENCY = 6
+
+# Sayfa başına zaman aşımı (connect, read) ve tüm aşama için süre sınırı (saniye)
+PAGE_TIMEOUT = (4, 8)
+STAGE_DEADLINE = 12
+
+# Alan adı başına (eşzamanlı istek, iki istek başlangıcı arası minimum saniye)
+DOMAIN_LIMITS = {
+    "kariyer.net": (2, 0.5),
+    "secretcv.com": (2, 0.5),
+    "yenibiris.com": (2, 0.5),
+    "indeed.com": (1, 1.0),
+    "glassdoor.com": (1, 1.0),
+    "linkedin.com": (1, 1.0),
+}
+DEFAULT_DOMAIN_LIMIT = (2, 0.5)
+
+# Çıkarılan sayfa alanlarının yeniden doğrulamadan kullanılacağı süre (saniye)
+PAGE_CACHE_TTL = 6 * 3600
+PAGE_CACHE_SIZE = 1024
+
+# Sayfa başına okunacak en fazla bayt ve AI'a gidecek gövde metni uzunluğu
+MAX_PAGE_BYTES = 512 * 1024
+BODY_SNIPPET_CHARS = 1000
+CHUNK_SIZE = 16 * 1024
+
+# Metni gövde özetine alınmayan etiketler
+SKIP_TAGS = ("script", "style", "noscript", "template", "svg")
+HEADING_TAGS = ("h1", "h2", "h3")
+
+# Content-Type'ta charset yoksa kodlama sayfanın başındaki <meta> etiketinden okunur
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+META_SNIFF_BYTES = 2048
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+
+def domain_of(url: str) -> str:
+    """URL'nin kayıtlı alan adını döndür (www. olmadan)"""
+    host = (urlparse(url).hostname or "").lower()
+    for domain in DOMAIN_LIMITS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainThrottle:
+    """Alan adı başına eşzamanlılık ve istek aralığı sınırı"""
+
+    def __init__(self, limits: Dict[str, tuple], default: tuple):
+        self.limits = limits
+        self.default = default
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _limit(self, domain: str) -> tuple:
+        return self.limits.get(domain, self.default)
+
+    def acquire(self, domain: str) -> None:
+        """Alan adı için slot al, gerekirse minimum aralık kadar bekle"""
+        concurrency, interval = self._limit(domain)
+        with self._lock:
+            semaphore = self._semaphores.setdefault(domain, threading.Semaphore(concurrency))
+        semaphore.acquire()
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(domain, now))
+            self._next_start[domain] = start_at + interval
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self, domain: str) -> None:
+        self._semaphores[domain].release()
+
+
+def _squash(text: str) -> str:
+    return " ".join(text.split())
+
+
+class FieldExtractor(HTMLParser):
+    """Başlık, h1-h3 ve sınırlı gövde metnini toplayan artımlı HTML tarayıcı
+
+    Gövde metni max_chars'ta kesilir ama alt başlıklar sayfa boyunca
+    toplanmaya devam eder; complete ancak </body> görülünce True olur.
+    """
+
+    def __init__(self, max_chars: int = BODY_SNIPPET_CHARS):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.title: List[str] = []
+        self.headings: List[str] = []
+        self.body: List[str] = []
+        self.body_chars = 0
+        self._in_title = False
+        self._in_body = False
+        self._body_closed = False
+        self._heading: Optional[List[str]] = None
+        self._skip_depth = 0
+
+    @property
+    def complete(self) -> bool:
+        return self._body_closed
+
+    @property
+    def snippet_full(self) -> bool:
+        return self.body_chars >= self.max_chars
+
+    def handle_starttag(self, tag, attrs):
+        self._break_text()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "body":
+            self._in_body = True
+        elif tag in HEADING_TAGS:
+            self._heading = []
+
+    def handle_endtag(self, tag):
+        self._break_text()
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif tag in ("body", "html"):
+            self._in_body = False
+            self._body_closed = True
+        elif tag in HEADING_TAGS and self._heading is not None:
+            self.headings.append(_squash("".join(self._heading)))
+            self._heading = None
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self.title.append(data)
+            return
+        if self._heading is not None:
+            self._heading.append(data)
+        if self._in_body and not self.snippet_full:
+            self.body.append(data)
+            self.body_chars += len(data)
+
+    def _break_text(self):
+        # Etiket sınırları kelimeleri ayırır; aynı düğümün parçaları birleşik kalır
+        if self.body and self.body[-1] != " " and not self.snippet_full:
+            self.body.append(" ")
+
+    def fields(self) -> Dict[str, str]:
+        return {
+            "title_tag": _squash("".join(self.title)),
+            "headings": " ".join(h for h in self.headings if h),
+            "body_snippet": _squash("".join(self.body))[:self.max_chars],
+        }
+
+
+class _LxmlTarget:
+    """lxml ayrıştırıcı olaylarını FieldExtractor'a aktaran hedef nesne"""
+
+    def __init__(self, extractor: FieldExtractor):
+        self.extractor = extractor
+
+    def start(self, tag, attrib):
+        self.extractor.handle_starttag(tag, attrib)
+
+    def end(self, tag):
+        self.extractor.handle_endtag(tag)
+
+    def data(self, data):
+        self.extractor.handle_data(data)
+
+    def close(self):
+        return None
+
+
+def _sniff_encoding(head: bytes) -> Optional[str]:
+    """Sayfa başındaki <meta charset> bildirimini döndür (geçersizse None)"""
+    match = _META_CHARSET_RE.search(head[:META_SNIFF_BYTES])
+    if not match:
+        return None
+    name = match.group(1).decode("ascii")
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+
+def extract_fields(chunks: Iterable[bytes], encoding: Optional[str] = None,
+                   max_bytes: int = MAX_PAGE_BYTES, max_chars: int = BODY_SNIPPET_CHARS) -> Dict[str, str]:
+    """HTML parçalarından başlık, alt başlıklar ve gövde özetini çıkar
+
+    Parçalar akış halinde ayrıştırıcıya verilir (lxml varsa C
+    ayrıştırıcısına, yoksa html.parser'a). Gövde özeti max_chars'ta
+    dolsa da sonraki h1-h3'ler için okuma </body>'ye ya da max_bytes'a
+    kadar sürer. encoding verilmezse <meta charset>, o da yoksa UTF-8
+    kullanılır.
+    """
+    extractor = FieldExtractor(max_chars)
+    parser = feed = None
+    read = 0
+    for chunk in chunks:
+        chunk = chunk[:max_bytes - read]
+        if chunk and feed is None:
+            page_encoding = encoding or _sniff_encoding(chunk) or "utf-8"
+            if lxml_etree is not None:
+                parser = lxml_etree.HTMLParser(target=_LxmlTarget(extractor), encoding=page_encoding)
+                feed = parser.feed
+            else:
+                decoder = codecs.getincrementaldecoder(page_encoding)(errors="replace")
+                feed = lambda data: extractor.feed(decoder.decode(data))
+        read += len(chunk)
+        if chunk:
+            feed(chunk)
+        if extractor.complete or read >= max_bytes:
+            break
+    if parser is not None:
+        # Ayrıştırıcıda bekleyen son metni de hedefe aktar
+        try:
+            parser.close()
+        except lxml_etree.LxmlError:
+            pass
+    return extractor.fields()
+
+
+class PageCache:
+    """URL -> çıkarılmış sayfa alanları için LRU önbellek
+
+    Süresi dolan kayıtlar silinmez; ETag/Last-Modified bilgisiyle koşullu
+    istek atılabilmesi için LRU tahliyesine kadar tutulur.
+    """
+
+    def __init__(self, ttl: int = PAGE_CACHE_TTL, max_entries: int = PAGE_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # url -> {expires_at, page, etag, last_modified}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Kaydı (süresi dolmuş olsa bile) döndür, yoksa None"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url: str, page: Dict[str, str], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Sayfa alanlarını doğrulayıcılarıyla birlikte sakla"""
+        with self._lock:
+            self._entries[url] = {
+                "expires_at": time.time() + self.ttl,
+                "page": page,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def touch(self, url: str) -> None:
+        """304 yanıtından sonra kaydın süresini yenile"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                entry["expires_at"] = time.time() + self.ttl
+
+
+class JobPageScraper:
+    """İş ilanı sayfalarını paralel indirip AI için özet çıkarır"""
+
+    def __init__(self, concurrency: int = GLOBAL_CONCURRENCY, cache: Optional[PageCache] = None):
+        self.concurrency = concurrency
+        self.cache = cache if cache is not None else PageCache()
+        self.throttle = DomainThrottle(DOMAIN_LIMITS, DEFAULT_DOMAIN_LIMIT)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(DOMAIN_LIMITS) + 4, pool_maxsize=concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(HEADERS)
+
+    def fetch_page(self, url: str) -> Optional[Dict[str, str]]:
+        """Sayfanın başlık, alt başlık ve gövde özetini önbellekten ya da ağdan getir"""
+        cached = self.cache.get(url)
+        if cached and cached["expires_at"] > time.time():
+            return cached["page"]
+
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        domain = domain_of(url)
+        self.throttle.acquire(domain)
+        try:
+            response = self.session.get(url, headers=headers, timeout=PAGE_TIMEOUT, stream=True)
+            try:
+                if response.status_code == 304 and cached:
+                    self.cache.touch(url)
+                    return cached["page"]
+                if response.status_code != 200:
+                    return None
+                encoding = response.encoding if "charset" in response.headers.get("Content-Type", "").lower() else None
+                page = extract_fields(response.iter_content(CHUNK_SIZE), encoding)
+            finally:
+                response.close()
+        finally:
+            self.throttle.release(domain)
+
+        self.cache.set(url, page, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return page
+
+    def scrape(self, job_links: List[Dict[str, str]], deadline: float = STAGE_DEADLINE) -> List[Dict[str, str]]:
+        """Tüm linkleri eşzamanlı indir; süre dolunca eldeki sonuçlarla dön
+
+        Sonuçlar job_links sırasını korur. İndirilemeyen veya süre sınırına
+        yetişmeyen sayfalar için yalnızca arama snippet'i kullanılır.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        futures = {executor.submit(self.fetch_page, link['url']): i for i, link in enumerate(job_links)}
+        wait(futures, timeout=deadline)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        pages = [None] * len(job_links)
+        for future, index in futures.items():
+            url = job_links[index]['url']
+            if not future.done() or future.cancelled():
+                print(f"   ⏱️ Süre sınırı aşıldı, snippet kullanılacak: {url}")
+            elif future.exception() is not None:
+                print(f"   ⚠️ Scraping başarısız, snippet kullanılacak: {url}")
+            else:
+                pages[index] = future.result()
+                if pages[index]:
+                    print(f"   ✅ Sayfa bilgileri alındı: {url}")
+
+        job_data = []
+        for job_link, page in zip(job_links, pages):
+            page = page or {"title_tag": "", "headings": "", "body_snippet": ""}
+            job_data.append({
+                "url": job_link['url'],
+                **page,
+                "search_title": job_link['title'],
+                "search_snippet": job_link['snippet']
+            })
+        return job_data
@@ -0,0 +1,177 @@
+"""
+KariyerAI - SerpAPI İş İlanı Araması
+SerpAPI organic_results yanıtlarını normalize (başlık, konum, sorgu tipi)
+anahtarıyla kendi önbelleğinde saklar ve site filtresi sonuçlarını hatırlar.
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from job_store import search_key
+
+SERP_URL = "https://serpapi.com/search"
+
+# İş ilanları saatler mertebesinde değişir
+SERP_CACHE_TTL = 3 * 3600
+
+JOB_SITES = [
+    "kariyer.net",
+    "secretcv.com",
+    "yenibiris.com",
+    "indeed.com",
+    "glassdoor.com",
+    "linkedin.com/jobs"
+]
+
+# Arama/listeleme sayfalarını eleyen kelimeler
+BAD_LINK_KEYWORDS = ["search", "jobs", "listing", "browse", "filter"]
+
+
+class SerpResultCache:
+    """SerpAPI sonuçları için TTL ve LRU tahliyeli, isteğe bağlı SQLite kalıcı önbellek
+
+    Değerler JSON'a çevrilebilir nesnelerdir; bellekte çözülmüş halde tutulur.
+    LLM yanıt önbelleğinden ayrı tutulur, böylece süreleri ve tahliyeleri
+    birbirini etkilemez.
+    """
+
+    def __init__(self, max_entries: int = 256, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS serp_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("DELETE FROM serp_cache WHERE expires_at < ?", (time.time(),))
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Süresi dolmamış kaydı döndür, yoksa None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value, expires_at FROM serp_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row or row[1] <= now:
+                return None
+            value = json.loads(row[0])
+            self._remember(key, row[1], value)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Kaydı verilen süre (saniye) boyunca sakla"""
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO serp_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), expires_at),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _link_entry(result: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "url": result.get("link", ""),
+        "title": result.get("title", ""),
+        "snippet": result.get("snippet", "")
+    }
+
+
+class SerpJobSearch:
+    """Önbellekli SerpAPI iş ilanı link araması"""
+
+    def __init__(self, api_key: str, cache_ttl: int = SERP_CACHE_TTL,
+                 max_entries: int = 256, db_path: Optional[str] = None):
+        self.api_key = api_key
+        self.cache_ttl = cache_ttl
+        self.cache = SerpResultCache(max_entries=max_entries, db_path=db_path)
+        self.session = requests.Session()
+
+    @staticmethod
+    def build_query(title: str, location: str, variant: str) -> str:
+        """Sorgu tipine göre Google arama sorgusunu oluştur"""
+        if variant == "broad":
+            return f'"{title}" {location} site:kariyer.net OR site:secretcv.com'
+        return f'"{title}" job opening {location} ' + " OR ".join(f"site:{site}" for site in JOB_SITES)
+
+    def organic_results(self, title: str, location: str, variant: str = "primary") -> List[Dict[str, Any]]:
+        """Sorgunun organic_results listesini önbellekten ya da SerpAPI'den getir"""
+        key = f"serp|{variant}|{search_key(title, location)}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"📌 SerpAPI önbellekten yanıtlandı ({variant})")
+            return cached
+
+        params = {
+            "engine": "google",
+            "q": self.build_query(title, location, variant),
+            "num": 25,
+            "api_key": self.api_key
+        }
+        resp = self.session.get(SERP_URL, params=params, timeout=10)
+        data = resp.json()
+        results = data.get("organic_results", [])
+        if resp.status_code == 200 and "error" not in data:
+            self.cache.set(key, results, self.cache_ttl)
+        return results
+
+    def find_job_links(self, title: str, location: str) -> List[Dict[str, str]]:
+        """Tekil iş ilanı linklerini bul; gerekirse geniş sorguya düş
+
+        Birincil sorgunun site bazında kaç link geçirdiği saklanır. Önceki
+        arama hiçbir sitenin link geçirmediğini gösterdiyse birincil sorgu
+        atlanıp doğrudan geniş sorgu kullanılır.
+        """
+        outcome_key = f"filter|{search_key(title, location)}"
+        outcome = self.cache.get(outcome_key)
+        job_links = []
+
+        if outcome is not None and not any(outcome.values()):
+            print("📌 Önceki aramada site filtresi boş döndü, doğrudan geniş arama yapılıyor")
+        else:
+            passed = {site: 0 for site in JOB_SITES}
+            for result in self.organic_results(title, location, "primary")[:8]:
+                link = result.get("link", "")
+                if not link or any(bad in link.lower() for bad in BAD_LINK_KEYWORDS):
+                    continue
+                site = next((site for site in JOB_SITES if site in link), None)
+                if site:
+                    passed[site] += 1
+                    job_links.append(_link_entry(result))
+            self.cache.set(outcome_key, passed, self.cache_ttl)
+            if not job_links:
+                print("❌ Tek iş ilanı linki bulunamadı, geniş arama yapılıyor...")
+
+        if not job_links:
+            for result in self.organic_results(title, location, "broad")[:6]:
+                if result.get("link"):
+                    job_links.append(_link_entry(result))
+
+        return job_links
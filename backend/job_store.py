@@ -0,0 +1,176 @@
+"""
+KariyerAI - Yerel İş İlanı Deposu
+AI ile yapılandırılmış iş ilanlarını SQLite'ta saklar; başlık ve konum
+terimleriyle ters indeksten arar, adayları kullanıcının becerileriyle
+örtüşen gereksinim terimlerine göre sıralar.
+"""
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from skill_matcher import normalize_skill
+
+# Bir aramanın taze sayılacağı süre (saniye); sonrasında arka planda yenilenir
+SEARCH_TTL = 6 * 3600
+
+# Tek başına aramayı daraltmayan genel unvan terimleri; find() bunları eşleştirmez
+GENERIC_TITLE_TERMS = frozenset({
+    "engineer", "developer", "specialist", "expert", "senior", "junior", "sr", "jr", "mid",
+    "lead", "intern", "staff", "principal", "associate", "assistant", "manager",
+    "mühendis", "mühendisi", "mühendislik", "geliştirici", "geliştiricisi", "uzman", "uzmanı",
+    "kıdemli", "stajyer", "yardımcı", "yardımcısı", "sorumlu", "sorumlusu",
+    "and", "of", "the", "ve", "ile",
+})
+
+_TOKEN_RE = re.compile(r"[^\W_]+(?:[+#.][^\W_]*)*", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni küçük harfli, tekrarsız terimlere ayır"""
+    if not text:
+        return []
+    text = text.replace("İ", "i").lower()
+    seen = []
+    for token in _TOKEN_RE.findall(text):
+        token = token.strip(".")
+        if token and token not in seen:
+            seen.append(token)
+    return seen
+
+
+def search_key(title: str, location: str) -> str:
+    """Başlık ve konumdan normalize arama anahtarı üret"""
+    return " ".join(tokenize(title)) + "|" + " ".join(tokenize(location))
+
+
+class JobStore:
+    """İş ilanları için SQLite deposu ve ters indeks"""
+
+    def __init__(self, db_path: str, search_ttl: int = SEARCH_TTL):
+        self.search_ttl = search_ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                url TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_terms (
+                field TEXT NOT NULL,
+                term TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (field, term, url)
+            );
+            CREATE INDEX IF NOT EXISTS job_terms_url ON job_terms (url);
+            CREATE TABLE IF NOT EXISTS searches (
+                query_key TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL
+            );
+        """)
+        self._db.commit()
+
+    def save_jobs(self, title: str, location: str, jobs: List[Dict[str, Any]]) -> None:
+        """Arama sonucu ilanları kaydet ve indeksle"""
+        now = time.time()
+        with self._lock:
+            for job in jobs:
+                url = job.get("url")
+                if not url:
+                    continue
+                self._db.execute(
+                    "INSERT OR REPLACE INTO jobs (url, data, updated_at) VALUES (?, ?, ?)",
+                    (url, json.dumps(job, ensure_ascii=False), now),
+                )
+                self._db.execute("DELETE FROM job_terms WHERE url = ?", (url,))
+                rows = [("title", term, url) for term in tokenize(job.get("title", ""))]
+                rows += [("location", term, url) for term in tokenize(job.get("location_city", ""))]
+                rows += [("skill", normalize_skill(skill), url)
+                         for skill in job.get("requirements", []) if isinstance(skill, str) and normalize_skill(skill)]
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO job_terms (field, term, url) VALUES (?, ?, ?)", rows
+                )
+            self._db.execute(
+                "INSERT OR REPLACE INTO searches (query_key, fetched_at) VALUES (?, ?)",
+                (search_key(title, location), now),
+            )
+            self._db.commit()
+
+    def find(self, title: str, location: str = "", limit: int = 20,
+             skill_weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """Başlığın ayırt edici terimlerinin tamamını (ve varsa konumu) içeren ilanları döndür
+
+        Genel unvan terimleri (GENERIC_TITLE_TERMS) yok sayılır; başlıkta
+        ayırt edici terim kalmazsa eşleşme yapılmaz. skill_weights (kanonik
+        beceri -> ağırlık) verilirse adaylar gereksinim terimlerinin toplam
+        ağırlığına göre, eşitlikte yeniden eskiye sıralanır.
+        """
+        title_terms = [term for term in tokenize(title) if term not in GENERIC_TITLE_TERMS]
+        if not title_terms:
+            return []
+        clauses = []
+        params: List[Any] = []
+        for field, terms in (("title", title_terms), ("location", tokenize(location))):
+            for term in terms:
+                clauses.append("SELECT url FROM job_terms WHERE field = ? AND term = ?")
+                params.extend([field, term])
+        candidates = " INTERSECT ".join(clauses)
+
+        weights = [(skill, weight) for skill, weight in (skill_weights or {}).items() if weight > 0]
+        if weights:
+            query = (
+                "WITH weights (term, weight) AS (VALUES " + ", ".join(["(?, ?)"] * len(weights)) + ") "
+                "SELECT jobs.data FROM jobs "
+                "LEFT JOIN job_terms ON job_terms.url = jobs.url AND job_terms.field = 'skill' "
+                "LEFT JOIN weights ON weights.term = job_terms.term "
+                "WHERE jobs.url IN (" + candidates + ") "
+                "GROUP BY jobs.url ORDER BY COALESCE(SUM(weights.weight), 0) DESC, jobs.updated_at DESC LIMIT ?"
+            )
+            params = [value for pair in weights for value in pair] + params
+        else:
+            query = (
+                "SELECT data FROM jobs WHERE url IN (" + candidates + ") "
+                "ORDER BY updated_at DESC LIMIT ?"
+            )
+        with self._lock:
+            rows = self._db.execute(query, (*params, limit)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def is_stale(self, title: str, location: str = "") -> bool:
+        """Bu arama hiç yapılmadıysa ya da süresi dolduysa True"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fetched_at FROM searches WHERE query_key = ?", (search_key(title, location),)
+            ).fetchone()
+        return row is None or time.time() - row[0] > self.search_ttl
+
+
+class JobRefresher:
+    """Eskimiş aramaları arka planda yeniler, aynı aramayı iki kez başlatmaz"""
+
+    def __init__(self, refresh_fn):
+        self.refresh_fn = refresh_fn
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def schedule(self, title: str, location: str) -> bool:
+        """Aynı arama zaten yenilenmiyorsa arka plan yenilemesi başlat"""
+        key = search_key(title, location)
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+        threading.Thread(target=self._run, args=(key, title, location), daemon=True).start()
+        return True
+
+    def _run(self, key: str, title: str, location: str) -> None:
+        try:
+            self.refresh_fn(title, location)
+        except Exception as e:
+            print(f"⚠️ İş ilanı yenileme hatası ({title} - {location}): {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
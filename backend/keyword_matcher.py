@@ -0,0 +1,71 @@
+"""
+KariyerAI - Çoklu Anahtar Kelime Eşleştirici
+Tüm kategori anahtar kelimelerini tek bir Aho-Corasick otomatında toplar;
+bir metindeki bütün kategori eşleşmeleri metnin uzunluğunda tek geçişte
+bulunur.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional
+
+
+class KeywordMatcher:
+    """Alt dize (substring) anlamında çalışan Aho-Corasick anahtar kelime otomatı
+
+    groups: etiket -> anahtar kelimeler. scan(metin) metinde anahtar
+    kelimelerinden en az biri geçen etiketlerin kümesini döndürür.
+    """
+
+    def __init__(self, groups: Dict[Hashable, Iterable[str]], cache_size: int = 4096):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[Hashable]] = [frozenset()]
+
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                self._add(keyword.replace("İ", "i").lower(), label)
+        self._build_failure_links()
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _add(self, keyword: str, label: Hashable) -> None:
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(frozenset())
+            state = next_state
+        self._out[state] = self._out[state] | {label}
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] | self._out[self._fail[next_state]]
+
+    def _scan(self, text: str) -> FrozenSet[Hashable]:
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        hits = set()
+        for ch in (text or "").replace("İ", "i").lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return frozenset(hits)
+
+    def first(self, text: str, labels: Iterable[Hashable]) -> Optional[Hashable]:
+        """labels sırasına göre metinde eşleşen ilk etiketi döndür"""
+        hits = self.scan(text)
+        return next((label for label in labels if label in hits), None)
@@ -0,0 +1,257 @@
+"""
+KariyerAI - Gemini LLM İstemcisi
+Tüm Gemini çağrıları bu modüldeki tek, bağlantı havuzlu istemci üzerinden yapılır.
+"""
+from typing import Dict, Any, Optional, Callable, Iterator
+import json
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from llm_cache import LLMResponseCache, make_cache_key
+
+# Bağlantı kurma süresi (saniye) - TLS el sıkışması dahil
+CONNECT_TIMEOUT = 5
+
+# Çağrı noktası başına okuma zaman aşımı bütçeleri (saniye)
+CALL_SITE_TIMEOUTS = {
+    "analyze_cv": 10,
+    "career_simulation": 60,
+    "task_simulation": 30,
+    "email_chat": 20,
+    "evaluate_code": 30,
+    "get_hint": 15,
+    "meeting_chat": 10,
+    "job_extraction": 20,
+    "industry_insights": 20,
+    "learning_module": 30,
+    "evaluate_answer": 30,
+    "evaluate_challenge": 30,
+    "personality_analysis": 45,
+}
+
+DEFAULT_TIMEOUT = 30
+
+
+class GeminiError(Exception):
+    """Gemini çağrısı başarısız olduğunda fırlatılır"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, body: str = ""):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+class _Call:
+    """Devam eden tek bir upstream çağrısı"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Aynı anahtarlı eşzamanlı çağrıları tek upstream isteğinde birleştirir"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """İlk çağıran fn'i çalıştırır, diğerleri onun sonucunu bekler"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class GeminiClient:
+    """Keep-alive bağlantı havuzu kullanan Gemini istemcisi"""
+
+    def __init__(self, api_url: str, api_key: str, pool_size: int = 20,
+                 cache: Optional[LLMResponseCache] = None):
+        self.api_url = api_url
+        self.stream_url = api_url.replace(":generateContent", ":streamGenerateContent")
+        self.api_key = api_key
+        self.cache = cache
+        self.inflight = SingleFlight()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+    @staticmethod
+    def build_payload(prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Tek metin parçalı Gemini isteği oluştur"""
+        payload = {"contents": [{"parts": [{"text": prompt}]}]}
+        if generation_config:
+            payload["generationConfig"] = generation_config
+        return payload
+
+    @staticmethod
+    def timeout_for(call_site: str, budget: Optional[float] = None):
+        """Çağrı noktasına ait (connect, read) zaman aşımını döndür
+
+        budget verilirse read zaman aşımı kalan süre bütçesiyle sınırlanır.
+        """
+        read_timeout = CALL_SITE_TIMEOUTS.get(call_site, DEFAULT_TIMEOUT)
+        if budget is not None:
+            read_timeout = min(read_timeout, budget)
+        return (CONNECT_TIMEOUT, read_timeout)
+
+    @staticmethod
+    def extract_text(result: Dict[str, Any]) -> str:
+        """Gemini yanıtından üretilen metni çıkar"""
+        candidates = result.get("candidates") or []
+        if not candidates:
+            raise GeminiError("AI'dan geçerli yanıt alınamadı", 200, str(result)[:500])
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        text = "".join(part.get("text", "") for part in parts)
+        if not text:
+            raise GeminiError("AI yanıtı boş", 200, str(result)[:500])
+        return text
+
+    def post(self, payload: Dict[str, Any], call_site: str = "default",
+             timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Hazır payload'ı gönder ve ham JSON yanıtı döndür"""
+        try:
+            response = self.session.post(
+                self.api_url,
+                params={"key": self.api_key},
+                json=payload,
+                timeout=self.timeout_for(call_site, timeout)
+            )
+        except requests.RequestException as e:
+            print(f"❌ [{call_site}] Gemini bağlantı hatası: {e}")
+            raise GeminiError(f"Gemini bağlantı hatası: {e}") from e
+
+        print(f"📌 [{call_site}] Gemini status: {response.status_code}")
+        if response.status_code != 200:
+            raise GeminiError("Gemini API hatası", response.status_code, response.text)
+        return response.json()
+
+    def generate(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None,
+                 call_site: str = "default", cache_ttl: Optional[int] = None,
+                 coalesce: bool = False, parse: Optional[Callable[[str], Any]] = None,
+                 timeout: Optional[float] = None) -> Any:
+        """Prompt'u gönder ve üretilen metni (parse verilirse parse(metin)) döndür
+
+        cache_ttl verilirse aynı (model, prompt, generationConfig) için
+        önbellekteki yanıt kullanılır. parse verilirse yanıt yalnızca
+        ayrıştırma başarılı olursa önbelleğe yazılır; parse'ın ValueError'ı
+        çağırana iletilir. coalesce=True ise aynı anda gelen özdeş istekler
+        tek bir Gemini çağrısını paylaşır. timeout verilirse isteğin read
+        zaman aşımı çağrı noktasınınkinden kısa olabilir (kalan süre bütçesi).
+        """
+        payload = self.build_payload(prompt, generation_config)
+        key = make_cache_key(self.api_url, payload)
+        use_cache = bool(cache_ttl) and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                try:
+                    result = parse(cached) if parse else cached
+                except ValueError:
+                    print(f"⚠️ [{call_site}] Önbellekteki LLM yanıtı geçersiz, yeniden üretiliyor")
+                else:
+                    print(f"📌 [{call_site}] LLM önbellekten yanıtlandı")
+                    return result
+
+        def fetch():
+            text = self.extract_text(self.post(payload, call_site, timeout))
+            result = parse(text) if parse else text
+            if use_cache:
+                self.cache.set(key, text, cache_ttl)
+            return result
+
+        if coalesce:
+            return self.inflight.do(key, fetch)
+        return fetch()
+
+    def stream_generate(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None,
+                        call_site: str = "default", cache_ttl: Optional[int] = None,
+                        validate: Optional[Callable[[str], Any]] = None) -> Iterator[str]:
+        """streamGenerateContent ile üretilen metni parça parça döndür
+
+        cache_ttl verilirse önbellekteki yanıt tek parça olarak döner ve
+        tamamlanan akış generate() ile aynı anahtar altında saklanır. validate
+        verilirse birleşik metin yalnızca validate ValueError fırlatmazsa
+        önbelleğe yazılır.
+        """
+        payload = self.build_payload(prompt, generation_config)
+        key = make_cache_key(self.api_url, payload)
+        use_cache = bool(cache_ttl) and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                print(f"📌 [{call_site}] LLM önbellekten yanıtlandı")
+                yield cached
+                return
+
+        try:
+            response = self.session.post(
+                self.stream_url,
+                params={"key": self.api_key, "alt": "sse"},
+                json=payload,
+                timeout=self.timeout_for(call_site),
+                stream=True
+            )
+        except requests.RequestException as e:
+            print(f"❌ [{call_site}] Gemini bağlantı hatası: {e}")
+            raise GeminiError(f"Gemini bağlantı hatası: {e}") from e
+
+        print(f"📌 [{call_site}] Gemini stream status: {response.status_code}")
+        if response.status_code != 200:
+            body = response.text
+            response.close()
+            raise GeminiError("Gemini API hatası", response.status_code, body)
+
+        received = []
+        response.encoding = "utf-8"
+        with response:
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    chunk = json.loads(line[5:].strip())
+                    candidates = chunk.get("candidates") or []
+                    if not candidates:
+                        continue
+                    parts = (candidates[0].get("content") or {}).get("parts") or []
+                    text = "".join(part.get("text", "") for part in parts)
+                    if text:
+                        received.append(text)
+                        yield text
+            except requests.RequestException as e:
+                print(f"❌ [{call_site}] Gemini akış hatası: {e}")
+                raise GeminiError(f"Gemini akış hatası: {e}") from e
+
+        if use_cache and received:
+            text = "".join(received)
+            if validate is not None:
+                try:
+                    validate(text)
+                except ValueError:
+                    print(f"⚠️ [{call_site}] Geçersiz akış yanıtı önbelleğe alınmadı")
+                    return
+            self.cache.set(key, text, cache_ttl)
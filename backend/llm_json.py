@@ -0,0 +1,204 @@
+"""
+KariyerAI - LLM JSON Ayrıştırıcı
+Gemini yanıtındaki (tamamı ya da akış halinde gelen) JSON nesnesini, metin
+ve kod bloklarını atlayarak tek geçişte, regex geri izlemesi olmadan bulur.
+"""
+import json
+import re
+from typing import Any, Iterable, List, Optional, Tuple
+
+# Dizi dışında ilgilenilen karakterler; aradaki metin tek aramada atlanır
+_STRUCTURAL_RE = re.compile(r'[{}\[\]":]')
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+# Kök nesne ayrıştırılamazsa denenecek en fazla aday "{" sayısı
+MAX_JSON_CANDIDATES = 8
+
+_DECODER = json.JSONDecoder()
+
+
+class IncrementalJSONParser:
+    """Kök JSON nesnesini parça parça besleyerek tarayan durum makinesi
+
+    Kök nesnenin dizi alanlarındaki (örn. daily_schedule) her nesne elemanı
+    tamamlandığı anda (alan_adı, eleman) olarak döndürülür. Kök nesneden
+    önceki açıklama metni ve kod blokları atlanır. Gelen parçalar
+    birleştirilmez; yalnızca kök nesne ve açık eleman parçaları saklanır.
+    """
+
+    def __init__(self, array_keys: Optional[Iterable[str]] = None):
+        self.array_keys = set(array_keys) if array_keys is not None else None
+        self._track_elements = self.array_keys is None or bool(self.array_keys)
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._root_parts: List[str] = []
+        self._element_parts: Optional[List[str]] = None
+        self._string_parts: Optional[List[str]] = None
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+        self._done = False
+        self._root: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Kök nesne kapandı mı"""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Yeni metin parçasını tara ve tamamlanan dizi elemanlarını döndür"""
+        events = []
+        if self._done or not chunk:
+            return events
+
+        stack = self._stack
+        i = 0
+        if not stack:
+            i = chunk.find("{")
+            if i < 0:
+                return events
+            stack.append("{")
+            root_from = i
+            i += 1
+        else:
+            root_from = 0
+        element_from = 0 if self._element_parts is not None else None
+        string_from = 0 if self._string_parts is not None else None
+        end = len(chunk)
+
+        while i < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                match = _STRING_SPECIAL_RE.search(chunk, i)
+                if match is None:
+                    break
+                i = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if string_from is not None:
+                    self._string_parts.append(chunk[string_from:i])
+                    self._last_string = "".join(self._string_parts)
+                    self._string_parts = string_from = None
+                continue
+
+            match = _STRUCTURAL_RE.search(chunk, i)
+            if match is None:
+                break
+            ch = match.group()
+            i = match.end()
+
+            if ch == '"':
+                self._in_string = True
+                if len(stack) == 1:
+                    self._string_parts = []
+                    string_from = i - 1
+            elif ch == ":":
+                if len(stack) == 1:
+                    self._current_key = self._decode_key()
+            elif ch in "{[":
+                stack.append(ch)
+                if len(stack) == 3 and stack[1] == "[" and self._track_elements:
+                    self._element_parts = []
+                    element_from = i - 1
+            else:
+                stack.pop()
+                if len(stack) == 2 and self._element_parts is not None:
+                    self._element_parts.append(chunk[element_from:i])
+                    event = self._element_event("".join(self._element_parts))
+                    if event:
+                        events.append(event)
+                    self._element_parts = element_from = None
+                if not stack:
+                    self._root_parts.append(chunk[root_from:i])
+                    self._done = True
+                    return events
+
+        self._root_parts.append(chunk[root_from:])
+        if element_from is not None:
+            self._element_parts.append(chunk[element_from:])
+        if string_from is not None:
+            self._string_parts.append(chunk[string_from:])
+        return events
+
+    def result(self) -> Any:
+        """Tamamlanan kök nesneyi ayrıştırıp döndür"""
+        if not self._done:
+            raise ValueError("JSON nesnesi tamamlanmadı")
+        if self._root is None:
+            self._root = "".join(self._root_parts)
+            self._root_parts = [self._root]
+        return json.loads(self._root)
+
+    def _decode_key(self) -> Optional[str]:
+        if self._last_string is None:
+            return None
+        try:
+            return json.loads(self._last_string)
+        except ValueError:
+            return None
+
+    def _element_event(self, raw: str) -> Optional[Tuple[str, Any]]:
+        key = self._current_key
+        if key is None or (self.array_keys is not None and key not in self.array_keys):
+            return None
+        try:
+            return key, json.loads(raw)
+        except ValueError:
+            return None
+
+
+def _span_end(text: str, start: int) -> int:
+    """start'taki "{" ile dengelenen kapanışın bir sonrası; kapanmıyorsa -1"""
+    depth = 0
+    in_string = False
+    i = start
+    while True:
+        match = (_STRING_SPECIAL_RE if in_string else _STRUCTURAL_RE).search(text, i)
+        if match is None:
+            return -1
+        ch = match.group()
+        i = match.end()
+        if in_string:
+            if ch == "\\":
+                i += 1
+            else:
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i
+
+
+def extract_json(text: str) -> Any:
+    """LLM yanıtındaki ilk geçerli JSON nesnesini döndür
+
+    Kod blokları ve nesneden önceki/sonraki açıklamalar yok sayılır. Nesne
+    json'un C tarayıcısıyla yerinde (kopya almadan) ayrıştırılır. Bir "{"
+    geçerli bir nesne başlatmıyorsa sonraki aday ancak o adayın kapanışından
+    sonra aranır; aday hiç kapanmıyorsa (yarıda kesilmiş yanıt) iç nesneler
+    döndürülmez, hata fırlatılır. Nesne bulunamazsa ValueError fırlatılır.
+    """
+    text = text or ""
+    start = text.find("{")
+    error: ValueError = ValueError("Yanıtta JSON nesnesi bulunamadı")
+    for _ in range(MAX_JSON_CANDIDATES):
+        if start < 0:
+            break
+        try:
+            return _DECODER.raw_decode(text, start)[0]
+        except ValueError as e:
+            error = e
+        end = _span_end(text, start)
+        if end < 0:
+            break
+        start = text.find("{", end)
+    raise error
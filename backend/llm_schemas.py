@@ -0,0 +1,315 @@
+"""
+KariyerAI - LLM Yanıt Şemaları
+JSON döndüren her Gemini çağrısı için responseSchema kaydı. Aynı şema hem
+Gemini'nin yapılandırılmış çıktı moduna verilir hem de yanıt doğrulamasında
+kullanılır.
+"""
+from typing import Any, Dict, List, Optional
+
+from llm_json import extract_json
+
+
+class SchemaValidationError(ValueError):
+    """LLM yanıtı beklenen şemaya uymadığında fırlatılır"""
+
+
+def _string(description: Optional[str] = None, enum: Optional[List[str]] = None,
+            nullable: bool = False) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {"type": "STRING"}
+    if enum:
+        schema.update({"format": "enum", "enum": enum})
+    if description:
+        schema["description"] = description
+    if nullable:
+        schema["nullable"] = True
+    return schema
+
+
+def _integer(minimum: Optional[int] = None, maximum: Optional[int] = None) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {"type": "INTEGER"}
+    if minimum is not None:
+        schema["minimum"] = minimum
+    if maximum is not None:
+        schema["maximum"] = maximum
+    return schema
+
+
+def _array(items: Dict[str, Any], description: Optional[str] = None) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {"type": "ARRAY", "items": items}
+    if description:
+        schema["description"] = description
+    return schema
+
+
+def _object(properties: Dict[str, Dict[str, Any]], required: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Alanları tanımlandığı sırada üretilecek nesne şeması (required verilmezse tüm alanlar)"""
+    return {
+        "type": "OBJECT",
+        "properties": properties,
+        "required": list(properties) if required is None else required,
+        "propertyOrdering": list(properties),
+    }
+
+
+_BOOLEAN = {"type": "BOOLEAN"}
+_STRINGS = _array(_string())
+_PRIORITY = _string(enum=["Yüksek", "Orta", "Düşük"])
+_TASK_PRIORITY = _string(enum=["Kritik", "Yüksek", "Orta", "Düşük"])
+
+RESPONSE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "analyze_cv": _object({
+        "firstName": _string(),
+        "lastName": _string(),
+        "email": _string(),
+        "phone": _string(),
+        "location": _string("şehir, ülke"),
+        "currentTitle": _string(),
+        "summary": _string(),
+        "experienceLevel": _string(enum=["junior", "mid", "senior", "lead"]),
+        "skills": _STRINGS,
+        "experiences": _array(_object({
+            "company": _string(),
+            "position": _string(),
+            "duration": _string("örn. 2022-2024"),
+            "description": _string(),
+        })),
+        "education": _object({
+            "university": _string(),
+            "degree": _string(),
+            "graduationYear": _string(),
+            "gpa": _string("örn. 3.5/4.0"),
+        }),
+    }),
+    "career_simulation": _object({
+        "title": _string("Kullanıcının bölümüne uygun başlık"),
+        "category": _string("Bölümün ana kategorisi"),
+        "difficulty": _string("Deneyim seviyesine göre"),
+        "context": _string("Bölüme uygun şirket ve ortam tanımı"),
+        "daily_schedule": _array(_object({
+            "time": _string("SS:DD"),
+            "task": _string("Bölüme özel görev"),
+            "description": _string(),
+            "priority": _TASK_PRIORITY,
+            "department": _string(),
+            "team_size": _integer(minimum=1),
+            "tools": _array(_string(), "Bölüme uygun araçlar"),
+            "duration_min": _integer(minimum=1),
+        }, required=["time", "task", "description"])),
+        "emails": _array(_object({
+            "from": _string(),
+            "subject": _string(),
+            "summary": _string(),
+        })),
+        "meetings": _array(_object({
+            "time": _string(),
+            "participants": _STRINGS,
+            "topic": _string(),
+            "summary": _string(),
+        })),
+        "situation": _string("Bölüme özel gerçekçi problem"),
+        "question": _string(),
+        "options": _array(_object({
+            "id": _string(),
+            "text": _string(),
+            "feedback": _string(),
+        })),
+    }),
+    "task_simulation_email": _object({
+        "type": _string(enum=["email"]),
+        "scenario": _string(),
+        "incoming_email": _object({
+            "from": _string(),
+            "subject": _string(),
+            "body": _string(),
+            "priority": _PRIORITY,
+            "requires_response": _BOOLEAN,
+        }),
+        "context": _string("Bu emaile nasıl yanıt verilmeli"),
+        "success_criteria": _STRINGS,
+    }),
+    "task_simulation_coding": _object({
+        "type": _string(enum=["coding"]),
+        "scenario": _string(),
+        "problem": _string(),
+        "requirements": _STRINGS,
+        "example_input": _string(),
+        "expected_output": _string(),
+        "constraints": _STRINGS,
+        "hints": _STRINGS,
+        "difficulty": _string(enum=["Kolay", "Orta", "Zor"]),
+    }),
+    "task_simulation_meeting": _object({
+        "type": _string(enum=["meeting"]),
+        "scenario": _string(),
+        "agenda": _STRINGS,
+        "participants": _array(_object({
+            "name": _string(),
+            "role": _string(),
+            "personality": _string(),
+        })),
+        "key_decisions": _STRINGS,
+        "challenges": _STRINGS,
+        "success_metrics": _STRINGS,
+    }),
+    "task_simulation_general": _object({
+        "type": _string(enum=["general"]),
+        "scenario": _string(),
+        "mini_event": _string("Görev sırasında yaşanabilecek bir olay"),
+        "challenge": _string(),
+        "decision": _object({
+            "question": _string(),
+            "options": _array(_object({"id": _string(), "text": _string()})),
+        }),
+        "resources": _STRINGS,
+        "tips": _STRINGS,
+    }),
+    "email_chat": _object({
+        "reply": _string("Email yanıtı"),
+        "tone": _string(enum=["Profesyonel", "Samimi", "Resmi", "Acil"]),
+        "satisfaction": _string(enum=["Memnun", "Nötr", "Memnun değil"]),
+        "next_action": _string("Bir sonraki beklenen aksiyon"),
+        "feedback": _string("Kullanıcının mesajı hakkında geri bildirim"),
+    }),
+    "evaluate_code": _object({
+        "correctness": _string(enum=["Doğru", "Kısmen doğru", "Yanlış"]),
+        "efficiency": _string(enum=["Verimli", "Orta", "Verimsiz"]),
+        "readability": _string(enum=["Okunabilir", "Orta", "Karmaşık"]),
+        "best_practices": _string(enum=["İyi", "Orta", "Kötü"]),
+        "feedback": _string(),
+        "suggestions": _STRINGS,
+        "corrected_code": _string("Gerekirse düzeltilmiş kod", nullable=True),
+        "explanation": _string(),
+    }, required=["correctness", "efficiency", "readability", "best_practices", "feedback", "suggestions",
+                 "explanation"]),
+    "get_hint": _object({
+        "hint": _string(),
+        "type": _string(enum=["Teknik", "Süreç", "İletişim", "Strateji"]),
+        "urgency": _string(enum=["Düşük", "Orta", "Yüksek"]),
+        "action": _string("Önerilen aksiyon"),
+    }),
+    "meeting_chat": _object({
+        "response": _string("1-2 cümlelik yanıt"),
+        "emotion": _string(enum=["neutral", "positive", "concerned", "excited", "skeptical"]),
+        "follow_up_question": _string(nullable=True),
+        "action_item": _string(nullable=True),
+    }, required=["response", "emotion"]),
+    "learning_module": _object({
+        "title": _string(),
+        "description": _string(),
+        "steps": _array(_object({
+            "step": _integer(minimum=1),
+            "title": _string(),
+            "content": _string("HTML (<h4>, <p>, <strong>) formatında anlatım"),
+            "examples": _STRINGS,
+            "interactive_question": _string(),
+            "challenge": _string("Kullanıcıdan yapılması istenen görev"),
+            "code_example": _string(),
+        }, required=["step", "title", "content"])),
+        "final_quiz": _array(_object({
+            "q": _string(),
+            "a": _STRINGS,
+            "correct": _string("a seçeneklerinden biri"),
+        })),
+    }),
+    "job_extraction": _object({
+        "jobs": _array(_object({
+            "title": _string(),
+            "company": _object({"name": _string()}),
+            "description": _string("En az 50 karakter"),
+            "url": _string(),
+            "requirements": _array(_string(), "İlan açıklamasından 6-8 tek kelimelik beceri"),
+            "location_city": _string(),
+            "salary_range": _string("Bilgi yoksa boş"),
+            "experience_level": _string("Bilgi yoksa boş"),
+        }, required=["title", "company", "description", "url", "requirements"])),
+    }),
+    "evaluate_answer": _object({
+        "correct": _BOOLEAN,
+        "feedback": _string("Detaylı ve yapıcı geri bildirim"),
+        "score": _integer(0, 10),
+    }),
+    "evaluate_challenge": _object({
+        "score": _integer(1, 10),
+        "review": _string(),
+        "suggestions": _string(),
+    }),
+    "personality_analysis": _object({
+        "personality_overview": _string(),
+        "personality_traits": _array(_object({
+            "name": _string(),
+            "score": _integer(0, 100),
+            "description": _string(),
+        })),
+        "career_fit": _object({
+            "suitable_careers": _STRINGS,
+            "explanation": _string(),
+        }),
+        "strengths": _array(_object({"title": _string(), "description": _string()})),
+        "development_areas": _array(_object({"title": _string(), "description": _string()})),
+        "recommendations": _array(_object({
+            "category": _string(),
+            "suggestion": _string(),
+            "action_items": _STRINGS,
+        })),
+    }),
+}
+
+
+def structured_config(name: str, generation_config: Dict[str, Any]) -> Dict[str, Any]:
+    """generationConfig'e JSON çıktı modunu ve kayıtlı responseSchema'yı ekle"""
+    return {
+        **generation_config,
+        "responseMimeType": "application/json",
+        "responseSchema": RESPONSE_SCHEMAS[name],
+    }
+
+
+def validate(data: Any, schema: Dict[str, Any], path: str = "$") -> None:
+    """Veriyi şemaya göre doğrula; uymuyorsa SchemaValidationError"""
+    if data is None:
+        if schema.get("nullable"):
+            return
+        raise SchemaValidationError(f"{path}: değer boş olamaz")
+
+    kind = schema["type"]
+    if kind == "OBJECT":
+        if not isinstance(data, dict):
+            raise SchemaValidationError(f"{path}: nesne bekleniyordu")
+        for key in schema.get("required", ()):
+            if key not in data:
+                raise SchemaValidationError(f"{path}.{key}: alan eksik")
+        for key, sub_schema in schema.get("properties", {}).items():
+            if key in data:
+                validate(data[key], sub_schema, f"{path}.{key}")
+    elif kind == "ARRAY":
+        if not isinstance(data, list):
+            raise SchemaValidationError(f"{path}: dizi bekleniyordu")
+        for index, item in enumerate(data):
+            validate(item, schema["items"], f"{path}[{index}]")
+    elif kind == "STRING":
+        if not isinstance(data, str):
+            raise SchemaValidationError(f"{path}: metin bekleniyordu")
+        if "enum" in schema and data not in schema["enum"]:
+            raise SchemaValidationError(f"{path}: '{data}' izin verilen değerlerden değil")
+    elif kind in ("INTEGER", "NUMBER"):
+        numeric = int if kind == "INTEGER" else (int, float)
+        if isinstance(data, bool) or not isinstance(data, numeric):
+            raise SchemaValidationError(f"{path}: sayı bekleniyordu")
+        if "minimum" in schema and data < schema["minimum"]:
+            raise SchemaValidationError(f"{path}: {data} < {schema['minimum']}")
+        if "maximum" in schema and data > schema["maximum"]:
+            raise SchemaValidationError(f"{path}: {data} > {schema['maximum']}")
+    elif kind == "BOOLEAN":
+        if not isinstance(data, bool):
+            raise SchemaValidationError(f"{path}: true/false bekleniyordu")
+
+
+def parse_response(name: str, text: str) -> Any:
+    """Yapılandırılmış Gemini yanıtını ayrıştırıp kayıtlı şemaya göre doğrula
+
+    Ayrıştırılamayan yanıtta json.JSONDecodeError, şemaya uymayan yanıtta
+    SchemaValidationError (ikisi de ValueError) fırlatılır.
+    """
+    data = extract_json(text)
+    validate(data, RESPONSE_SCHEMAS[name])
+    return data
@@ -1,40 +1,35 @@
 # Simulation API for User Profiles
 
-from flask import request, jsonify
+from flask import jsonify
 import json
 from datetime import datetime
 from personalization_engine import PersonalizationEngine
+from supabase_client import SupabaseError
+from analysis_memo import AnalysisMemo
+from skill_taxonomy import TAXONOMY
 
-def add_personalization_routes(app, personalization_engine):
+def add_personalization_routes(app, personalization_engine, profile_cache, analysis_memo=None):
+    if analysis_memo is None:
+        analysis_memo = AnalysisMemo(personalization_engine.analyze_user_profile, version="4")
     
     @app.route("/profile-analysis/<uuid:user_id>", methods=["POST"])
     def analyze_user_profile_detailed(user_id):
         """Kullanıcı profilini detaylı analiz et ve kişiselleştirme önerileri üret"""
         try:
+            profile_response = get_user_profile(profile_cache, user_id)
+            if not profile_response['success']:
+                return jsonify(profile_response), 404
             
-            headers = {
-                "apikey": app.config.get('SUPABASE_API_KEY'),
-                "Authorization": f"Bearer {app.config.get('SUPABASE_API_KEY')}"
-            }
-            
-            response = requests.get(
-                f"{app.config.get('SUPABASE_API_URL')}/rest/v1/profiles?id=eq.{user_id}",
-                headers=headers
-            )
-            
-            if response.status_code != 200 or not response.json():
-                return jsonify({"success": False, "message": "Profil bulunamadı"}), 404
-            
-            profile = response.json()[0]
+            profile = profile_response['data']
             
-            analysis = personalization_engine.analyze_user_profile(profile)
+            analysis = analysis_memo.get(profile)
             
             recommendations = generate_personalized_recommendations(analysis)
             
             return jsonify({
                 "success": True,
                 "data": {
-                    "analysis": analysis,
+                    "analysis": analysis.to_dict(),
                     "recommendations": recommendations,
                     "updated_at": datetime.now().isoformat()
                 }
@@ -46,64 +41,17 @@ def add_personalization_routes(app, personalization_engine):
                 "message": f"Analiz hatası: {str(e)}"
             }), 500
     
-    @app.route("/adaptive-scenario/<uuid:user_id>", methods=["POST"])
-    def generate_adaptive_scenario(user_id):
-        """Kullanıcının performans geçmişine göre adaptif senaryo üret"""
-        try:
-            data = request.json
-            performance_history = data.get('performance_history', [])
-            preferred_difficulty = data.get('preferred_difficulty', 'medium')
-            focus_areas = data.get('focus_areas', [])
-            
-            profile_response = get_user_profile(user_id)
-            if not profile_response['success']:
-                return jsonify(profile_response), 404
-            
-            profile = profile_response['data']
-            
-            adjusted_difficulty = calculate_adaptive_difficulty(
-                performance_history, 
-                preferred_difficulty
-            )
-            
-            scenario_prompt = create_adaptive_prompt(
-                profile, 
-                adjusted_difficulty, 
-                focus_areas
-            )
-            
-            scenario = generate_scenario_with_ai(scenario_prompt)
-            
-            return jsonify({
-                "success": True,
-                "data": {
-                    "scenario": scenario,
-                    "difficulty_level": adjusted_difficulty,
-                    "personalization_factors": {
-                        "user_level": profile.get('experience_level'),
-                        "focus_areas": focus_areas,
-                        "performance_trend": analyze_performance_trend(performance_history)
-                    }
-                }
-            })
-            
-        except Exception as e:
-            return jsonify({
-                "success": False,
-                "message": f"Adaptif senaryo üretim hatası: {str(e)}"
-            }), 500
-    
     @app.route("/learning-path/<uuid:user_id>", methods=["GET"])
     def generate_personalized_learning_path(user_id):
         """Kullanıcıya özel öğrenme yol haritası oluştur"""
         try:
-            profile_response = get_user_profile(user_id)
+            profile_response = get_user_profile(profile_cache, user_id)
             if not profile_response['success']:
                 return jsonify(profile_response), 404
             
             profile = profile_response['data']
             
-            analysis = personalization_engine.analyze_user_profile(profile)
+            analysis = analysis_memo.get(profile)
             
             learning_path = create_learning_path(analysis)
             
@@ -122,37 +70,6 @@ def add_personalization_routes(app, personalization_engine):
                 "success": False,
                 "message": f"Öğrenme yolu oluşturma hatası: {str(e)}"
             }), 500
-    
-    @app.route("/personality-assessment", methods=["POST"])
-    def personality_assessment():
-        """Kişilik değerlendirmesi ve simülasyon önerisi"""
-        try:
-            data = request.json
-            responses = data.get('responses', [])
-            user_id = data.get('user_id')
-            
-            personality_profile = analyze_personality(responses)
-            
-            recommended_scenarios = get_personality_based_scenarios(personality_profile)
-            
-            if user_id:
-                save_personality_profile(user_id, personality_profile)
-            
-            return jsonify({
-                "success": True,
-                "data": {
-                    "personality_profile": personality_profile,
-                    "recommended_scenarios": recommended_scenarios,
-                    "learning_style": personality_profile.get('learning_style'),
-                    "work_preferences": personality_profile.get('work_style')
-                }
-            })
-            
-        except Exception as e:
-            return jsonify({
-                "success": False,
-                "message": f"Kişilik değerlendirme hatası: {str(e)}"
-            }), 500
 
 def generate_personalized_recommendations(analysis):
     """Analiz sonuçlarına göre kişiselleştirilmiş öneriler üret"""
@@ -196,57 +113,6 @@ def generate_personalized_recommendations(analysis):
     
     return recommendations
 
-def calculate_adaptive_difficulty(performance_history, preferred_difficulty):
-    """Performans geçmişine göre zorluk seviyesi hesapla"""
-    if not performance_history:
-        return preferred_difficulty
-    
-    recent_scores = [p.get('score', 0) for p in performance_history[-5:]]
-    avg_score = sum(recent_scores) / len(recent_scores) if recent_scores else 0
-    
-    if avg_score > 85:
-        difficulty_map = {'easy': 'medium', 'medium': 'hard', 'hard': 'expert'}
-        return difficulty_map.get(preferred_difficulty, 'hard')
-    elif avg_score < 60:
-        difficulty_map = {'expert': 'hard', 'hard': 'medium', 'medium': 'easy'}
-        return difficulty_map.get(preferred_difficulty, 'easy')
-    
-    return preferred_difficulty
-
-def create_adaptive_prompt(profile, difficulty, focus_areas):
-    """Adaptif prompt oluştur"""
-    base_elements = {
-        "user_role": profile.get('current_title', 'Professional'),
-        "experience_level": profile.get('experience_level', 'mid'),
-        "skills": profile.get('skills', []),
-        "industry": profile.get('industry', 'technology')
-    }
-    
-    difficulty_instructions = {
-        'easy': 'Basit, adım adım çözülebilir problemler oluştur.',
-        'medium': 'Orta kompleksite, birkaç faktörü göz önünde bulundurma gerektiren durumlar.',
-        'hard': 'Karmaşık, çoklu stakeholder ve belirsizlik içeren senaryolar.',
-        'expert': 'Stratejik seviye, organizasyon geneli etkisi olan kritik kararlar.'
-    }
-    
-    focus_instruction = f"Özellikle şu alanlara odaklan: {', '.join(focus_areas)}" if focus_areas else ""
-    
-    prompt = f"""
-    Kullanıcı Profili:
-    - Rol: {base_elements['user_role']}
-    - Deneyim: {base_elements['experience_level']}
-    - Sektör: {base_elements['industry']}
-    
-    Zorluk Seviyesi: {difficulty}
-    Talimat: {difficulty_instructions[difficulty]}
-    
-    {focus_instruction}
-    
-    Bu kriterlere uygun, gerçekçi bir iş günü simülasyonu oluştur.
-    """
-    
-    return prompt
-
 def create_learning_path(analysis):
     """Kişiselleştirilmiş öğrenme yolu oluştur"""
     learning_path = {
@@ -300,31 +166,33 @@ def create_learning_path(analysis):
     
     return learning_path
 
-def get_user_profile(user_id):
-    """Kullanıcı profilini getir"""
-    pass
+def get_learning_resources_for_skill(skill):
+    """Beceri için öğrenme kaynağı önerileri"""
+    readable = skill.replace("_", " ")
+    return [
+        {"type": "learning_module", "title": f"{readable} öğrenme modülü"},
+        {"type": "simulation", "title": f"{readable} pratik senaryosu"}
+    ]
 
-def analyze_personality(responses):
-    """Kişilik analizini yap"""
-    personality_scores = {
-        "extraversion": 0,
-        "sensing": 0,
-        "thinking": 0,
-        "judging": 0
-    }
-    
+def calculate_learning_duration(learning_path):
+    """Öğrenme yolunun toplam süresini hafta olarak döndür"""
+    weeks = learning_path.get("total_duration_weeks", 0)
+    return {"weeks": weeks, "months": round(weeks / 4, 1)}
 
-    return {
-        "type": determine_personality_type(personality_scores),
-        "learning_style": determine_learning_style(personality_scores),
-        "work_style": determine_work_style(personality_scores),
-        "communication_preference": determine_communication_style(personality_scores)
-    }
+def get_user_profile(profile_cache, user_id):
+    """Kullanıcı profilini getir"""
+    try:
+        profile = profile_cache.by_id(user_id)
+    except SupabaseError:
+        profile = None
+    if not profile:
+        return {"success": False, "message": "Profil bulunamadı"}
+    return {"success": True, "data": profile}
 
 def determine_specialization(analysis):
     """Uzmanlık alanını belirle"""
     industry = analysis.get('industry_focus', 'general')
-    role_type = analysis.get('role_type', 'general')
+    role_type = analysis.get('role_focus', 'general')
     
     specialization_map = {
         ('technology', 'frontend'): 'Frontend Architecture',
@@ -338,12 +206,4 @@ def determine_specialization(analysis):
 
 def get_specialization_skills(specialization):
     """Uzmanlık alanına göre beceriler"""
-    skill_map = {
-        'Frontend Architecture': ['React optimization', 'State management', 'Performance tuning'],
-        'Backend Systems': ['System design', 'Database optimization', 'API architecture'],
-        'Full Stack Development': ['End-to-end development', 'DevOps', 'Cloud deployment'],
-        'UX/UI Design': ['User research', 'Design systems', 'Prototyping'],
-        'Technical Leadership': ['Team management', 'Technical strategy', 'Stakeholder communication']
-    }
-    
-    return skill_map.get(specialization, ['General problem solving', 'Communication', 'Project management'])
+    return TAXONOMY.specialization_skills(specialization)
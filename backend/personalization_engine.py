@@ -3,25 +3,274 @@ KariyerAI - Gelişmiş Kişiselleştirme Motoru
 Bu modül kullanıcı verilerini analiz ederek daha kişiye özel simülasyonlar üretir.
 """
 import json
-from typing import Dict, List, Any
-from dataclasses import dataclass
-
-@dataclass
-class UserPersonality:
-    """Kullanıcının kişilik profili"""
-    learning_style: str  # visual, auditory, kinesthetic, reading
-    work_style: str      # collaborative, independent, mixed
-    stress_tolerance: str # low, medium, high
-    communication_preference: str # direct, diplomatic, detailed
-    problem_solving_approach: str # analytical, creative, systematic
-
-@dataclass
-class CareerStage:
-    """Kullanıcının kariyer aşaması"""
-    experience_level: str  # junior, mid, senior, lead
-    career_goals: List[str]  # promotion, skill_development, career_change
-    industry_familiarity: int  # 1-5 scale
-    leadership_interest: int   # 1-5 scale
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Iterable, Iterator, Tuple
+
+from keyword_matcher import KeywordMatcher
+from skill_taxonomy import TAXONOMY
+
+# Beceri kategorileri, eş anlamlılar ve rol önerileri skill_taxonomy.json'dadır
+SOFT_SKILL_KEYWORDS = {
+    'leadership': ['lead', 'manage', 'coordinate', 'supervise'],
+    'communication': ['present', 'communicate', 'collaborate', 'meeting'],
+    'problem_solving': ['solve', 'debug', 'troubleshoot', 'optimize'],
+    'project_management': ['project', 'plan', 'deadline', 'deliver']
+}
+
+# Sektör önceliği: unvan (teknik/tasarım) > bölüm > unvan (yönetim/analiz)
+TITLE_INDUSTRY_KEYWORDS = {
+    'technology': ['developer', 'engineer', 'programmer', 'software'],
+    'design': ['designer', 'ux', 'ui']
+}
+
+DEGREE_INDUSTRY_KEYWORDS = {
+    'industrial_engineering': ['endüstri mühendisliği', 'industrial engineering'],
+    'technology': ['bilgisayar', 'computer', 'yazılım', 'software'],
+    'mechanical_engineering': ['makine', 'mechanical'],
+    'electrical_engineering': ['elektrik', 'electrical', 'elektronik']
+}
+
+FALLBACK_INDUSTRY_KEYWORDS = {
+    'management': ['manager', 'lead', 'director'],
+    'analytics': ['analyst', 'data', 'research', 'scientist']
+}
+
+# Hiçbir anahtar kelime eşleşmezse: eski app.py analizörünün varsayılanı;
+# senaryo grupları ve beceri eksikleri "technology" üzerinden dallanır
+DEFAULT_INDUSTRY = 'technology'
+
+# Unvandan kıdem (role_type); sıralama önceliktir
+TITLE_LEVEL_KEYWORDS = {
+    'senior_individual_contributor': ['senior', 'lead', 'principal'],
+    'management': ['manager', 'director', 'head'],
+    'junior': ['junior', 'intern', 'entry']
+}
+
+# Bölüme göre önerilen simülasyon tipleri
+DEGREE_SIMULATION_KEYWORDS = {
+    'software': ['bilgisayar', 'yazılım'],
+    'hardware': ['makine', 'elektrik']
+}
+
+# technical_skills alanı -> taksonomi kategorileri
+TECHNICAL_SKILL_GROUPS = {
+    'programming': 'programming_languages',
+    'frameworks': 'frameworks',
+    'cloud': 'tools',
+    'devops': 'tools'
+}
+INDUSTRIAL_ENGINEERING_TOOLS = ["Excel", "SAP", "AutoCAD", "MATLAB", "Minitab", "Process Analysis"]
+
+# MBTI harfi -> kişilikten gelen soft skill'ler
+PERSONALITY_SOFT_SKILLS = {
+    'E': ["iletişim", "takım çalışması", "liderlik"],
+    'I': ["analitik düşünce", "detay odaklılık", "bağımsız çalışma"],
+    'T': ["problem çözme", "mantıklı karar verme"],
+    'F': ["empati", "müşteri odaklılık"]
+}
+
+ROLE_TYPE_KEYWORDS = {
+    'frontend': ['frontend', 'front-end', 'ui'],
+    'backend': ['backend', 'back-end', 'api'],
+    'fullstack': ['fullstack', 'full-stack'],
+    'devops': ['devops', 'sre', 'infrastructure'],
+    'mobile': ['mobile', 'ios', 'android']
+}
+
+SENIORITY_KEYWORDS = {
+    'junior': ['junior', 'intern', 'trainee', 'assistant'],
+    'senior': ['senior', 'lead', 'principal', 'manager', 'director']
+}
+
+SCENARIO_KEYWORDS = {
+    'engineering': ['developer', 'engineer'],
+    'management': ['manager', 'lead'],
+    'design': ['designer']
+}
+
+# Toplu analizde süreç havuzuna geçilecek en az profil sayısı ve iş parçası boyutu
+BATCH_PARALLEL_THRESHOLD = 512
+BATCH_CHUNK_SIZE = 128
+
+# Her işçi süreçte bir kez kurulan motor (otomat süreç başına bir kez derlenir)
+_worker_engine = None
+
+
+def _init_batch_worker():
+    global _worker_engine
+    _worker_engine = PersonalizationEngine()
+
+
+def _analyze_chunk(profiles: List[Dict]) -> List[Dict[str, Any]]:
+    return [_worker_engine.analyze_user_profile(profile).to_dict() for profile in profiles]
+
+class Experience:
+    """Profildeki tek bir iş deneyimi"""
+    __slots__ = ('position', 'description', 'duration')
+
+    def __init__(self, position: str = '', description: str = '', duration: str = ''):
+        self.position = position
+        self.description = description
+        self.duration = duration
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Experience":
+        return cls(data.get('position') or '', data.get('description') or '', data.get('duration') or '')
+
+
+class Profile:
+    """Analizin okuduğu profil alanları (Supabase profiles satırından)"""
+    __slots__ = ('skills', 'experiences', 'current_title', 'experience_level',
+                 'degree', 'university', 'personality')
+
+    def __init__(self, skills: Tuple[str, ...], experiences: Tuple[Experience, ...], current_title: str,
+                 experience_level: str, degree: str, university: str, personality: Dict):
+        self.skills = skills
+        self.experiences = experiences
+        self.current_title = current_title
+        self.experience_level = experience_level
+        self.degree = degree
+        self.university = university
+        self.personality = personality
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Profile":
+        """Eksik/null alanları varsayılanlarla doldurarak profil oluştur"""
+        return cls(
+            skills=tuple(skill for skill in (data.get('skills') or []) if isinstance(skill, str)),
+            experiences=tuple(Experience.from_dict(exp) for exp in (data.get('experiences') or [])
+                              if isinstance(exp, dict)),
+            current_title=data.get('current_title') or '',
+            experience_level=(data.get('experience_level') or 'junior').lower(),
+            degree=(data.get('degree') or '').replace('İ', 'i').lower(),
+            university=data.get('university') or '',
+            personality=data.get('personality_assessment') or {},
+        )
+
+
+class lazy_field:
+    """__slots__'lı sınıflarda ilk erişimde hesaplanıp '_<ad>' slotunda saklanan alan"""
+
+    def __init__(self, compute):
+        self.compute = compute
+        self.slot = '_' + compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            value = self.compute(obj)
+            setattr(obj, self.slot, value)
+            return value
+
+
+class ProfileAnalysis:
+    """Profil analizi; her alan yalnızca okunduğunda hesaplanır
+
+    Sözlük gibi okunabilir (analysis.get('skill_gaps')); JSON için to_dict()
+    kullanılır. Önbellekte paylaşıldığı için salt okunur kabul edilmelidir.
+    """
+    FIELDS = ('industry_focus', 'role_type', 'role_focus', 'technical_skills', 'skill_categories',
+              'soft_skills', 'skill_gaps', 'experience_depth', 'career_trajectory',
+              'personalization_params', 'degree', 'university')
+    __slots__ = ('engine', 'profile', '_title_hits', '_degree_hits') + tuple('_' + field for field in FIELDS)
+
+    def __init__(self, engine: "PersonalizationEngine", profile: Profile):
+        self.engine = engine
+        self.profile = profile
+
+    @lazy_field
+    def title_hits(self):
+        return self.engine.matcher.scan(self.profile.current_title)
+
+    @lazy_field
+    def degree_hits(self):
+        return self.engine.matcher.scan(self.profile.degree)
+
+    @lazy_field
+    def industry_focus(self):
+        return self.engine._determine_industry(self.title_hits, self.degree_hits)
+
+    @lazy_field
+    def role_type(self):
+        return self.engine._determine_role_level(self.title_hits, self.profile.experience_level)
+
+    @lazy_field
+    def role_focus(self):
+        return self.engine._determine_role_type(self.profile.current_title)
+
+    @lazy_field
+    def technical_skills(self):
+        industrial = ('degree_industry', 'industrial_engineering') in self.degree_hits
+        return self.engine._core_technical_skills(self.profile.skills, industrial)
+
+    @lazy_field
+    def skill_categories(self):
+        return self.engine._categorize_skills(self.profile.skills)
+
+    @lazy_field
+    def soft_skills(self):
+        return (self.engine._personality_soft_skills(self.profile.personality)
+                + self.engine._extract_soft_skills(self.profile.experiences))
+
+    @lazy_field
+    def skill_gaps(self):
+        gaps = self.engine._identify_skill_gaps(self.profile.skills, self.title_hits)
+        for gap in self.engine._profile_skill_gaps(self.role_type, self.industry_focus,
+                                                   self.technical_skills, self.soft_skills):
+            if gap not in gaps:
+                gaps.append(gap)
+        return gaps
+
+    @lazy_field
+    def experience_depth(self):
+        return self.engine._calculate_experience_depth(self.profile.experiences)
+
+    @lazy_field
+    def career_trajectory(self):
+        return self.engine._analyze_career_trajectory(
+            self.profile.experiences, self.profile.experience_level, self.title_hits
+        )
+
+    @lazy_field
+    def personalization_params(self):
+        return self.engine._generate_personalization_params(
+            self.profile.experience_level, len(self.profile.skills), self.skill_gaps,
+            self.title_hits, self.degree_hits, self.profile.personality
+        )
+
+    @lazy_field
+    def degree(self):
+        return self.profile.degree
+
+    @lazy_field
+    def university(self):
+        return self.profile.university
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Tüm alanları hesaplayıp sözlük olarak döndür"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
 
 class PersonalizationEngine:
     """Kişiselleştirme motoru"""
@@ -33,131 +282,110 @@ class PersonalizationEngine:
             'senior': {'easy': 0.1, 'medium': 0.4, 'hard': 0.5},
             'lead': {'easy': 0.05, 'medium': 0.25, 'hard': 0.7}
         }
+        # Tüm kategori kelimeleri tek otomatta; etiketler (alan, kategori) ikilisi
+        groups = {}
+        for namespace, mapping in (
+            ('soft', SOFT_SKILL_KEYWORDS),
+            ('title_industry', TITLE_INDUSTRY_KEYWORDS),
+            ('degree_industry', DEGREE_INDUSTRY_KEYWORDS),
+            ('fallback_industry', FALLBACK_INDUSTRY_KEYWORDS),
+            ('title_level', TITLE_LEVEL_KEYWORDS),
+            ('degree_simulation', DEGREE_SIMULATION_KEYWORDS),
+            ('role', ROLE_TYPE_KEYWORDS),
+            ('seniority', SENIORITY_KEYWORDS),
+            ('gap_role', {role: [role] for role in TAXONOMY.role_gaps}),
+            ('scenario', SCENARIO_KEYWORDS),
+        ):
+            for category, keywords in mapping.items():
+                groups[(namespace, category)] = keywords
+        self.matcher = KeywordMatcher(groups)
+    
+    def analyze_user_profile(self, profile: Dict) -> ProfileAnalysis:
+        """Kullanıcı profilini analiz et
+
+        Alanlar ilk okunduklarında hesaplanır. Unvan ve bölüm otomatta en
+        fazla birer kez taranır ve sektör, kıdem, eksikler ve
+        kişiselleştirme parametreleri bu ortak sonuçları paylaşır.
+        """
+        return ProfileAnalysis(self, Profile.from_dict(profile))
     
-    def analyze_user_profile(self, profile: Dict) -> Dict[str, Any]:
-        """Kullanıcı profilini detaylı analiz et"""
-        skills = profile.get('skills', [])
-        experiences = profile.get('experiences', [])
-        current_title = profile.get('current_title', '')
-        experience_level = profile.get('experience_level', 'junior')
+    def _core_technical_skills(self, skills: Iterable[str], industrial: bool) -> Dict[str, List[str]]:
+        """Temel dil/framework/araç becerilerini ayır; endüstri mühendisliği için varsayılanları ekle"""
+        technical_skills = {'programming_languages': [], 'frameworks': [], 'tools': []}
+        for skill in skills:
+            group = TECHNICAL_SKILL_GROUPS.get(TAXONOMY.category(skill))
+            if group:
+                technical_skills[group].append(skill)
         
-        analysis = {
-            'technical_skills': self._categorize_skills(skills),
-            'soft_skills': self._extract_soft_skills(experiences),
-            'industry_focus': self._determine_industry(current_title, experiences),
-            'role_type': self._determine_role_type(current_title),
-            'experience_depth': self._calculate_experience_depth(experiences),
-            'career_trajectory': self._analyze_career_trajectory(experiences),
-            'skill_gaps': self._identify_skill_gaps(skills, current_title),
-            'personalization_params': self._generate_personalization_params(profile)
-        }
+        if industrial:
+            technical_skills['tools'].extend(INDUSTRIAL_ENGINEERING_TOOLS)
+            if not technical_skills['programming_languages']:
+                technical_skills['programming_languages'].extend(["Python", "SQL"])
         
-        return analysis
+        return technical_skills
+    
+    def _personality_soft_skills(self, personality: Dict) -> List[str]:
+        """Kişilik tipinden (MBTI) soft skill'leri çıkar"""
+        personality_type = personality.get('personality_type') or ''
+        soft_skills = []
+        for letter, letter_skills in PERSONALITY_SOFT_SKILLS.items():
+            if letter in personality_type:
+                soft_skills.extend(letter_skills)
+        return soft_skills
     
-    def _categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
+    def _categorize_skills(self, skills: Iterable[str]) -> Dict[str, List[str]]:
         """Becerileri kategorilere ayır"""
-        categories = {
-            'programming': [],
-            'frameworks': [],
-            'databases': [],
-            'cloud': [],
-            'devops': [],
-            'design': [],
-            'management': [],
-            'communication': [],
-            'other': []
-        }
-        
-        skill_mapping = {
-            'programming': ['python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin'],
-            'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 'laravel'],
-            'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'oracle'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes'],
-            'devops': ['jenkins', 'gitlab', 'github actions', 'terraform', 'ansible'],
-            'design': ['figma', 'sketch', 'photoshop', 'ui/ux', 'design thinking'],
-            'management': ['project management', 'scrum', 'agile', 'leadership', 'team management']
-        }
+        categories = {category: [] for category in TAXONOMY.categories}
+        categories['communication'] = []
+        categories['other'] = []
         
         for skill in skills:
-            skill_lower = skill.lower()
-            categorized = False
-            
-            for category, keywords in skill_mapping.items():
-                if any(keyword in skill_lower for keyword in keywords):
-                    categories[category].append(skill)
-                    categorized = True
-                    break
-            
-            if not categorized:
-                categories['other'].append(skill)
+            categories[TAXONOMY.category(skill) or 'other'].append(skill)
         
         return categories
     
-    def _extract_soft_skills(self, experiences: List[Dict]) -> List[str]:
+    def _extract_soft_skills(self, experiences: Iterable[Experience]) -> List[str]:
         """Deneyimlerden soft skill'leri çıkar"""
-        soft_skills = set()
-        
+        hits = set()
         for exp in experiences:
-            description = exp.get('description', '').lower()
-            
-            # Leadership
-            if any(word in description for word in ['lead', 'manage', 'coordinate', 'supervise']):
-                soft_skills.add('leadership')
-            
-            # Communication
-            if any(word in description for word in ['present', 'communicate', 'collaborate', 'meeting']):
-                soft_skills.add('communication')
-            
-            # Problem solving
-            if any(word in description for word in ['solve', 'debug', 'troubleshoot', 'optimize']):
-                soft_skills.add('problem_solving')
-            
-            # Project management
-            if any(word in description for word in ['project', 'plan', 'deadline', 'deliver']):
-                soft_skills.add('project_management')
+            hits.update(self.matcher.scan(exp.description))
         
-        return list(soft_skills)
+        return [category for category in SOFT_SKILL_KEYWORDS if ('soft', category) in hits]
     
-    def _determine_industry(self, current_title: str, experiences: List[Dict]) -> str:
-        """Kullanıcının sektörünü belirle"""
-        title_lower = current_title.lower()
-        
-        if any(word in title_lower for word in ['developer', 'engineer', 'programmer', 'software']):
-            return 'technology'
-        elif any(word in title_lower for word in ['designer', 'ux', 'ui']):
-            return 'design'
-        elif any(word in title_lower for word in ['manager', 'lead', 'director']):
-            return 'management'
-        elif any(word in title_lower for word in ['analyst', 'data', 'scientist']):
-            return 'data_science'
-        else:
-            return 'general'
+    def _determine_industry(self, title_hits, degree_hits) -> str:
+        """Unvan ve bölümden kullanıcının sektörünü belirle"""
+        for namespace, mapping, hits in (
+            ('title_industry', TITLE_INDUSTRY_KEYWORDS, title_hits),
+            ('degree_industry', DEGREE_INDUSTRY_KEYWORDS, degree_hits),
+            ('fallback_industry', FALLBACK_INDUSTRY_KEYWORDS, title_hits),
+        ):
+            for industry in mapping:
+                if (namespace, industry) in hits:
+                    return industry
+        return DEFAULT_INDUSTRY
+    
+    def _determine_role_level(self, title_hits, experience_level: str) -> str:
+        """Unvan ve deneyim seviyesinden kıdemi belirle"""
+        for level in TITLE_LEVEL_KEYWORDS:
+            if ('title_level', level) in title_hits:
+                return level
+        if experience_level in ['junior', 'entry']:
+            return 'junior'
+        return 'individual_contributor'
     
     def _determine_role_type(self, current_title: str) -> str:
-        """Kullanıcının rol tipini belirle"""
-        title_lower = current_title.lower()
-        
-        if any(word in title_lower for word in ['frontend', 'front-end', 'ui']):
-            return 'frontend'
-        elif any(word in title_lower for word in ['backend', 'back-end', 'api']):
-            return 'backend'
-        elif any(word in title_lower for word in ['fullstack', 'full-stack']):
-            return 'fullstack'
-        elif any(word in title_lower for word in ['devops', 'sre', 'infrastructure']):
-            return 'devops'
-        elif any(word in title_lower for word in ['mobile', 'ios', 'android']):
-            return 'mobile'
-        else:
-            return 'general'
+        """Kullanıcının rol odağını (frontend, backend, ...) belirle"""
+        label = self.matcher.first(current_title, [('role', role) for role in ROLE_TYPE_KEYWORDS])
+        return label[1] if label else 'general'
     
-    def _calculate_experience_depth(self, experiences: List[Dict]) -> int:
+    def _calculate_experience_depth(self, experiences: Tuple[Experience, ...]) -> int:
         """Deneyim derinliğini hesapla (1-10 arası)"""
         if not experiences:
             return 1
         
         total_years = 0
         for exp in experiences:
-            duration = exp.get('duration', '')
+            duration = exp.duration
             if 'year' in duration.lower():
                 try:
                     years = int(duration.split()[0])
@@ -169,18 +397,27 @@ class PersonalizationEngine:
         
         return min(10, max(1, int(total_years)))
     
-    def _analyze_career_trajectory(self, experiences: List[Dict]) -> str:
-        """Kariyer yörüngesini analiz et"""
+    def _analyze_career_trajectory(self, experiences: Tuple[Experience, ...], experience_level: str, title_hits) -> str:
+        """Kariyer yörüngesini analiz et
+
+        En az iki deneyim varsa pozisyon geçmişine, yoksa deneyim seviyesi
+        ve unvana bakılır.
+        """
         if len(experiences) < 2:
-            return 'entry_level'
-        
-        positions = [exp.get('position', '').lower() for exp in experiences]
-        
-        junior_keywords = ['junior', 'intern', 'trainee', 'assistant']
-        senior_keywords = ['senior', 'lead', 'principal', 'manager', 'director']
+            if experience_level in ['junior', 'entry']:
+                return 'growing'
+            if experience_level in ['senior', 'lead']:
+                return 'expert'
+            if ('fallback_industry', 'management') in title_hits:
+                return 'management_track'
+            return 'entry_level' if not experiences else 'stable'
+        
+        hits = set()
+        for exp in experiences:
+            hits.update(self.matcher.scan(exp.position))
         
-        has_junior = any(any(keyword in pos for keyword in junior_keywords) for pos in positions)
-        has_senior = any(any(keyword in pos for keyword in senior_keywords) for pos in positions)
+        has_junior = ('seniority', 'junior') in hits
+        has_senior = ('seniority', 'senior') in hits
         
         if has_junior and has_senior:
             return 'advancing'
@@ -191,40 +428,54 @@ class PersonalizationEngine:
         else:
             return 'stable'
     
-    def _identify_skill_gaps(self, skills: List[str], current_title: str) -> List[str]:
+    def _identify_skill_gaps(self, skills: Iterable[str], title_hits) -> List[str]:
         """Pozisyona göre eksik becerileri belirle"""
-        skill_recommendations = {
-            'developer': ['git', 'testing', 'debugging', 'api design'],
-            'frontend': ['responsive design', 'performance optimization', 'accessibility'],
-            'backend': ['database design', 'api security', 'scalability'],
-            'manager': ['agile methodologies', 'team building', 'stakeholder management'],
-            'designer': ['user research', 'prototyping', 'design systems']
-        }
-        
-        title_lower = current_title.lower()
-        current_skills_lower = [skill.lower() for skill in skills]
+        covered = {TAXONOMY.canonical(skill) for skill in skills}
         
         gaps = []
-        for role, recommended_skills in skill_recommendations.items():
-            if role in title_lower:
+        for role, recommended_skills in TAXONOMY.role_gaps.items():
+            if ('gap_role', role) in title_hits:
                 for rec_skill in recommended_skills:
-                    if not any(rec_skill in current_skill for current_skill in current_skills_lower):
+                    if TAXONOMY.canonical(rec_skill) not in covered:
                         gaps.append(rec_skill)
         
         return gaps[:5]  
     
-    def _generate_personalization_params(self, profile: Dict) -> Dict[str, Any]:
+    def _profile_skill_gaps(self, role_type: str, industry_focus: str,
+                            technical_skills: Dict[str, List[str]], soft_skills: List[str]) -> List[str]:
+        """Kıdem, sektör ve mevcut becerilere göre genel eksikleri belirle"""
+        gaps = []
+        if role_type in ["senior_individual_contributor", "management"] and not technical_skills['programming_languages']:
+            gaps.append("teknik_liderlik")
+        if industry_focus == "technology" and not technical_skills['frameworks']:
+            gaps.append("modern_frameworks")
+        if role_type == "management" and "liderlik" not in soft_skills and "leadership" not in soft_skills:
+            gaps.append("liderlik_becerileri")
+        return gaps
+    
+    def _generate_personalization_params(self, experience_level: str, skills_count: int, skill_gaps: List[str],
+                                         title_hits, degree_hits, personality: Dict) -> Dict[str, Any]:
         """Kişiselleştirme parametrelerini üret"""
-        experience_level = profile.get('experience_level', 'junior')
-        skills_count = len(profile.get('skills', []))
-        
         return {
+            'difficulty_preference': self._difficulty_preference(experience_level),
             'complexity_preference': self._calculate_complexity_preference(experience_level, skills_count),
-            'scenario_types': self._determine_preferred_scenarios(profile),
-            'learning_focus': self._determine_learning_focus(profile),
-            'challenge_areas': self._identify_challenge_areas(profile)
+            'learning_style': personality.get('learning_style') or 'mixed',
+            'feedback_style': 'detailed',
+            'collaboration_preference': 'team' if 'E' in (personality.get('personality_type') or '') else 'individual',
+            'simulation_types': self._determine_simulation_types(experience_level, degree_hits),
+            'scenario_types': self._determine_preferred_scenarios(title_hits),
+            'learning_focus': self._determine_learning_focus(experience_level, skill_gaps),
+            'challenge_areas': self._identify_challenge_areas(experience_level)
         }
     
+    def _difficulty_preference(self, experience_level: str) -> str:
+        """Deneyim seviyesine göre simülasyon zorluğu"""
+        if experience_level in ['junior', 'entry']:
+            return 'easy'
+        if experience_level in ['senior', 'lead']:
+            return 'hard'
+        return 'medium'
+    
     def _calculate_complexity_preference(self, experience_level: str, skills_count: int) -> str:
         """Kullanıcının tercih ettiği karmaşıklık seviyesini hesapla"""
         if experience_level in ['senior', 'lead'] or skills_count > 15:
@@ -234,30 +485,44 @@ class PersonalizationEngine:
         else:
             return 'low'
     
-    def _determine_preferred_scenarios(self, profile: Dict) -> List[str]:
+    def _determine_simulation_types(self, experience_level: str, degree_hits) -> List[str]:
+        """Bölüm ve seviyeye göre simülasyon tiplerini belirle"""
+        industrial = ('degree_industry', 'industrial_engineering') in degree_hits
+        if industrial:
+            simulation_types = ["process_optimization", "project_management", "data_analysis", "quality_control"]
+        elif ('degree_simulation', 'software') in degree_hits:
+            simulation_types = ["coding", "system_design", "debugging"]
+        elif ('degree_simulation', 'hardware') in degree_hits:
+            simulation_types = ["technical_problem_solving", "design_review", "testing"]
+        else:
+            simulation_types = ["problem_solving", "communication", "process_optimization"]
+        
+        if experience_level in ['junior', 'entry']:
+            if industrial:
+                simulation_types = ["basic_process_analysis", "entry_level_projects", "learning_orientation"]
+        elif experience_level in ['senior', 'lead']:
+            simulation_types = simulation_types + ["leadership", "strategic_thinking"]
+        return simulation_types
+    
+    def _determine_preferred_scenarios(self, title_hits) -> List[str]:
         """Kullanıcının tercih ettiği senaryo tiplerini belirle"""
-        current_title = profile.get('current_title', '').lower()
         scenarios = []
         
-        if any(word in current_title for word in ['developer', 'engineer']):
+        if ('scenario', 'engineering') in title_hits:
             scenarios.extend(['coding', 'code_review', 'debugging'])
         
-        if any(word in current_title for word in ['manager', 'lead']):
+        if ('scenario', 'management') in title_hits:
             scenarios.extend(['team_management', 'project_planning', 'stakeholder_meeting'])
         
-        if any(word in current_title for word in ['designer']):
+        if ('scenario', 'design') in title_hits:
             scenarios.extend(['design_review', 'user_research', 'client_presentation'])
         
-        
         scenarios.extend(['email_communication', 'problem_solving', 'time_management'])
         
-        return list(set(scenarios))
+        return list(dict.fromkeys(scenarios))
     
-    def _determine_learning_focus(self, profile: Dict) -> List[str]:
+    def _determine_learning_focus(self, experience_level: str, skill_gaps: List[str]) -> List[str]:
         """Öğrenme odak alanlarını belirle"""
-        gaps = self._identify_skill_gaps(profile.get('skills', []), profile.get('current_title', ''))
-        experience_level = profile.get('experience_level', 'junior')
-        
         focus_areas = []
         
         if experience_level == 'junior':
@@ -267,27 +532,47 @@ class PersonalizationEngine:
         else:
             focus_areas.extend(['strategic_thinking', 'team_building', 'business_acumen'])
         
+        focus_areas.extend(skill_gaps[:3])
         
-        if gaps:
-            focus_areas.extend(gaps[:3])
-        
-        return list(set(focus_areas))
+        return list(dict.fromkeys(focus_areas))
     
-    def _identify_challenge_areas(self, profile: Dict) -> List[str]:
+    def _identify_challenge_areas(self, experience_level: str) -> List[str]:
         """Zorluk alanlarını belirle"""
-        current_title = profile.get('current_title', '').lower()
-        experience_level = profile.get('experience_level', 'junior')
-        
-        challenges = []
-        
         if experience_level == 'junior':
-            challenges.extend(['complex_problem_solving', 'time_pressure', 'multiple_priorities'])
+            return ['complex_problem_solving', 'time_pressure', 'multiple_priorities']
         elif experience_level == 'mid':
-            challenges.extend(['team_conflicts', 'technical_decisions', 'client_communication'])
+            return ['team_conflicts', 'technical_decisions', 'client_communication']
         else:
-            challenges.extend(['strategic_planning', 'organizational_change', 'cross_team_coordination'])
-        
-        return challenges
+            return ['strategic_planning', 'organizational_change', 'cross_team_coordination']
+
+    def analyze_profiles_batch(self, profiles: Iterable[Dict], workers: int = None,
+                               chunk_size: int = BATCH_CHUNK_SIZE,
+                               parallel_threshold: int = BATCH_PARALLEL_THRESHOLD) -> Iterator[Dict[str, Any]]:
+        """Profilleri sırayla analiz edip sonuçları giriş sırasında akıt
+
+        parallel_threshold'dan az profil bu süreçte, bu motorun otomatıyla
+        analiz edilir. Daha büyük girişler chunk_size'lık parçalar halinde
+        süreç havuzuna dağıtılır; bellekte en fazla workers * 2 parça tutulur.
+        """
+        profiles = iter(profiles)
+        head = list(islice(profiles, parallel_threshold))
+        if len(head) < parallel_threshold:
+            for profile in head:
+                yield self.analyze_user_profile(profile).to_dict()
+            return
+
+        workers = workers or os.cpu_count() or 1
+        chunks = iter(lambda: list(islice(profiles, chunk_size)), [])
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as pool:
+            for i in range(0, len(head), chunk_size):
+                pending.append(pool.submit(_analyze_chunk, head[i:i + chunk_size]))
+            for chunk in chunks:
+                while len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+                pending.append(pool.submit(_analyze_chunk, chunk))
+            while pending:
+                yield from pending.popleft().result()
 
     def generate_personalized_prompt(self, user_analysis: Dict, base_prompt: str) -> str:
         """Kullanıcı analizine göre kişiselleştirilmiş prompt üret"""
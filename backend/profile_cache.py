@@ -0,0 +1,98 @@
+"""
+KariyerAI - Profil Önbelleği
+profiles satırlarını kullanıcı id'si ve e-posta ile kısa süreli bellekte
+tutar; arka arkaya gelen istekler Supabase'e tek kez gider.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from llm_client import SingleFlight
+from supabase_client import SupabaseClient, SupabaseError, escape_like
+
+# Profil satırının yeniden okunmadan kullanılacağı süre (saniye)
+PROFILE_CACHE_TTL = 60
+
+
+class ProfileCache:
+    """Supabase profiles tablosu için read-through önbellek"""
+
+    def __init__(self, supabase: SupabaseClient, ttl: int = PROFILE_CACHE_TTL, max_entries: int = 1024):
+        self.supabase = supabase
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # ("id"|"email"|"email_ci", değer) -> (expires_at, profile)
+        self._lock = threading.Lock()
+        self.inflight = SingleFlight()
+
+    def by_id(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        """Profili id ile getir, bulunamazsa None"""
+        return self._lookup(("id", str(user_id)), lambda: self.supabase.table("profiles").eq("id", user_id))
+
+    def by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Profili e-postanın birebir eşleşmesiyle getir, bulunamazsa None"""
+        email = email or ""
+        return self._lookup(("email", email), lambda: self.supabase.table("profiles").eq("email", email))
+
+    def by_email_insensitive(self, email: str) -> Optional[Dict[str, Any]]:
+        """Profili e-posta ile (büyük/küçük harf duyarsız) getir, bulunamazsa None"""
+        email = (email or "").strip()
+        return self._lookup(("email_ci", email.lower()),
+                            lambda: self.supabase.table("profiles").ilike("email", escape_like(email)))
+
+    def put(self, profile: Dict[str, Any]) -> None:
+        """Profili id ve e-posta anahtarlarıyla sakla"""
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            for key in self._keys(profile):
+                self._entries[key] = (expires_at, profile)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Any = None, email: Optional[str] = None) -> None:
+        """Profil yazıldığında ilgili kayıtları (diğer anahtarıyla birlikte) sil"""
+        with self._lock:
+            keys = set()
+            if user_id is not None:
+                keys.add(("id", str(user_id)))
+            if email:
+                keys.update({("email", email), ("email", email.strip()), ("email_ci", email.strip().lower())})
+            for key in list(keys):
+                entry = self._entries.get(key)
+                if entry:
+                    keys.update(self._keys(entry[1]))
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def _lookup(self, key: tuple, query) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
+        def fetch():
+            response = query().get()
+            if response.status_code != 200:
+                raise SupabaseError(f"Profil alınamadı: {response.status_code}", response.status_code, response.text)
+            rows = response.json()
+            if not rows:
+                return None
+            self.put(rows[0])
+            return rows[0]
+
+        profile = self.inflight.do("|".join(key), fetch)
+        return copy.deepcopy(profile)
+
+    @staticmethod
+    def _keys(profile: Dict[str, Any]):
+        keys = []
+        if profile.get("id") is not None:
+            keys.append(("id", str(profile["id"])))
+        if profile.get("email"):
+            keys.append(("email", profile["email"]))
+            keys.append(("email_ci", profile["email"].strip().lower()))
+        return keys
@@ -0,0 +1,156 @@
+"""
+KariyerAI - Kariyer Simülasyonu Senaryo Havuzu
+Bölüm ailesi, deneyim seviyesi ve sektör odağına göre gruplanan, önceden
+üretilip doğrulanmış senaryoları tutar. İstekler havuzdan anında senaryo
+alır; azalan gruplar arka planda yeniden doldurulur. Henüz boş bir grubun
+ilk isteği, doldurmanın ilk senaryosunu süre sınırıyla bekleyebilir.
+"""
+import copy
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from personalization_engine import DEFAULT_INDUSTRY
+
+# Grup başına hazır tutulacak senaryo sayısı
+SCENARIO_POOL_SIZE = 3
+# Bir doldurma turunda grup başına en fazla deneme (uyumsuz senaryolar atılır)
+MAX_FILL_ATTEMPTS = 6
+
+# Bölüm ailesi -> bölüm adında geçen anahtar kelimeler (sıra önemlidir)
+DEGREE_FAMILY_KEYWORDS = (
+    ("industrial_engineering", ("endüstri mühendisliği", "industrial engineering")),
+    ("software", ("bilgisayar", "yazılım", "computer", "software")),
+    ("mechanical", ("makine", "mechanical")),
+)
+
+# Havuz senaryosu üretilirken bölüm ailesi ve sektörü temsil eden profil alanları
+FAMILY_DEGREES = {
+    "industrial_engineering": "Endüstri Mühendisliği",
+    "software": "Bilgisayar Mühendisliği",
+    "mechanical": "Makine Mühendisliği",
+}
+INDUSTRY_TITLES = {
+    "technology": "Software Engineer",
+    "design": "UX Designer",
+    "management": "Manager",
+    "analytics": "Data Analyst",
+}
+
+Bucket = Tuple[str, str, str]
+
+
+def degree_family(degree: str) -> str:
+    """Bölüm adını bölüm ailesine indir ("Bilgisayar Mühendisliği" -> "software")
+
+    Bilinen bir aileye girmeyen bölümler, farklı bölümlerin senaryoları
+    karışmasın diye normalize edilmiş kendi adlarıyla gruplanır; bölümü
+    olmayan profiller "other" grubuna düşer.
+    """
+    degree = " ".join((degree or "").replace("İ", "i").lower().split())
+    for family, keywords in DEGREE_FAMILY_KEYWORDS:
+        if any(keyword in degree for keyword in keywords):
+            return family
+    return degree or "other"
+
+
+def scenario_bucket(profile: Dict[str, Any], analysis: Any) -> Bucket:
+    """Profilin senaryo grubu: (bölüm ailesi, deneyim seviyesi, sektör odağı)"""
+    return (
+        degree_family(profile.get("degree")),
+        (profile.get("experience_level") or "junior").lower(),
+        analysis.get("industry_focus") or DEFAULT_INDUSTRY,
+    )
+
+
+def bucket_profile(bucket: Bucket) -> Dict[str, Any]:
+    """Grubu temsil eden, kişisel alan içermeyen örnek profil"""
+    family, experience_level, industry = bucket
+    return {
+        "degree": FAMILY_DEGREES.get(family, "" if family == "other" else family),
+        "current_title": INDUSTRY_TITLES.get(industry, ""),
+        "skills": [],
+        "experience_level": experience_level,
+    }
+
+
+def personalize_scenario(scenario: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Havuz senaryosunu kullanıcının adı, okulu, bölümü ve unvanıyla doldur"""
+    scenario = copy.deepcopy(scenario)
+    first_name = profile.get("first_name") or "Kullanıcı"
+    background = " ".join(part for part in (profile.get("university"), profile.get("degree")) if part)
+    intro = f"{background} mezunu {first_name} olarak" if background else f"{first_name} olarak"
+    context = scenario.get("context") or ""
+    scenario["context"] = f"{intro}, {context[:1].lower()}{context[1:]}" if context else intro
+    if profile.get("current_title"):
+        scenario["role"] = profile["current_title"]
+    return scenario
+
+
+class ScenarioPool:
+    """Grup başına hazır senaryo kuyruğu ve arka plan doldurucusu
+
+    generate_fn(profile) doğrulanmış bir senaryo ya da None döndürür. Doldurma
+    isteği yapan kullanıcının profiliyle değil, grubun kendi özniteliklerinden
+    kurulan bucket_profile ile yapılır.
+    """
+
+    def __init__(self, generate_fn: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                 size: int = SCENARIO_POOL_SIZE, max_attempts: int = MAX_FILL_ATTEMPTS):
+        self.generate_fn = generate_fn
+        self.size = size
+        self.max_attempts = max_attempts
+        self._scenarios: Dict[Bucket, Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._pending = set()
+
+    def take(self, bucket: Bucket, wait: float = 0) -> Optional[Dict[str, Any]]:
+        """Gruptan bir senaryo al ve grubu arka planda tamamla
+
+        Grup boşsa en fazla wait saniye doldurmanın ilk senaryosu beklenir;
+        gelmezse ya da doldurma sonuçsuz biterse None döner.
+        """
+        with self._lock:
+            queue = self._scenarios.setdefault(bucket, deque())
+        if not queue and wait > 0:
+            self.schedule_fill(bucket)
+            with self._ready:
+                self._ready.wait_for(lambda: queue or bucket not in self._pending, timeout=wait)
+        with self._lock:
+            scenario = queue.popleft() if queue else None
+        self.schedule_fill(bucket)
+        return scenario
+
+    def size_of(self, bucket: Bucket) -> int:
+        with self._lock:
+            return len(self._scenarios.get(bucket, ()))
+
+    def schedule_fill(self, bucket: Bucket) -> bool:
+        """Grup eksikse ve zaten doldurulmuyorsa arka plan doldurması başlat"""
+        with self._lock:
+            if bucket in self._pending or bucket not in self._scenarios:
+                return False
+            if len(self._scenarios[bucket]) >= self.size:
+                return False
+            self._pending.add(bucket)
+        threading.Thread(target=self._fill, args=(bucket,), daemon=True).start()
+        return True
+
+    def _fill(self, bucket: Bucket) -> None:
+        try:
+            profile = bucket_profile(bucket)
+            for _ in range(self.max_attempts):
+                if self.size_of(bucket) >= self.size:
+                    break
+                scenario = self.generate_fn(dict(profile))
+                if scenario is not None:
+                    with self._ready:
+                        self._scenarios[bucket].append(scenario)
+                        self._ready.notify_all()
+        except Exception as e:
+            print(f"⚠️ Senaryo havuzu doldurma hatası ({bucket}): {e}")
+        finally:
+            with self._ready:
+                self._pending.discard(bucket)
+                self._ready.notify_all()
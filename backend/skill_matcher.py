@@ -0,0 +1,71 @@
+"""
+KariyerAI - Beceri Eşleştirme Motoru
+İş ilanı gereksinimlerini kullanıcının becerileriyle beceri taksonomisindeki
+kanonik adlar üzerinden eşleştirir ve ilanları uygunluk puanına göre sıralar.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from skill_taxonomy import TAXONOMY
+
+
+def normalize_skill(skill: str) -> str:
+    """Beceri adını kanonik biçimine indir ("React.js" -> "react")"""
+    return TAXONOMY.canonical(skill)
+
+
+def build_skill_weights(skills: Iterable[str], skill_levels: Optional[Iterable[Dict[str, Any]]] = None) -> Dict[str, float]:
+    """Profil becerilerinden kanonik beceri -> ağırlık (0-1) tablosu oluştur
+
+    skill_levels'ta seviyesi olan beceriler seviye/100 ağırlık alır,
+    seviyesi bilinmeyen profil becerileri tam ağırlık alır.
+    """
+    weights = {}
+    for skill in skills or []:
+        canonical = normalize_skill(skill)
+        if canonical:
+            weights[canonical] = 1.0
+    for row in skill_levels or []:
+        canonical = normalize_skill(row.get("skill", ""))
+        if not canonical:
+            continue
+        try:
+            weights[canonical] = max(0.0, min(100.0, float(row.get("level", 100)))) / 100
+        except (TypeError, ValueError):
+            weights.setdefault(canonical, 1.0)
+    return weights
+
+
+def score_jobs(jobs: List[Dict[str, Any]], weights: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Tüm ilanları tek geçişte puanla ve uygunluğa göre sıralı döndür
+
+    Her ilana match_percentage (eşleşen gereksinim oranı), match_score
+    (seviye ağırlıklı oran) ve eşleşen/eksik gereksinim listeleri eklenir.
+    """
+    scored = []
+    for job in jobs:
+        matched, missing = [], []
+        weight_sum = 0.0
+        seen = set()
+        for requirement in job.get("requirements") or []:
+            canonical = normalize_skill(requirement)
+            if not canonical or canonical in seen:
+                continue
+            seen.add(canonical)
+            weight = weights.get(canonical)
+            if weight is None:
+                missing.append(requirement)
+            else:
+                matched.append(requirement)
+                weight_sum += weight
+
+        total = len(matched) + len(missing)
+        scored.append({
+            **job,
+            "matched_skills": matched,
+            "missing_skills": missing,
+            "match_percentage": round(100 * len(matched) / total) if total else 0,
+            "match_score": round(100 * weight_sum / total, 1) if total else 0.0,
+        })
+
+    scored.sort(key=lambda job: (job["match_score"], job["match_percentage"]), reverse=True)
+    return scored
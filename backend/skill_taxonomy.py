@@ -0,0 +1,72 @@
+"""
+KariyerAI - Beceri Taksonomisi
+skill_taxonomy.json dosyasındaki beceri, eş anlamlı yazım, kategori ve rol
+önerilerini açılışta bir kez okuyup sabit zamanlı arama tablolarına çevirir.
+"""
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_taxonomy.json")
+
+_SPACES_RE = re.compile(r"\s+")
+
+
+def normalize_term(text: str) -> str:
+    """Beceri yazımını karşılaştırma için sadeleştir ("  React.JS " -> "react.js")"""
+    if not isinstance(text, str):
+        return ""
+    return _SPACES_RE.sub(" ", text.replace("İ", "i").lower()).strip(" .,;:-")
+
+
+class SkillTaxonomy:
+    """Beceri taksonomisi ve arama indeksleri
+
+    alias -> kanonik beceri, kanonik beceri -> kategori ve
+    rol -> önerilen beceriler tabloları taksonomi büyüdükçe sabit
+    zamanlı kalır.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.categories: List[str] = list(data.get("categories", []))
+        self._canonical: Dict[str, str] = {}
+        self._category: Dict[str, str] = {}
+        for canonical, entry in data.get("skills", {}).items():
+            key = normalize_term(canonical)
+            self._canonical[key] = key
+            self._category[key] = entry.get("category", "other")
+            for alias in entry.get("aliases", []):
+                self._canonical[normalize_term(alias)] = key
+
+        self.role_gaps: Dict[str, List[str]] = {
+            normalize_term(role): list(skills) for role, skills in data.get("role_gaps", {}).items()
+        }
+        self.specializations: Dict[str, List[str]] = dict(data.get("specializations", {}))
+        self.default_specialization_skills: List[str] = list(data.get("default_specialization_skills", []))
+
+    @classmethod
+    def load(cls, path: str = TAXONOMY_PATH) -> "SkillTaxonomy":
+        """Taksonomi dosyasını okuyup indeksle"""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def canonical(self, skill: str) -> str:
+        """Becerinin kanonik adı; taksonomide yoksa sadeleştirilmiş hali"""
+        key = normalize_term(skill)
+        return self._canonical.get(key, key)
+
+    def category(self, skill: str) -> Optional[str]:
+        """Becerinin kategorisi; taksonomide yoksa None"""
+        return self._category.get(self.canonical(skill))
+
+    def gaps_for_role(self, role: str) -> List[str]:
+        """Rol için önerilen beceriler"""
+        return self.role_gaps.get(normalize_term(role), [])
+
+    def specialization_skills(self, specialization: str) -> List[str]:
+        """Uzmanlık alanı için geliştirilecek beceriler"""
+        return self.specializations.get(specialization, self.default_specialization_skills)
+
+
+TAXONOMY = SkillTaxonomy.load()
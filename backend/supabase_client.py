@@ -0,0 +1,121 @@
+"""
+KariyerAI - Supabase REST İstemcisi
+Supabase PostgREST uç noktalarına kalıcı, havuzlu bir oturum ve küçük bir
+sorgu oluşturucu (select/eq/ilike/order) üzerinden erişir.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) zaman aşımı (saniye)
+DEFAULT_TIMEOUT = (5, 10)
+
+
+class SupabaseError(Exception):
+    """Supabase isteği başarısız olduğunda fırlatılır"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, body: str = ""):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+def escape_like(value: str) -> str:
+    """LIKE/ILIKE joker karakterlerini (%, _) birebir eşleşecek şekilde kaçır
+
+    PostgREST "*" karakterini "%"ye çevirdiği için "*" kaçırılamaz; içinde
+    "*" geçen değerler joker olarak eşleşir.
+    """
+    for char in ("\\", "%", "_"):
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+class SupabaseQuery:
+    """Tek bir tablo için zincirlenebilir PostgREST sorgusu"""
+
+    def __init__(self, client: "SupabaseClient", table: str):
+        self.client = client
+        self.table = table
+        self.params: List[Tuple[str, str]] = []
+
+    def select(self, columns: str = "*") -> "SupabaseQuery":
+        self.params.append(("select", columns))
+        return self
+
+    def eq(self, column: str, value: Any) -> "SupabaseQuery":
+        self.params.append((column, f"eq.{value}"))
+        return self
+
+    def ilike(self, column: str, pattern: str) -> "SupabaseQuery":
+        self.params.append((column, f"ilike.{pattern}"))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "SupabaseQuery":
+        self.params.append(("order", f"{column}.{'desc' if desc else 'asc'}"))
+        return self
+
+    def limit(self, count: int) -> "SupabaseQuery":
+        self.params.append(("limit", str(count)))
+        return self
+
+    def get(self) -> requests.Response:
+        """Satırları getir (GET)"""
+        return self.client.request("GET", self.table, self.params)
+
+    def insert(self, data: Any, returning: bool = True) -> requests.Response:
+        """Satır ya da satır dizisi ekle (POST)"""
+        return self.client.request("POST", self.table, self.params, json=data,
+                                   prefer="return=representation" if returning else "return=minimal")
+
+    def upsert(self, data: Any, on_conflict: str, ignore_duplicates: bool = False,
+               returning: bool = True) -> requests.Response:
+        """Satır(lar)ı ekle; on_conflict sütunlarında çakışanları birleştir ya da atla"""
+        resolution = "ignore-duplicates" if ignore_duplicates else "merge-duplicates"
+        prefer = f"resolution={resolution},return={'representation' if returning else 'minimal'}"
+        return self.client.request("POST", self.table, self.params + [("on_conflict", on_conflict)],
+                                   json=data, prefer=prefer)
+
+    def update(self, data: Dict[str, Any], returning: bool = True) -> requests.Response:
+        """Filtreye uyan satırları güncelle (PATCH)"""
+        return self.client.request("PATCH", self.table, self.params, json=data,
+                                   prefer="return=representation" if returning else "return=minimal")
+
+    def delete(self) -> requests.Response:
+        """Filtreye uyan satırları sil (DELETE)"""
+        return self.client.request("DELETE", self.table, self.params)
+
+
+class SupabaseClient:
+    """Bağlantıları yeniden kullanan Supabase REST istemcisi"""
+
+    def __init__(self, base_url: str, api_key: str, pool_size: int = 20, timeout: Tuple[int, int] = DEFAULT_TIMEOUT):
+        self.rest_url = f"{(base_url or '').rstrip('/')}/rest/v1"
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "apikey": api_key or "",
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        })
+
+    def table(self, name: str) -> SupabaseQuery:
+        """Tablo için yeni sorgu başlat"""
+        return SupabaseQuery(self, name)
+
+    def request(self, method: str, table: str, params: List[Tuple[str, str]], json: Any = None,
+                prefer: Optional[str] = None) -> requests.Response:
+        """Tabloya PostgREST isteği gönder"""
+        headers = {"Prefer": prefer} if prefer else None
+        return self.session.request(
+            method,
+            f"{self.rest_url}/{table}",
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=self.timeout,
+        )
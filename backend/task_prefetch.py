@@ -0,0 +1,92 @@
+"""
+KariyerAI - Görev Simülasyonu Ön Yükleme
+Kariyer senaryosu üretilir üretilmez günlük programdaki görevlerin
+simülasyonlarını arka planda hazırlar; /task-simulation önce burada hazır
+(ya da hazırlanmakta olan) sonuca bakar.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Hazırlanan görev simülasyonlarının saklanma süresi (saniye)
+TASK_PREFETCH_TTL = 30 * 60
+TASK_PREFETCH_MAX_ENTRIES = 2048
+TASK_PREFETCH_WORKERS = 4
+
+Key = Tuple[str, str]
+
+
+def task_key(task: Dict[str, Any], current_title: str) -> Key:
+    """Görev simülasyonu prompt'unu belirleyen alanlardan anahtar üret"""
+    return ((current_title or "").strip().lower(), (task.get("task") or "").strip().lower())
+
+
+class TaskPrefetcher:
+    """generate_fn(task, current_title) sonuçlarını önceden hesaplayıp saklar
+
+    generate_fn sözlük döndürür. Hata fırlatan (ya da None döndüren)
+    üretimler saklanmaz; görev istendiğinde yeniden üretilir.
+    """
+
+    def __init__(self, generate_fn: Callable[[Dict[str, Any], str], Optional[Dict[str, Any]]],
+                 ttl: int = TASK_PREFETCH_TTL, max_entries: int = TASK_PREFETCH_MAX_ENTRIES,
+                 workers: int = TASK_PREFETCH_WORKERS):
+        self.generate_fn = generate_fn
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task-prefetch")
+        self._entries: "OrderedDict[Key, Tuple[float, Future]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefetch(self, task: Dict[str, Any], current_title: str) -> bool:
+        """Görev için arka plan üretimi kuyruğa ekle; zaten varsa False"""
+        key = task_key(task, current_title)
+        if not key[1]:
+            return False
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return False
+            future = self._executor.submit(self._run, key, task, current_title)
+            self._entries[key] = (now + self.ttl, future)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                evicted.cancel()
+        return True
+
+    def get(self, task: Dict[str, Any], current_title: str) -> Optional[Dict[str, Any]]:
+        """Hazır ya da üretilmekte olan sonucu döndür
+
+        Üretim henüz kuyrukta bekliyorsa iptal edilir ve None döner; çağıran
+        beklemek yerine sonucu kendisi üretir.
+        """
+        key = task_key(task, current_title)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, future = entry
+            if expires_at <= time.time() or future.cancel():
+                del self._entries[key]
+                return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _run(self, key: Key, task: Dict[str, Any], current_title: str) -> Optional[Dict[str, Any]]:
+        try:
+            result = self.generate_fn(task, current_title)
+        except Exception as e:
+            print(f"⚠️ Görev simülasyonu ön yükleme hatası ({key[1]}): {e}")
+            result = None
+        if result is None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1].running():
+                    del self._entries[key]
+        return result
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend modülleri düz (paketsiz) içe aktarılır: from llm_json import ...
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
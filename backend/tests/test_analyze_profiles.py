@@ -0,0 +1,53 @@
+import json
+
+from analyze_profiles import main
+from personalization_engine import PersonalizationEngine
+from supabase_client import SupabaseClient
+
+PROFILES = [
+    {"id": i, "current_title": title, "skills": skills, "experience_level": "mid"}
+    for i, (title, skills) in enumerate([
+        ("Backend Developer", ["Python", "Docker"]),
+        ("UX Designer", ["Figma"]),
+        ("Data Scientist", ["Python", "SQL"]),
+        ("Endüstri Mühendisi", ["Excel"]),
+        ("Frontend Developer", ["React"]),
+    ])
+]
+
+
+class FakeResponse:
+    status_code = 201
+    text = ""
+
+
+def test_process_pool_path_keeps_input_order():
+    engine = PersonalizationEngine()
+    expected = [engine.analyze_user_profile(p).to_dict() for p in PROFILES]
+    results = engine.analyze_profiles_batch(iter(PROFILES), workers=2, chunk_size=2, parallel_threshold=4)
+    assert list(results) == expected
+
+
+def test_cli_writes_jsonl_and_upserts_in_batches(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    source.write_text("\n".join(json.dumps(p, ensure_ascii=False) for p in PROFILES) + "\n\n", encoding="utf-8")
+    target = tmp_path / "analyses.jsonl"
+
+    supabase = SupabaseClient("https://proje.supabase.co", "anahtar")
+    sent = []
+
+    def request(method, url, params=None, json=None, headers=None, timeout=None):
+        sent.append({"method": method, "url": url, "params": params, "json": json, "headers": headers})
+        return FakeResponse()
+
+    supabase.session.request = request
+    main([str(source), "-o", str(target), "--supabase-table", "profile_analyses", "--batch-size", "2"],
+         supabase=supabase)
+
+    rows = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert [row["id"] for row in rows] == [0, 1, 2, 3, 4]
+    assert [len(call["json"]) for call in sent] == [2, 2, 1]
+    assert sent[0]["url"] == "https://proje.supabase.co/rest/v1/profile_analyses"
+    assert ("on_conflict", "profile_id") in sent[0]["params"]
+    assert sent[0]["headers"]["Prefer"] == "resolution=merge-duplicates,return=minimal"
+    assert sent[2]["json"] == [{"profile_id": 4, "analysis": rows[4]["analysis"]}]
@@ -0,0 +1,221 @@
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import job_scraper
+from job_scraper import DomainThrottle, JobPageScraper, PageCache, domain_of
+
+
+def test_domain_of_folds_subdomains_into_known_domains():
+    assert domain_of("https://tr.linkedin.com/jobs/view/1") == "linkedin.com"
+    assert domain_of("https://www.example.com/ilan") == "example.com"
+    assert domain_of("https://jobs.example.com/ilan") == "jobs.example.com"
+
+
+def test_throttle_limits_concurrency_per_domain():
+    throttle = DomainThrottle({"slow.com": (2, 0)}, default=(8, 0))
+    active = {"slow.com": 0, "fast.com": 0}
+    peak = {"slow.com": 0, "fast.com": 0}
+    lock = threading.Lock()
+
+    def request(domain):
+        throttle.acquire(domain)
+        try:
+            with lock:
+                active[domain] += 1
+                peak[domain] = max(peak[domain], active[domain])
+            time.sleep(0.05)
+            with lock:
+                active[domain] -= 1
+        finally:
+            throttle.release(domain)
+
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        list(pool.map(request, ["slow.com"] * 6 + ["fast.com"] * 6))
+
+    assert peak["slow.com"] == 2
+    assert peak["fast.com"] > 2
+
+
+def test_throttle_spaces_request_starts_per_domain():
+    throttle = DomainThrottle({"spaced.com": (4, 0.05)}, default=(4, 0))
+    starts = []
+    lock = threading.Lock()
+
+    def request(_):
+        throttle.acquire("spaced.com")
+        with lock:
+            starts.append(time.monotonic())
+        throttle.release("spaced.com")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(request, range(4)))
+
+    starts.sort()
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.04 for gap in gaps), gaps
+
+
+def test_scrape_keeps_order_and_falls_back_to_snippets_after_deadline():
+    scraper = JobPageScraper(concurrency=3)
+
+    def fetch_page(url):
+        if url.endswith("yavas"):
+            time.sleep(1)
+        if url.endswith("hata"):
+            raise RuntimeError("bağlantı")
+        return {"title_tag": url, "headings": "", "body_snippet": ""}
+
+    scraper.fetch_page = fetch_page
+    links = [{"url": f"https://a.com/{name}", "title": name, "snippet": f"{name} özeti"}
+             for name in ("bir", "yavas", "hata")]
+    started = time.monotonic()
+    jobs = scraper.scrape(links, deadline=0.2)
+
+    assert time.monotonic() - started < 0.9
+    assert [job["search_title"] for job in jobs] == ["bir", "yavas", "hata"]
+    assert jobs[0]["title_tag"] == "https://a.com/bir"
+    assert jobs[1]["title_tag"] == "" and jobs[1]["search_snippet"] == "yavas özeti"
+    assert jobs[2]["title_tag"] == ""
+
+
+class FakePageResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = {"Content-Type": "text/html; charset=utf-8", **(headers or {})}
+        self.encoding = "utf-8"
+        self._body = body
+        self.closed = False
+
+    def iter_content(self, size):
+        for i in range(0, len(self._body), size):
+            yield self._body[i:i + size]
+
+    def close(self):
+        self.closed = True
+
+
+def page_html(title):
+    return f"<html><head><title>{title}</title></head><body><h1>{title}</h1><p>Açıklama</p></body></html>".encode()
+
+
+def make_scraper(responses, ttl=60):
+    scraper = JobPageScraper(cache=PageCache(ttl=ttl))
+    requests_sent = []
+
+    def get(url, headers=None, timeout=None, stream=None):
+        requests_sent.append(dict(headers or {}))
+        return responses.pop(0)
+
+    scraper.session.get = get
+    return scraper, requests_sent
+
+
+def test_page_cache_ttl_and_lru(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(job_scraper, "time", types.SimpleNamespace(time=lambda: now[0], monotonic=time.monotonic,
+                                                                   sleep=time.sleep))
+    cache = PageCache(ttl=10, max_entries=2)
+    cache.set("a", {"title_tag": "A"}, "etag-a", None)
+    cache.set("b", {"title_tag": "B"}, None, None)
+    cache.get("a")
+    cache.set("c", {"title_tag": "C"}, None, None)
+    assert cache.get("b") is None
+    assert cache.get("a")["expires_at"] == 1010
+
+    now[0] = 1020
+    cache.touch("a")
+    assert cache.get("a")["expires_at"] == 1030
+
+
+def test_fresh_cache_entry_skips_the_network():
+    scraper, sent = make_scraper([FakePageResponse(200, page_html("İlk"), {"ETag": '"v1"'})])
+    first = scraper.fetch_page("https://kariyer.net/ilan/1")
+    assert scraper.fetch_page("https://kariyer.net/ilan/1") == first
+    assert len(sent) == 1
+
+
+def test_expired_entry_is_revalidated_with_etag_and_kept_on_304():
+    not_modified = FakePageResponse(304)
+    scraper, sent = make_scraper([
+        FakePageResponse(200, page_html("İlk"), {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        not_modified,
+    ], ttl=0)
+    first = scraper.fetch_page("https://kariyer.net/ilan/1")
+    assert first["title_tag"] == "İlk"
+
+    assert scraper.fetch_page("https://kariyer.net/ilan/1") == first
+    assert sent[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert not_modified.closed
+
+
+def test_changed_page_replaces_cached_fields_and_validators():
+    scraper, sent = make_scraper([
+        FakePageResponse(200, page_html("İlk"), {"ETag": '"v1"'}),
+        FakePageResponse(200, page_html("Yeni"), {"ETag": '"v2"'}),
+        FakePageResponse(304),
+    ], ttl=0)
+    scraper.fetch_page("https://kariyer.net/ilan/1")
+    assert scraper.fetch_page("https://kariyer.net/ilan/1")["title_tag"] == "Yeni"
+    assert scraper.fetch_page("https://kariyer.net/ilan/1")["title_tag"] == "Yeni"
+    assert sent[2] == {"If-None-Match": '"v2"'}
+
+
+def test_failed_fetch_returns_none():
+    scraper, _ = make_scraper([FakePageResponse(404)])
+    assert scraper.fetch_page("https://kariyer.net/ilan/yok") is None
+
+
+def long_page(encoding="utf-8"):
+    filler = "<p>" + "deneyim " * 300 + "</p>"
+    return ("<html><head><title>Backend Geliştirici</title><style>h1 {}</style></head><body>"
+            "<h1>Backend Geliştirici</h1>" + filler + "<h2>Aranan Nitelikler</h2><p>Python</p>"
+            "<script>var h3 = 1;</script><h3>Yan Haklar</h3></body></html><footer>çok</footer>").encode(encoding)
+
+
+def chunked(data, size=256):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def parser_backend(request, monkeypatch):
+    if request.param == "html.parser":
+        monkeypatch.setattr(job_scraper, "lxml_etree", None)
+    elif job_scraper.lxml_etree is None:
+        pytest.skip("lxml kurulu değil")
+    return request.param
+
+
+def test_headings_after_the_snippet_cutoff_are_collected(parser_backend):
+    fields = job_scraper.extract_fields(chunked(long_page()), "utf-8", max_chars=100)
+    assert fields["title_tag"] == "Backend Geliştirici"
+    assert fields["headings"] == "Backend Geliştirici Aranan Nitelikler Yan Haklar"
+    assert len(fields["body_snippet"]) == 100
+    assert fields["body_snippet"].startswith("Backend Geliştirici deneyim deneyim")
+
+
+def test_reading_stops_at_body_end_and_at_byte_cap(parser_backend):
+    data = long_page() + b"<!--" + b"x" * 50_000 + b"-->"
+    chunks = chunked(data)
+    consumed = []
+
+    def stream():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    job_scraper.extract_fields(stream(), "utf-8")
+    assert len(consumed) < len(chunks) // 2
+
+    fields = job_scraper.extract_fields(chunked(long_page()), "utf-8", max_bytes=200)
+    assert fields["headings"] == "Backend Geliştirici"
+
+
+def test_encoding_falls_back_to_meta_charset_then_utf8(parser_backend):
+    legacy = '<meta charset="windows-1254"><title>Çalışan İlanı</title><body>ş</body>'.encode("cp1254")
+    assert job_scraper.extract_fields([legacy])["title_tag"] == "Çalışan İlanı"
+    plain = "<title>Ünvan</title><body>ğ</body>".encode("utf-8")
+    assert job_scraper.extract_fields([plain])["title_tag"] == "Ünvan"
@@ -0,0 +1,72 @@
+import types
+
+import pytest
+
+import job_search
+from job_search import SerpJobSearch, SerpResultCache
+
+
+class FakeResponse:
+    def __init__(self, results, status_code=200):
+        self.status_code = status_code
+        self._data = {"organic_results": results}
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(job_search, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def test_serp_cache_expires_evicts_and_persists(clock, tmp_path):
+    db_path = str(tmp_path / "serp.sqlite3")
+    cache = SerpResultCache(max_entries=1, db_path=db_path)
+    cache.set("a", [{"link": "x"}], ttl=10)
+    cache.set("b", {"kariyer.net": 0}, ttl=100)
+    assert cache.get("a") == [{"link": "x"}]
+
+    clock[0] += 50
+    assert cache.get("a") is None
+    assert SerpResultCache(db_path=db_path).get("b") == {"kariyer.net": 0}
+    tables = {row[0] for row in cache._db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert tables == {"serp_cache"}
+
+
+def make_search(responses):
+    search = SerpJobSearch("key")
+    calls = []
+
+    def get(url, params=None, timeout=None):
+        calls.append(params["q"])
+        return FakeResponse(responses.pop(0))
+
+    search.session = types.SimpleNamespace(get=get)
+    return search, calls
+
+
+def test_organic_results_are_cached_per_normalized_query():
+    search, calls = make_search([[{"link": "https://www.kariyer.net/is-ilani/1"}]])
+    first = search.organic_results("Python Developer", "İstanbul")
+    assert search.organic_results(" python developer", "istanbul") == first
+    assert len(calls) == 1
+
+
+def test_empty_site_filter_skips_primary_query_next_time():
+    broad = [{"link": "https://www.kariyer.net/is-ilani/2", "title": "İlan", "snippet": "özet"}]
+    search, calls = make_search([
+        [{"link": "https://example.com/jobs/list"}],
+        broad,
+    ])
+    assert [link["url"] for link in search.find_job_links("Go", "Ankara")] == [broad[0]["link"]]
+    assert len(calls) == 2
+
+    for key in [key for key in search.cache._entries if key.startswith("serp|")]:
+        del search.cache._entries[key]
+    search.session.get = lambda url, params=None, timeout=None: calls.append(params["q"]) or FakeResponse(broad)
+    search.find_job_links("Go", "Ankara")
+    assert len(calls) == 3
+    assert "site:kariyer.net OR site:secretcv.com" in calls[-1]
@@ -0,0 +1,113 @@
+import threading
+import types
+
+import pytest
+
+import job_store
+from job_store import JobRefresher, JobStore, search_key, tokenize
+
+
+def job(url, title, city="İstanbul", requirements=()):
+    return {"url": url, "title": title, "location_city": city, "requirements": list(requirements),
+            "company": {"name": "Şirket"}, "description": "Açıklama"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.sqlite3"))
+
+
+def test_tokenize_keeps_language_names_and_folds_turkish_i():
+    assert tokenize("Senior C++ / .NET Geliştirici, İZMİR") == ["senior", "c++", "net", "geliştirici", "izmir"]
+
+
+def test_find_requires_every_distinctive_title_term_and_location(store):
+    store.save_jobs("python", "istanbul", [
+        job("u1", "Python Backend Developer"),
+        job("u2", "Python Developer", city="Ankara"),
+        job("u3", "Java Backend Developer"),
+    ])
+    assert [j["url"] for j in store.find("Backend Python", "İstanbul")] == ["u1"]
+    assert {j["url"] for j in store.find("python developer")} == {"u1", "u2"}
+
+
+def test_find_ignores_generic_title_terms(store):
+    store.save_jobs("developer", "", [job("u1", "Frontend Developer"), job("u2", "Mobile Developer")])
+    assert store.find("Developer") == []
+    assert store.find("Senior Engineer") == []
+    assert [j["url"] for j in store.find("Senior Frontend Engineer")] == ["u1"]
+
+
+def test_find_ranks_by_weighted_requirement_overlap(store):
+    store.save_jobs("backend", "", [
+        job("u1", "Backend Developer", requirements=["Java", "Spring"]),
+        job("u2", "Backend Developer", requirements=["Python", "Django", "Docker"]),
+        job("u3", "Backend Developer", requirements=["Python", "Go"]),
+    ])
+    weights = {"python": 1.0, "docker": 0.5}
+    assert [j["url"] for j in store.find("backend", skill_weights=weights)] == ["u2", "u3", "u1"]
+    assert [j["url"] for j in store.find("backend", limit=1, skill_weights=weights)] == ["u2"]
+
+
+def test_resaving_a_job_replaces_its_terms(store):
+    store.save_jobs("a", "", [job("u1", "Data Analyst")])
+    store.save_jobs("a", "", [job("u1", "Data Scientist")])
+    assert store.find("analyst") == []
+    assert [j["title"] for j in store.find("scientist")] == ["Data Scientist"]
+
+
+def test_search_is_stale_until_saved_and_after_ttl(store, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(job_store, "time", types.SimpleNamespace(time=lambda: now[0]))
+    assert store.is_stale("Python", "İstanbul")
+    store.save_jobs("python ", "istanbul", [job("u1", "Python Developer")])
+    assert not store.is_stale("Python", "İSTANBUL")
+    now[0] += store.search_ttl + 1
+    assert store.is_stale("Python", "İstanbul")
+
+
+def test_search_key_normalizes_title_and_location():
+    assert search_key(" Python  Developer", "İzmir") == search_key("python developer", "izmir")
+
+
+def test_refresher_runs_one_refresh_per_search_at_a_time():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def refresh(title, location):
+        calls.append((title, location))
+        started.set()
+        release.wait(2)
+
+    refresher = JobRefresher(refresh)
+    assert refresher.schedule("Python", "İstanbul")
+    started.wait(2)
+    assert not refresher.schedule("python", "istanbul")
+    assert refresher.schedule("Java", "İstanbul")
+    release.set()
+
+    for _ in range(200):
+        if refresher.schedule("Python", "İstanbul"):
+            break
+        threading.Event().wait(0.01)
+    else:
+        pytest.fail("yenileme bittikten sonra arama yeniden planlanamadı")
+    assert calls.count(("Python", "İstanbul")) >= 1
+
+
+def test_refresher_releases_search_after_failure():
+    done = threading.Event()
+
+    def refresh(title, location):
+        done.set()
+        raise RuntimeError("SerpAPI")
+
+    refresher = JobRefresher(refresh)
+    refresher.schedule("Go", "")
+    done.wait(2)
+    for _ in range(200):
+        if refresher.schedule("Go", ""):
+            return
+        threading.Event().wait(0.01)
+    pytest.fail("hatalı yenileme aramayı serbest bırakmadı")
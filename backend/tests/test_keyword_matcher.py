@@ -0,0 +1,41 @@
+import random
+
+from keyword_matcher import KeywordMatcher
+
+GROUPS = {
+    "lang": ["python", "java", "javascript", "go"],
+    "role": ["developer", "dev", "lead"],
+    "overlap": ["ava", "script", "velo"],
+    "turkish": ["mühendis", "İşletme"],
+}
+
+
+def naive_scan(groups, text):
+    """Referans uygulama: her anahtar kelime için alt dize araması"""
+    text = (text or "").replace("İ", "i").lower()
+    return frozenset(label for label, keywords in groups.items()
+                     if any(keyword.replace("İ", "i").lower() in text for keyword in keywords))
+
+
+def test_scan_matches_naive_substring_search():
+    matcher = KeywordMatcher(GROUPS)
+    alphabet = list("javscriptdeloperguİışmühn ") + ["java", "dev", "İşletme", "velo"]
+    rng = random.Random(16)
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert matcher.scan(text) == naive_scan(GROUPS, text), text
+
+
+def test_scan_finds_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(GROUPS)
+    assert matcher.scan("JavaScript Developer") == {"lang", "role", "overlap"}
+    assert matcher.scan("İŞLETME") == {"turkish"}
+    assert matcher.scan("") == frozenset()
+    assert matcher.scan(None) == frozenset()
+
+
+def test_first_respects_label_order():
+    matcher = KeywordMatcher(GROUPS)
+    assert matcher.first("lead python developer", ["role", "lang"]) == "role"
+    assert matcher.first("lead python developer", ["lang", "role"]) == "lang"
+    assert matcher.first("designer", ["lang", "role"]) is None
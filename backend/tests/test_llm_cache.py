@@ -0,0 +1,126 @@
+import types
+
+import pytest
+
+import llm_cache
+from llm_cache import LLMResponseCache, make_cache_key
+from llm_client import GeminiClient
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache, "time", types.SimpleNamespace(time=clock.time))
+    return clock
+
+
+def test_cache_key_depends_on_model_prompt_and_config():
+    payload = {"contents": [{"parts": [{"text": "merhaba"}]}], "generationConfig": {"temperature": 0.1}}
+    same = {"generationConfig": {"temperature": 0.1}, "contents": [{"parts": [{"text": "merhaba"}]}]}
+    assert make_cache_key("m", payload) == make_cache_key("m", same)
+    assert make_cache_key("m", payload) != make_cache_key("n", payload)
+    assert make_cache_key("m", payload) != make_cache_key("m", {**payload, "generationConfig": {}})
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = LLMResponseCache()
+    cache.set("k", "v", ttl=10)
+    clock.now += 9
+    assert cache.get("k") == "v"
+    clock.now += 1
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = LLMResponseCache(max_entries=2)
+    cache.set("a", "1", ttl=60)
+    cache.set("b", "2", ttl=60)
+    assert cache.get("a") == "1"
+    cache.set("c", "3", ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_sqlite_layer_survives_restart_and_drops_expired_rows(clock, tmp_path):
+    db_path = str(tmp_path / "llm_cache.sqlite3")
+    cache = LLMResponseCache(db_path=db_path)
+    cache.set("kalıcı", "değer", ttl=60)
+    cache.set("kısa", "değer", ttl=5)
+
+    clock.now += 10
+    restarted = LLMResponseCache(db_path=db_path)
+    assert restarted.get("kalıcı") == "değer"
+    assert restarted.get("kısa") is None
+    assert restarted._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 1
+
+
+def test_evicted_memory_entry_is_reloaded_from_sqlite(clock, tmp_path):
+    cache = LLMResponseCache(max_entries=1, db_path=str(tmp_path / "c.sqlite3"))
+    cache.set("a", "1", ttl=60)
+    cache.set("b", "2", ttl=60)
+    assert cache.get("a") == "1"
+
+
+def reply(text):
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+def test_client_caches_only_replies_that_parse():
+    client = GeminiClient("http://gemini/model:generateContent", "key", cache=LLMResponseCache())
+    replies = ["bozuk", '{"ok": true}']
+    calls = []
+
+    def post(payload, call_site, timeout=None):
+        calls.append(payload)
+        return reply(replies.pop(0))
+
+    def parse(text):
+        if not text.startswith("{"):
+            raise ValueError("JSON değil")
+        return text
+
+    client.post = post
+    with pytest.raises(ValueError):
+        client.generate("p", cache_ttl=60, parse=parse)
+    assert client.generate("p", cache_ttl=60, parse=parse) == '{"ok": true}'
+    assert client.generate("p", cache_ttl=60, parse=parse) == '{"ok": true}'
+    assert len(calls) == 2
+
+
+def test_client_without_ttl_does_not_cache():
+    client = GeminiClient("http://gemini/model:generateContent", "key", cache=LLMResponseCache())
+    calls = []
+    client.post = lambda payload, call_site, timeout=None: calls.append(1) or reply("metin")
+    client.generate("p")
+    client.generate("p")
+    assert len(calls) == 2
+
+
+def test_generate_caps_read_timeout_with_remaining_budget():
+    client = GeminiClient("http://gemini/model:generateContent", "key")
+    timeouts = []
+
+    class Response:
+        status_code = 200
+
+        def json(self):
+            return reply("metin")
+
+    def session_post(url, params=None, json=None, timeout=None):
+        timeouts.append(timeout)
+        return Response()
+
+    client.session.post = session_post
+    client.generate("p", call_site="career_simulation", timeout=12.5)
+    client.generate("p", call_site="career_simulation")
+    client.generate("p", call_site="meeting_chat", timeout=30)
+    assert [read for _, read in timeouts] == [12.5, 60, 10]
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from llm_json import IncrementalJSONParser, extract_json
+
+MODULE = {
+    "title": "Git {temelleri}",
+    "steps": [
+        {"step": 1, "title": "Giriş", "content": '<p>"commit" nedir?</p>'},
+        {"step": 2, "title": "Dallar", "content": "[branch] ve {merge}"},
+    ],
+    "final_quiz": [{"q": "Soru?", "a": ["x", "y"], "correct": "x"}],
+}
+
+
+def feed_all(parser, text, size):
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return events
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 10_000])
+def test_incremental_parser_emits_elements_and_result(size):
+    text = "Tabii, işte modül:\n```json\n" + json.dumps(MODULE, ensure_ascii=False) + "\n```\nİyi çalışmalar {}"
+    parser = IncrementalJSONParser(["steps", "final_quiz"])
+    events = feed_all(parser, text, size)
+    assert events == [("steps", MODULE["steps"][0]), ("steps", MODULE["steps"][1]),
+                      ("final_quiz", MODULE["final_quiz"][0])]
+    assert parser.done
+    assert parser.result() == MODULE
+
+
+def test_incremental_parser_ignores_untracked_arrays():
+    parser = IncrementalJSONParser(["final_quiz"])
+    events = feed_all(parser, json.dumps(MODULE), 5)
+    assert [key for key, _ in events] == ["final_quiz"]
+
+
+def test_incremental_parser_result_requires_closed_root():
+    parser = IncrementalJSONParser(["steps"])
+    parser.feed('{"steps": [{"step": 1}')
+    assert not parser.done
+    with pytest.raises(ValueError):
+        parser.result()
+
+
+def test_extract_json_skips_prose_and_code_fences():
+    assert extract_json('Sonuç:\n```json\n{"a": {"b": [1, 2]}}\n```') == {"a": {"b": [1, 2]}}
+    assert extract_json('Şablon {ad} yerine: {"a": 1} bitti') == {"a": 1}
+    assert extract_json('{"s": "a\\"}"} sonrası {"b": 2}') == {"s": 'a"}'}
+
+
+@pytest.mark.parametrize("text", [
+    '{"root": {"inner": 1}, "list": [1,',
+    '{"bozuk" {"inner": 1}}',
+    "JSON yok",
+    "",
+    None,
+])
+def test_extract_json_never_returns_inner_object_of_broken_root(text):
+    with pytest.raises(ValueError):
+        extract_json(text)
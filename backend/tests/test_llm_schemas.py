@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from llm_schemas import RESPONSE_SCHEMAS, SchemaValidationError, parse_response, structured_config, validate
+
+ANSWER = {"correct": True, "feedback": "İyi", "score": 7}
+
+
+def test_structured_config_adds_schema_without_mutating_input():
+    config = {"temperature": 0.2}
+    result = structured_config("evaluate_answer", config)
+    assert result["responseMimeType"] == "application/json"
+    assert result["responseSchema"] is RESPONSE_SCHEMAS["evaluate_answer"]
+    assert result["temperature"] == 0.2
+    assert config == {"temperature": 0.2}
+
+
+def test_object_schemas_order_every_property():
+    for name, schema in RESPONSE_SCHEMAS.items():
+        assert schema["propertyOrdering"] == list(schema["properties"]), name
+        assert set(schema["required"]) <= set(schema["properties"]), name
+
+
+def test_parse_response_accepts_valid_reply():
+    assert parse_response("evaluate_answer", "```json\n" + json.dumps(ANSWER) + "\n```") == ANSWER
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"correct": True, "feedback": "x"}, "$.score: alan eksik"),
+    ({**ANSWER, "score": 11}, "$.score: 11 > 10"),
+    ({**ANSWER, "score": True}, "$.score: sayı bekleniyordu"),
+    ({**ANSWER, "correct": "evet"}, "$.correct: true/false bekleniyordu"),
+    ([], "$: nesne bekleniyordu"),
+])
+def test_validate_reports_path_of_first_error(data, message):
+    with pytest.raises(SchemaValidationError) as info:
+        validate(data, RESPONSE_SCHEMAS["evaluate_answer"])
+    assert str(info.value) == message
+
+
+def test_validate_checks_enums_nullables_and_nested_arrays():
+    schema = RESPONSE_SCHEMAS["meeting_chat"]
+    validate({"response": "Tamam", "emotion": "neutral", "follow_up_question": None}, schema)
+    with pytest.raises(SchemaValidationError):
+        validate({"response": "Tamam", "emotion": "angry"}, schema)
+    with pytest.raises(SchemaValidationError, match=r"\$\.steps\[1\]\.title: alan eksik"):
+        validate({"title": "t", "description": "d", "final_quiz": [],
+                  "steps": [{"step": 1, "title": "a", "content": "c"}, {"step": 2, "content": "c"}]},
+                 RESPONSE_SCHEMAS["learning_module"])
+
+
+def test_parse_response_errors_are_value_errors():
+    with pytest.raises(ValueError):
+        parse_response("evaluate_answer", "JSON yok")
+    with pytest.raises(ValueError):
+        parse_response("evaluate_answer", '{"correct": true}')
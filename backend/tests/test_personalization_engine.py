@@ -0,0 +1,70 @@
+import pytest
+
+from personalization_engine import (
+    INDUSTRIAL_ENGINEERING_TOOLS,
+    PersonalizationEngine,
+    ProfileAnalysis,
+)
+
+BACKEND_PROFILE = {
+    "current_title": "Senior Backend Developer",
+    "skills": ["Python", "Docker", "React"],
+    "experience_level": "senior",
+    "experiences": [
+        {"position": "Lead developer", "description": "I lead the team and debug services", "duration": "3 years"},
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return PersonalizationEngine()
+
+
+def test_backend_developer_analysis(engine):
+    analysis = engine.analyze_user_profile(BACKEND_PROFILE)
+    assert isinstance(analysis, ProfileAnalysis)
+    assert analysis["industry_focus"] == "technology"
+    assert analysis["role_type"] == "senior_individual_contributor"
+    assert analysis["role_focus"] == "backend"
+    assert analysis["technical_skills"] == {
+        "programming_languages": ["Python"], "frameworks": ["React"], "tools": ["Docker"],
+    }
+    assert analysis["soft_skills"] == ["leadership", "problem_solving"]
+
+
+def test_designer_title_maps_to_design(engine):
+    analysis = engine.analyze_user_profile({"current_title": "UX Designer", "skills": ["Figma"]})
+    assert analysis.get("industry_focus") == "design"
+    assert analysis.get("skill_categories")["design"] == ["Figma"]
+
+
+
+def test_unmatched_profile_defaults_to_technology(engine):
+    analysis = engine.analyze_user_profile({"current_title": "Stajyer", "degree": "Tarih", "skills": []})
+    assert analysis["industry_focus"] == "technology"
+    assert "modern_frameworks" in analysis["skill_gaps"]
+
+@pytest.mark.parametrize("degree", ["Endüstri Mühendisliği", "ENDÜSTRİ MÜHENDİSLİĞİ"])
+def test_industrial_engineering_degree_adds_default_tools(engine, degree):
+    analysis = engine.analyze_user_profile({"degree": degree, "skills": []})
+    assert analysis["industry_focus"] == "industrial_engineering"
+    tools = analysis["technical_skills"]["tools"]
+    assert all(tool in tools for tool in INDUSTRIAL_ENGINEERING_TOOLS)
+    assert analysis["technical_skills"]["programming_languages"] == ["Python", "SQL"]
+
+
+def test_fields_are_lazy_and_to_dict_is_stable(engine):
+    analysis = engine.analyze_user_profile(BACKEND_PROFILE)
+    assert not hasattr(analysis, "_skill_gaps")
+    gaps = analysis["skill_gaps"]
+    assert analysis["skill_gaps"] is gaps
+    data = analysis.to_dict()
+    assert set(data) == set(ProfileAnalysis.FIELDS)
+    assert data == engine.analyze_user_profile(BACKEND_PROFILE).to_dict()
+
+
+def test_batch_matches_single_analysis(engine):
+    profiles = [BACKEND_PROFILE, {"current_title": "UX Designer"}, {}]
+    expected = [engine.analyze_user_profile(profile).to_dict() for profile in profiles]
+    assert list(engine.analyze_profiles_batch(profiles)) == expected
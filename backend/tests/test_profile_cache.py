@@ -0,0 +1,123 @@
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import profile_cache as profile_cache_module
+from profile_cache import ProfileCache
+from supabase_client import SupabaseClient, SupabaseError, escape_like
+
+PROFILE = {"id": "u1", "email": "Ada.Lovelace@example.com", "first_name": "Ada"}
+
+
+class FakeResponse:
+    def __init__(self, rows, status_code=200):
+        self.status_code = status_code
+        self._rows = rows
+        self.text = str(rows)
+
+    def json(self):
+        return self._rows
+
+
+@pytest.fixture
+def supabase():
+    client = SupabaseClient("https://proje.supabase.co", "anahtar")
+    client.sent = []
+    client.rows = [PROFILE]
+    client.status_code = 200
+
+    def request(method, url, params=None, json=None, headers=None, timeout=None):
+        client.sent.append(list(params or []))
+        return FakeResponse(client.rows, client.status_code)
+
+    client.session.request = request
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(profile_cache_module, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def test_escape_like_escapes_sql_wildcards_but_not_star():
+    assert escape_like("a_b%c\\d*e@x.com") == "a\\_b\\%c\\\\d*e@x.com"
+
+
+def test_by_email_is_exact_and_insensitive_lookup_escapes_wildcards(supabase):
+    cache = ProfileCache(supabase)
+    cache.by_email("Ada.Lovelace@example.com")
+    cache.by_email_insensitive(" ada_lovelace@EXAMPLE.com ")
+    assert supabase.sent[0] == [("email", "eq.Ada.Lovelace@example.com")]
+    assert supabase.sent[1] == [("email", "ilike.ada\\_lovelace@EXAMPLE.com")]
+
+
+def test_profile_is_cached_under_id_exact_and_folded_email(supabase, clock):
+    cache = ProfileCache(supabase, ttl=60)
+    assert cache.by_id("u1") == PROFILE
+    assert cache.by_email("Ada.Lovelace@example.com") == PROFILE
+    assert cache.by_email_insensitive("ADA.LOVELACE@example.com") == PROFILE
+    assert len(supabase.sent) == 1
+
+    supabase.rows = []
+    assert cache.by_email("ada.lovelace@example.com") is None
+    assert len(supabase.sent) == 2
+
+
+def test_cached_profiles_expire_and_are_copies(supabase, clock):
+    cache = ProfileCache(supabase, ttl=60)
+    cache.by_id("u1")["first_name"] = "değişti"
+    assert cache.by_id("u1")["first_name"] == "Ada"
+    clock[0] += 61
+    cache.by_id("u1")
+    assert len(supabase.sent) == 2
+
+
+def test_invalidate_drops_every_key_of_the_profile(supabase, clock):
+    cache = ProfileCache(supabase)
+    cache.by_id("u1")
+    cache.invalidate(user_id="u1")
+    cache.by_email_insensitive("ada.lovelace@example.com")
+    cache.invalidate(email="Ada.Lovelace@example.com")
+    cache.by_id("u1")
+    assert len(supabase.sent) == 3
+
+
+def test_lru_eviction(supabase, clock):
+    cache = ProfileCache(supabase, max_entries=3)
+    cache.by_id("u1")
+    supabase.rows = [{"id": "u2"}]
+    cache.by_id("u2")
+    cache.by_id("u1")
+    assert len(supabase.sent) == 3
+
+
+def test_non_200_raises_and_is_not_cached(supabase):
+    cache = ProfileCache(supabase)
+    supabase.status_code = 400
+    with pytest.raises(SupabaseError):
+        cache.by_id("bozuk")
+    supabase.status_code = 200
+    assert cache.by_id("bozuk") == PROFILE
+
+
+def test_concurrent_misses_share_one_request(supabase):
+    release = threading.Event()
+    original = supabase.session.request
+
+    def slow_request(*args, **kwargs):
+        release.wait(2)
+        return original(*args, **kwargs)
+
+    supabase.session.request = slow_request
+    cache = ProfileCache(supabase)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [pool.submit(cache.by_id, "u1") for _ in range(6)]
+        time.sleep(0.1)
+        release.set()
+        assert all(future.result(2) == PROFILE for future in futures)
+    assert len(supabase.sent) == 1
@@ -0,0 +1,110 @@
+import threading
+import time
+
+from scenario_pool import ScenarioPool, bucket_profile, degree_family, personalize_scenario, scenario_bucket
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_degree_family_groups_known_degrees():
+    assert degree_family("Bilgisayar Mühendisliği") == "software"
+    assert degree_family("ENDÜSTRİ MÜHENDİSLİĞİ") == "industrial_engineering"
+    assert degree_family("Mechanical Engineering") == "mechanical"
+
+
+def test_unmapped_degrees_keep_their_own_bucket():
+    assert degree_family("  Tıp ") == "tıp"
+    assert degree_family("Hukuk") != degree_family("Tıp")
+    assert degree_family(None) == "other"
+
+
+def test_scenario_bucket_defaults():
+    bucket = scenario_bucket({"degree": "Yazılım Mühendisliği"}, {})
+    assert bucket == ("software", "junior", "technology")
+
+
+def test_personalize_scenario_does_not_touch_pooled_copy():
+    pooled = {"context": "Bir yazılım şirketinde çalışıyorsun", "title": "Backend"}
+    profile = {"first_name": "Ada", "university": "ODTÜ", "degree": "Bilgisayar", "current_title": "Developer"}
+    personalized = personalize_scenario(pooled, profile)
+    assert personalized["context"] == "ODTÜ Bilgisayar mezunu Ada olarak, bir yazılım şirketinde çalışıyorsun"
+    assert personalized["role"] == "Developer"
+    assert pooled == {"context": "Bir yazılım şirketinde çalışıyorsun", "title": "Backend"}
+
+
+def test_bucket_profile_uses_only_bucket_attributes():
+    assert bucket_profile(("software", "senior", "design")) == {
+        "degree": "Bilgisayar Mühendisliği", "current_title": "UX Designer",
+        "skills": [], "experience_level": "senior",
+    }
+    assert bucket_profile(("tıp", "junior", "technology"))["degree"] == "tıp"
+    assert bucket_profile(("other", "junior", "management"))["degree"] == ""
+
+
+def test_take_misses_then_fills_bucket_in_background():
+    calls = []
+    lock = threading.Lock()
+
+    def generate(profile):
+        with lock:
+            calls.append(profile)
+            return {"title": f"senaryo {len(calls)}"}
+
+    pool = ScenarioPool(generate, size=2)
+    bucket = ("software", "junior", "technology")
+
+    assert pool.take(bucket) is None
+    assert wait_for(lambda: pool.size_of(bucket) == 2)
+    assert all(call == bucket_profile(bucket) for call in calls)
+
+    assert pool.take(bucket) == {"title": "senaryo 1"}
+    assert wait_for(lambda: pool.size_of(bucket) == 2)
+    assert len(calls) == 3
+
+
+def test_cold_take_waits_for_first_generated_scenario():
+    release = threading.Event()
+
+    def generate(profile):
+        release.wait(1)
+        return {"title": "ilk"}
+
+    pool = ScenarioPool(generate, size=1)
+    threading.Timer(0.05, release.set).start()
+    assert pool.take(("software", "junior", "technology"), wait=2) == {"title": "ilk"}
+
+
+def test_cold_take_falls_back_when_wait_expires():
+    release = threading.Event()
+    pool = ScenarioPool(lambda profile: release.wait(1) and {"title": "geç"}, size=1)
+    bucket = ("software", "junior", "technology")
+    started = time.monotonic()
+    assert pool.take(bucket, wait=0.05) is None
+    assert time.monotonic() - started < 0.5
+    release.set()
+    assert wait_for(lambda: pool.size_of(bucket) == 1)
+
+
+def test_cold_take_stops_waiting_when_fill_gives_up():
+    pool = ScenarioPool(lambda profile: None, size=1, max_attempts=2)
+    started = time.monotonic()
+    assert pool.take(("other", "junior", "technology"), wait=2) is None
+    assert time.monotonic() - started < 1
+
+
+def test_fill_gives_up_after_max_attempts():
+    calls = []
+    pool = ScenarioPool(lambda profile: calls.append(profile), size=2, max_attempts=3)
+    bucket = ("other", "junior", "technology")
+    pool.take(bucket)
+    assert wait_for(lambda: len(calls) == 3)
+    time.sleep(0.05)
+    assert len(calls) == 3
+    assert pool.size_of(bucket) == 0
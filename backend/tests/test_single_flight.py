@@ -0,0 +1,76 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from llm_client import GeminiClient, SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(2)
+        return "sonuç"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flight.do, "k", fetch) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result(2) for future in futures]
+
+    assert results == ["sonuç"] * 8
+    assert len(calls) == 1
+
+
+def test_waiters_receive_the_leaders_error_and_key_is_released():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(2)
+        raise RuntimeError("upstream")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "k", failing)
+        started.wait(2)
+        follower = pool.submit(flight.do, "k", lambda: "çalışmamalı")
+        time.sleep(0.05)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError):
+                future.result(2)
+
+    assert flight.do("k", lambda: "yeni") == "yeni"
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flight = SingleFlight()
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        blocked = pool.submit(flight.do, "a", lambda: release.wait(2) and "a")
+        assert flight.do("b", lambda: "b") == "b"
+        release.set()
+        assert blocked.result(2) == "a"
+
+
+def test_client_coalesces_identical_concurrent_requests():
+    client = GeminiClient("http://gemini/model:generateContent", "key")
+    calls = []
+
+    def post(payload, call_site, timeout=None):
+        calls.append(1)
+        time.sleep(0.1)
+        return {"candidates": [{"content": {"parts": [{"text": "yanıt"}]}}]}
+
+    client.post = post
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: client.generate("aynı", coalesce=True), range(4)))
+    assert results == ["yanıt"] * 4
+    assert len(calls) == 1
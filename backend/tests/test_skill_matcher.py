@@ -0,0 +1,44 @@
+from skill_matcher import build_skill_weights, normalize_skill, score_jobs
+
+
+def test_normalize_skill_uses_taxonomy_aliases():
+    assert normalize_skill("React.js") == normalize_skill("reactjs") == "react"
+    assert normalize_skill("postgres") == "postgresql"
+    assert normalize_skill("  ") == ""
+
+
+def test_build_skill_weights_prefers_levels_and_clamps():
+    weights = build_skill_weights(
+        ["Python", "ReactJS", "Docker"],
+        [{"skill": "python", "level": 40}, {"skill": "React.js", "level": 250},
+         {"skill": "SQL", "level": "bilinmiyor"}, {"skill": "", "level": 10}],
+    )
+    assert weights == {"python": 0.4, "react": 1.0, "docker": 1.0, "sql": 1.0}
+    assert build_skill_weights(None) == {}
+
+
+def test_score_jobs_counts_canonical_matches_once_and_sorts():
+    jobs = [
+        {"url": "a", "requirements": ["Java", "Spring"]},
+        {"url": "b", "requirements": ["Python", "python", "React.js", "Kubernetes"]},
+        {"url": "c", "requirements": ["reactjs", "Python"]},
+        {"url": "d", "requirements": []},
+    ]
+    weights = {"python": 0.5, "react": 1.0}
+    scored = score_jobs(jobs, weights)
+
+    assert [job["url"] for job in scored] == ["c", "b", "a", "d"]
+    by_url = {job["url"]: job for job in scored}
+    assert by_url["b"]["matched_skills"] == ["Python", "React.js"]
+    assert by_url["b"]["missing_skills"] == ["Kubernetes"]
+    assert by_url["b"]["match_percentage"] == 67
+    assert by_url["b"]["match_score"] == 50.0
+    assert by_url["c"]["match_percentage"] == 100 and by_url["c"]["match_score"] == 75.0
+    assert by_url["d"]["match_percentage"] == 0 and by_url["d"]["match_score"] == 0.0
+    assert "matched_skills" not in jobs[0]
+
+
+def test_score_jobs_without_skills_marks_everything_missing():
+    scored = score_jobs([{"requirements": ["Go", "SQL"]}], {})
+    assert scored[0]["missing_skills"] == ["Go", "SQL"]
+    assert scored[0]["match_percentage"] == 0
@@ -0,0 +1,70 @@
+import pytest
+
+from supabase_client import SupabaseClient
+
+
+@pytest.fixture
+def client():
+    client = SupabaseClient("https://proje.supabase.co/", "anahtar")
+    client.sent = []
+
+    def request(method, url, params=None, json=None, headers=None, timeout=None):
+        client.sent.append({"method": method, "url": url, "params": list(params or []),
+                            "json": json, "headers": headers, "timeout": timeout})
+        return "yanıt"
+
+    client.session.request = request
+    return client
+
+
+def test_client_sets_auth_headers_and_rest_url(client):
+    assert client.rest_url == "https://proje.supabase.co/rest/v1"
+    assert client.session.headers["apikey"] == "anahtar"
+    assert client.session.headers["Authorization"] == "Bearer anahtar"
+
+
+def test_get_builds_postgrest_filters_in_order(client):
+    result = (client.table("skill_levels").select("skill,level").eq("user_id", 7)
+              .ilike("skill", "py%").order("level", desc=True).limit(5).get())
+    assert result == "yanıt"
+    sent = client.sent[0]
+    assert sent["method"] == "GET"
+    assert sent["url"] == "https://proje.supabase.co/rest/v1/skill_levels"
+    assert sent["params"] == [("select", "skill,level"), ("user_id", "eq.7"), ("skill", "ilike.py%"),
+                              ("order", "level.desc"), ("limit", "5")]
+    assert sent["headers"] is None
+    assert sent["timeout"] == client.timeout
+
+
+def test_writes_send_prefer_headers(client):
+    client.table("profiles").insert({"email": "a@b.c"})
+    client.table("missing_skills").insert({"skill": "go"}, returning=False)
+    client.table("profiles").eq("id", 1).update({"location": "İzmir"})
+    client.table("profiles").eq("id", 1).delete()
+
+    assert [sent["method"] for sent in client.sent] == ["POST", "POST", "PATCH", "DELETE"]
+    assert client.sent[0]["headers"] == {"Prefer": "return=representation"}
+    assert client.sent[1]["headers"] == {"Prefer": "return=minimal"}
+    assert client.sent[2]["params"] == [("id", "eq.1")]
+    assert client.sent[2]["json"] == {"location": "İzmir"}
+    assert client.sent[3]["headers"] is None
+
+
+def test_upsert_sets_conflict_target_and_resolution(client):
+    rows = [{"user_id": 1, "skill": "python", "level": 60}]
+    client.table("skill_levels").upsert(rows, on_conflict="user_id,skill", returning=False)
+    client.table("skill_levels").upsert(rows, on_conflict="user_id,skill", ignore_duplicates=True)
+
+    merge, ignore = client.sent
+    assert merge["params"] == [("on_conflict", "user_id,skill")]
+    assert merge["json"] == rows
+    assert merge["headers"] == {"Prefer": "resolution=merge-duplicates,return=minimal"}
+    assert ignore["headers"] == {"Prefer": "resolution=ignore-duplicates,return=representation"}
+
+
+def test_each_table_call_starts_a_fresh_query(client):
+    query = client.table("profiles").eq("id", 1)
+    client.table("profiles").get()
+    query.get()
+    assert client.sent[0]["params"] == []
+    assert client.sent[1]["params"] == [("id", "eq.1")]
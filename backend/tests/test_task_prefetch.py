@@ -0,0 +1,112 @@
+import threading
+import time
+import types
+
+import task_prefetch
+from task_prefetch import TaskPrefetcher, task_key
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_task_key_ignores_case_and_whitespace():
+    assert task_key({"task": " Code Review "}, "Backend Developer") == ("backend developer", "code review")
+    assert task_key({}, None) == ("", "")
+
+
+def test_prefetched_result_is_shared_and_not_regenerated():
+    calls = []
+    prefetcher = TaskPrefetcher(lambda task, title: calls.append(task) or {"task": task["task"]})
+    task = {"task": "Code review"}
+    assert prefetcher.prefetch(task, "Developer") is True
+    assert prefetcher.prefetch({"task": "code review "}, "developer") is False
+    assert wait_for(lambda: calls)
+    assert prefetcher.get(task, "Developer") == {"task": "Code review"}
+    assert prefetcher.get(task, "Developer") == {"task": "Code review"}
+    assert len(calls) == 1
+    assert prefetcher.prefetch({}, "Developer") is False
+
+
+def test_get_waits_for_running_generation():
+    started, release = threading.Event(), threading.Event()
+
+    def generate(task, title):
+        started.set()
+        release.wait(2)
+        return {"ok": True}
+
+    prefetcher = TaskPrefetcher(generate)
+    prefetcher.prefetch({"task": "Rapor"}, "Analist")
+    assert started.wait(2)
+    threading.Timer(0.05, release.set).start()
+    assert prefetcher.get({"task": "Rapor"}, "Analist") == {"ok": True}
+
+
+def test_get_cancels_generation_still_in_queue():
+    release = threading.Event()
+    calls = []
+
+    def generate(task, title):
+        calls.append(task["task"])
+        release.wait(2)
+        return {"task": task["task"]}
+
+    prefetcher = TaskPrefetcher(generate, workers=1)
+    prefetcher.prefetch({"task": "birinci"}, "Developer")
+    prefetcher.prefetch({"task": "ikinci"}, "Developer")
+    assert wait_for(lambda: calls == ["birinci"])
+    assert prefetcher.get({"task": "ikinci"}, "Developer") is None
+    release.set()
+    assert prefetcher.get({"task": "birinci"}, "Developer") == {"task": "birinci"}
+    assert calls == ["birinci"]
+    assert prefetcher.prefetch({"task": "ikinci"}, "Developer") is True
+
+
+def test_failed_generation_is_not_cached():
+    calls = []
+
+    def generate(task, title):
+        calls.append(task)
+        if len(calls) == 1:
+            raise RuntimeError("Gemini hatası")
+        return {"ok": True}
+
+    prefetcher = TaskPrefetcher(generate)
+    task = {"task": "Toplantı"}
+    prefetcher.prefetch(task, "Manager")
+    assert wait_for(lambda: calls)
+    assert prefetcher.get(task, "Manager") is None
+    assert wait_for(lambda: prefetcher.prefetch(task, "Manager"))
+    assert wait_for(lambda: len(calls) == 2)
+    assert prefetcher.get(task, "Manager") == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(task_prefetch, "time", types.SimpleNamespace(time=lambda: now[0]))
+    calls = []
+    prefetcher = TaskPrefetcher(lambda task, title: calls.append(task) or {"ok": True}, ttl=60)
+    task = {"task": "Kod"}
+    prefetcher.prefetch(task, "Developer")
+    assert wait_for(lambda: calls)
+    assert prefetcher.get(task, "Developer") == {"ok": True}
+    now[0] += 60
+    assert prefetcher.get(task, "Developer") is None
+    assert prefetcher.prefetch(task, "Developer") is True
+
+
+def test_oldest_entry_is_evicted():
+    calls = []
+    prefetcher = TaskPrefetcher(lambda task, title: calls.append(task) or {"task": task["task"]}, max_entries=2)
+    for name in ("a", "b", "c"):
+        prefetcher.prefetch({"task": name}, "Developer")
+    assert wait_for(lambda: {"task": "c"} in calls)
+    assert prefetcher.get({"task": "a"}, "Developer") is None
+    assert prefetcher.get({"task": "c"}, "Developer") == {"task": "c"}
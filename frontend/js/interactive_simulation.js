@@ -103,26 +103,70 @@ window.startSimulation = async function() {
     showLoading("Kişilik test sonuçlarınıza göre simülasyon hazırlanıyor...");
     
     try {
-        const response = await fetch(`http://127.0.0.1:5000/career-simulation/${currentUser.id}`);
-        const data = await response.json();
-
-        if (data.success && data.data) {
-            currentScenario = data.data;
-            loadTasks();
+        await streamScenario(() => {
+            hideLoading();
             hideElement('welcomeScreen');
             startTimer();
-            showNotification(`${currentUser.personality_assessment.personality_type} kişiliğinize özel simülasyon başladı!`, "success");
-        } else {
-            showNotification(data.message || "Simülasyon yüklenemedi", "error");
-        }
+        });
+        showNotification(`${currentUser.personality_assessment.personality_type} kişiliğinize özel simülasyon başladı!`, "success");
     } catch (error) {
         console.error("Simülasyon yükleme hatası:", error);
-        showNotification("Sunucu bağlantı hatası", "error");
+        showNotification(error.message || "Sunucu bağlantı hatası", "error");
     } finally {
         hideLoading();
     }
 }
 
+// Stream the scenario over SSE: tasks are listed as soon as each one is generated
+function streamScenario(onFirstContent) {
+    return new Promise((resolve, reject) => {
+        const source = new EventSource(`http://127.0.0.1:5000/career-simulation/${currentUser.id}/stream`);
+        let started = false;
+
+        const start = () => {
+            if (!started) {
+                started = true;
+                onFirstContent();
+            }
+        };
+
+        currentScenario = { daily_schedule: [], emails: [], meetings: [] };
+
+        source.addEventListener('task', (event) => {
+            currentScenario.daily_schedule.push(JSON.parse(event.data));
+            loadTasks();
+            start();
+        });
+
+        source.addEventListener('email', (event) => {
+            currentScenario.emails.push(JSON.parse(event.data));
+        });
+
+        source.addEventListener('meeting', (event) => {
+            currentScenario.meetings.push(JSON.parse(event.data));
+        });
+
+        source.addEventListener('scenario', (event) => {
+            source.close();
+            currentScenario = JSON.parse(event.data);
+            loadTasks();
+            start();
+            resolve(currentScenario);
+        });
+
+        source.addEventListener('error', (event) => {
+            source.close();
+            let message = "Simülasyon yüklenemedi";
+            if (event.data) {
+                try {
+                    message = JSON.parse(event.data).message || message;
+                } catch (e) {}
+            }
+            reject(new Error(message));
+        });
+    });
+}
+
 // Show personality test warning
 function showPersonalityTestWarning() {
     const warningHtml = `
@@ -64,6 +64,9 @@ async function loadJobListings() {
 
     try {
         const params = new URLSearchParams({ title: userTitle, location: userLocation });
+        // Anonymous users are scored against their localStorage skills
+        if (user.id) params.append("user_id", user.id);
+        else userSkills.forEach(skill => params.append("skills", skill));
         const response = await fetch(`http://127.0.0.1:5000/api/jobs?${params.toString()}`);
         if (!response.ok) throw new Error(`API isteği başarısız: ${response.status}`);
 
@@ -82,11 +85,10 @@ async function loadJobListings() {
             const location = job.location_city || job.location_country || "Konum Belirtilmemiş";
             const url = job.url || "#";
 
-            let jobRequirements = (job.requirements || []).map(r => r.toLowerCase().trim());
-            let matchedSkills = jobRequirements.filter(skill => userSkillsSet.has(skill));
-            let missingSkills = jobRequirements.filter(skill => !userSkillsSet.has(skill));
-            let totalSkills = jobRequirements.length;
-            let matchPercentage = totalSkills > 0 ? Math.round((matchedSkills.length / totalSkills) * 100) : 0;
+            // Matching and ranking are computed by the backend (/api/jobs?user_id=... or &skills=...)
+            let matchedSkills = (job.matched_skills || []).map(r => r.toLowerCase().trim());
+            let missingSkills = (job.missing_skills || []).map(r => r.toLowerCase().trim());
+            let matchPercentage = job.match_percentage || 0;
 
 
             let skillsHTML = `
@@ -1,6 +1,7 @@
 
         let currentStep = 0;
         let learningData = null;
+        let learningStreaming = false;
         let userId = null;
         let isLoadingMissingSkills = false;
         let missingSkillsLoaded = false;
@@ -103,31 +104,92 @@
             currentStep = 0;
 
             try {
-                const response = await fetch('http://127.0.0.1:5000/generate-learning-module', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({ topic: skill })
-                });
-
-                const data = await response.json();
-
-                if (data.success) {
-                    learningData = data.data;
+                await streamLearningModule(skill, () => {
+                    loadingOverlay.style.display = 'none';
                     displayLearningModule();
-                } else {
-                    throw new Error(data.message || 'Eğitim modülü oluşturulamadı');
-                }
+                });
             } catch (error) {
                 console.error('Error generating learning module:', error);
                 alert('Eğitim modülü oluşturulurken hata oluştu: ' + error.message);
                 closeLearningModal();
             } finally {
+                learningStreaming = false;
                 loadingOverlay.style.display = 'none';
             }
         }
 
+        // Stream the module over SSE (POST, so fetch instead of EventSource): the first step is shown as soon as it is generated
+        async function streamLearningModule(skill, onFirstStep) {
+            const response = await fetch('http://127.0.0.1:5000/generate-learning-module/stream', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ topic: skill })
+            });
+            if (!response.ok || !response.body) {
+                throw new Error('Eğitim modülü oluşturulamadı');
+            }
+
+            learningData = { title: skill, description: '', steps: [], final_quiz: [] };
+            learningStreaming = true;
+            let started = false;
+
+            const handleEvent = (event, data) => {
+                if (event === 'step') {
+                    learningData.steps.push(data);
+                    if (!started) {
+                        started = true;
+                        onFirstStep();
+                    } else {
+                        createProgressIndicator();
+                        updateNavigationButtons();
+                    }
+                } else if (event === 'quiz') {
+                    learningData.final_quiz.push(data);
+                } else if (event === 'module') {
+                    learningStreaming = false;
+                    learningData = data;
+                    if (!started) {
+                        started = true;
+                        onFirstStep();
+                    } else {
+                        document.getElementById('learningTitle').textContent = learningData.title;
+                        document.getElementById('learningDescription').textContent = learningData.description;
+                        createProgressIndicator();
+                        updateNavigationButtons();
+                    }
+                } else if (event === 'error') {
+                    throw new Error(data.message || 'Eğitim modülü oluşturulamadı');
+                }
+            };
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+                    const block = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    let event = 'message';
+                    let data = '';
+                    block.split('\n').forEach(line => {
+                        if (line.startsWith('event:')) event = line.slice(6).trim();
+                        else if (line.startsWith('data:')) data += line.slice(5).trim();
+                    });
+                    if (data) handleEvent(event, JSON.parse(data));
+                }
+            }
+
+            if (learningStreaming) {
+                throw new Error('Eğitim modülü yarıda kesildi');
+            }
+        }
+
         // Display learning module
         function displayLearningModule() {
             if (!learningData) return;
@@ -458,6 +520,9 @@
 
         // Navigation functions
         function nextStep() {
+            if (learningStreaming && currentStep >= learningData.steps.length - 1) {
+                return;
+            }
             if (currentStep < learningData.steps.length - 1) {
                 currentStep++;
                 displayCurrentStep();
@@ -480,7 +545,9 @@
             prevBtn.style.display = currentStep > 0 ? 'inline-flex' : 'none';
             nextBtn.style.display = 'inline-flex';
             
-            if (currentStep === learningData.steps.length - 1) {
+            if (learningStreaming && currentStep === learningData.steps.length - 1) {
+                nextBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Sonraki Adım Hazırlanıyor';
+            } else if (currentStep === learningData.steps.length - 1) {
                 nextBtn.innerHTML = '<i class="fas fa-graduation-cap"></i> Final Testine Geç';
             } else {
                 nextBtn.innerHTML = 'Sonraki Adım <i class="fas fa-arrow-right"></i>';